@@ -26,9 +26,29 @@ except ImportError:
     can = None
 
 from . import describe
-from .describe import get_describer, J1939Filter
+from .describe import get_describer, DatabaseReloader, J1939Filter
+from .plugins import load_plugins
 from .parse import parse_j1939_id
 from .render import HighPerformanceRenderer, NUM_IN_PARENS_RE
+from .output import (
+    BufferedLineWriter,
+    ColorSink,
+    NdjsonSink,
+    OutputFrame,
+    PlainSink,
+    dumps_ndjson,
+    join_can_line,
+    DEFAULT_FLUSH_INTERVAL_MS,
+    DEFAULT_FLUSH_SIZE_KB,
+)
+from .stream import (
+    merge_by_timestamp,
+    ReorderBuffer,
+    BusReceiver,
+    BackgroundWriter,
+    DROP_POLICIES,
+    DEFAULT_QUEUE_SIZE,
+)
 
 
 class J1939Runner:
@@ -75,6 +95,7 @@ class J1939Runner:
             legacy_windows=False,
         )
 
+        load_plugins(getattr(cli_args, "decoders", None))
         self.describe_obj = get_describer(
             da_json=cli_args.da_json,
             describe_pgns=cli_args.pgn,
@@ -86,6 +107,10 @@ class J1939Runner:
             include_na=cli_args.include_na,
             include_raw_data=cli_args.include_raw_data,
             enable_isotp=cli_args.enable_isotp,
+            typed_values=getattr(cli_args, "typed_values", False),
+            db_cache=getattr(cli_args, "db_cache", True),
+            # frames dropped by --pgn/--sa/--da/--ca filters never need their SPNs decoded
+            lazy=bool(pgn_list or sa_list or da_list or ca_list),
         )
 
         self.renderer = HighPerformanceRenderer(
@@ -94,6 +119,12 @@ class J1939Runner:
             da_describer=self.describe_obj.da_describer,
         )
 
+        self.reloader = None
+        if getattr(cli_args, "watch_da_json", False):
+            self.reloader = DatabaseReloader(
+                self.describe_obj, on_reload=self._on_database_reload
+            )
+
         self.should_colorize = cli_args.color == "always" or (
             cli_args.color == "auto" and sys.stdout.isatty()
         )
@@ -113,15 +144,67 @@ class J1939Runner:
         # Generate J1939 CAN-level filters
         self.can_filters = self.filter.generate_can_filters(self.can_filters)
 
+        # live-capture pipeline stages, see _run_from_can_interface
+        self.receiver = None
+        self.writer = None
+
+        self.reorder_buffer = None
+        reorder_window = getattr(cli_args, "reorder_window", None)
+        reorder_frames = getattr(cli_args, "reorder_frames", None)
+        if reorder_window is not None or reorder_frames is not None:
+            self.reorder_buffer = ReorderBuffer(
+                window_ms=reorder_window, window_frames=reorder_frames
+            )
+
+        flush_interval_ms = getattr(
+            cli_args, "flush_interval", DEFAULT_FLUSH_INTERVAL_MS
+        )
+        flush_size_kb = getattr(cli_args, "flush_size", DEFAULT_FLUSH_SIZE_KB)
+        self.stdout_writer = BufferedLineWriter(
+            sys.stdout, flush_interval_ms=flush_interval_ms, flush_size_kb=flush_size_kb
+        )
+
         self.write_f = None
         if cli_args.write:
             try:
-                self.write_f = open(cli_args.write, "w")
+                self.write_f = BufferedLineWriter(
+                    open(cli_args.write, "wb"),
+                    flush_interval_ms=flush_interval_ms,
+                    flush_size_kb=flush_size_kb,
+                    close_stream=True,
+                )
             except Exception as e:
                 raise RuntimeError(
                     f"Error: Failed to open output file '{cli_args.write}': {e}"
                 )
 
+        # every frame is rendered into an OutputFrame once and emitted to each sink
+        self.ndjson = getattr(cli_args, "output", "json") == "ndjson"
+        self.sinks = self._make_sinks(cli_args)
+
+    def _make_sinks(self, cli_args):
+        if self.ndjson:
+            sinks = [NdjsonSink(self.stdout_writer)]
+            if self.write_f:
+                sinks.append(NdjsonSink(self.write_f))
+            return sinks
+
+        if not cli_args.candata:
+            console_can_line = None
+        elif cli_args.candata == "candump":
+            console_can_line = "candump"
+        else:
+            console_can_line = "raw"
+        if self.should_colorize:
+            sinks = [
+                ColorSink(self.stdout_writer, self.renderer, can_line=console_can_line)
+            ]
+        else:
+            sinks = [PlainSink(self.stdout_writer, can_line=console_can_line)]
+        if self.write_f:
+            sinks.append(PlainSink(self.write_f, can_line="candump"))
+        return sinks
+
     def render_description(
         self,
         description,
@@ -140,22 +223,10 @@ class J1939Runner:
                 k: v for k, v in description.items() if not k.startswith("_")
             }
             if indent:
-                json_str = json.dumps(filtered_desc, indent=4)
-                if can_line:
-                    spacer = (
-                        " " * (len(can_line) - 3) + " ; "
-                        if can_line.endswith(" ; ")
-                        else " " * len(can_line)
-                    )
-                    lines = json_str.splitlines()
-                    res = can_line + lines[0]
-                    for line in lines[1:]:
-                        res += "\n" + spacer + line
-                    return res
-                return json_str
+                json_str = json.dumps(filtered_desc, indent=4, default=str)
             else:
-                json_str = json.dumps(filtered_desc, separators=(",", ":"))
-                return (can_line + json_str) if can_line else json_str
+                json_str = json.dumps(filtered_desc, separators=(",", ":"), default=str)
+            return join_can_line(can_line, json_str, indent)
 
         return self.renderer.render(
             description, indent=indent, can_line=can_line, highlight=highlight
@@ -305,69 +376,95 @@ class J1939Runner:
         description,
         is_highlight,
     ):
-        can_prefix = None
-        if self.args.candata:
-            if self.args.candata == "candump":
-                prefix_content = f"({timestamp:17.6f}) {interface} {message_id.hex.upper()}#{message_data.hex.upper()}"
-            else:
-                prefix_content = candump_line.split(";", 1)[0].rstrip()
-
-            can_prefix = prefix_content.ljust(80) + " ; "
-
-        desc_line = self.render_description(
+        frame = OutputFrame(
+            timestamp,
+            interface,
+            message_id,
+            message_data,
+            candump_line,
             description,
             indent=self.args.format,
-            can_line=can_prefix,
             highlight=is_highlight,
         )
-        if len(desc_line) > 0:
-            print(desc_line, flush=True)
+        if self.writer is not None:
+            # render here, write on the writer thread
+            lines = [(sink.writer, sink.render(frame)) for sink in self.sinks]
+            self.writer.put(lines, received_at=self.receiver.last_received_at)
+        else:
+            for sink in self.sinks:
+                sink.emit(frame)
+
+    def _write_output(self, lines):
+        for writer, line in lines:
+            if line:
+                writer.write_line(line)
+
+    def _parse_message_item(self, message_item):
+        """Parses a candump line or can.Message into a frame tuple.
+
+        Frames already parsed upstream (e.g. by a timestamp merge of several logs) are
+        tuples and are returned unchanged.
+
+        Returns:
+            tuple: (timestamp, interface, message_id, message_data, candump_line), or None if
+            the item could not be parsed.
+        """
+        if type(message_item) is tuple:
+            return message_item
+        try:
+            if isinstance(message_item, str):
+                parsed_item = self._parse_candump_line(message_item)
+                if not parsed_item:
+                    return None
+                return (*parsed_item, message_item)
+            elif can and isinstance(message_item, can.Message):
+                return (*self._parse_can_message(message_item), str(message_item))
+        except (IndexError, ValueError):
+            if isinstance(message_item, str):
+                print("Warning: error in line '%s'" % message_item, file=sys.stderr)
+        return None
+
+    def _iter_parsed_frames(self, message_source):
+        for message_item in message_source:
+            frame = self._parse_message_item(message_item)
+            if frame is not None:
+                yield frame
 
-        if self.write_f:
-            prefix_f = (
-                f"({timestamp:17.6f}) {interface} {message_id.hex.upper()}#{message_data.hex.upper()}".ljust(
-                    80
-                )
-                + " ; "
-            )
-            desc_f = self.render_description(
-                description,
-                indent=self.args.format,
-                can_line=prefix_f,
-                force_colorize=False,
-                highlight=is_highlight,
-            )
-            if len(desc_f) > 0:
-                self.write_f.write(desc_f + "\n")
-                self.write_f.flush()
+    def _reorder(self, message_source):
+        if self.reorder_buffer is None:
+            return message_source
+        return self.reorder_buffer.reorder(self._iter_parsed_frames(message_source))
 
     def process_messages(self, message_source, filters=None):
-        for message_item in message_source:
-            try:
-                if isinstance(message_item, str):
-                    parsed_item = self._parse_candump_line(message_item)
-                    if not parsed_item:
-                        continue
-                    timestamp, interface, message_id, message_data = parsed_item
-                    candump_line = message_item
-                elif can and isinstance(message_item, can.Message):
-                    timestamp, interface, message_id, message_data = (
-                        self._parse_can_message(message_item)
-                    )
-                    candump_line = str(message_item)
-                else:
-                    continue
-            except (IndexError, ValueError):
-                if isinstance(message_item, str):
-                    print("Warning: error in line '%s'" % message_item, file=sys.stderr)
+        try:
+            self._process_messages(message_source, filters)
+        finally:
+            # everything decoded so far is out once the source is exhausted or interrupted
+            if self.writer is None:
+                self._flush_output()
+
+    def _on_database_reload(self, da_describer):
+        self.renderer.da_describer = da_describer
+
+    def _process_messages(self, message_source, filters):
+        reloader = self.reloader
+        for message_item in self._reorder(message_source):
+            # a database rebuilt by --watch-da-json is swapped in between frames
+            if reloader is not None and reloader.pending is not None:
+                reloader.apply()
+            frame = self._parse_message_item(message_item)
+            if frame is None:
                 continue
+            timestamp, interface, message_id, message_data, candump_line = frame
 
             message_id_uint = message_id.uint
 
             if not self._matches_can_filters(message_id_uint, filters):
                 continue
 
-            description = self.describe_obj(message_data, message_id_uint)
+            description = self.describe_obj(
+                message_data, message_id_uint, interface=interface
+            )
             if not description:
                 continue
 
@@ -405,13 +502,16 @@ class J1939Runner:
         rendered_summary = self.renderer.render_summary(
             summary_data, indent=self.args.format
         )
-        if rendered_summary:
+        if rendered_summary and self.ndjson:
+            # keep stdout (and the --write file) parseable as one JSON object per line
+            print(rendered_summary, file=sys.stderr)
+        elif rendered_summary:
             if self.args.candata:
                 rendered_summary = "\n".join(
                     f"; {line}" for line in rendered_summary.splitlines()
                 )
 
-            print(rendered_summary, file=sys.stdout)
+            self.stdout_writer.write_line(rendered_summary)
             if self.write_f:
                 f_summary = rendered_summary
                 if self.should_colorize:
@@ -425,7 +525,7 @@ class J1939Runner:
                         f"; {line}" for line in f_summary.splitlines()
                     )
 
-                self.write_f.write(f_summary + "\n")
+                self.write_f.write_line(f_summary)
 
     def _run_from_can_interface(self):
         if can is None:
@@ -446,8 +546,26 @@ class J1939Runner:
                 bus_kwargs["can_filters"] = self.can_filters
 
             bus = can.Bus(**bus_kwargs)
-            print(f"Connected to {bus.__class__.__name__}: {bus.channel_info}")
-            self.process_messages(bus, self.can_filters)
+            connected = f"Connected to {bus.__class__.__name__}: {bus.channel_info}"
+            if self.ndjson:
+                print(connected, file=sys.stderr)
+            else:
+                self.stdout_writer.write_line(connected)
+                self.stdout_writer.flush()
+
+            # receive -> decode -> write run on separate threads joined by bounded queues so
+            # that a slow terminal can't back up the socket receive buffer; only the receive
+            # stage drops frames, the output queue blocks so no decoded line is lost
+            queue_size = getattr(self.args, "queue_size", DEFAULT_QUEUE_SIZE)
+            drop_policy = getattr(self.args, "drop_policy", "drop-oldest")
+            self.receiver = BusReceiver(
+                bus, maxsize=queue_size, drop_policy=drop_policy
+            ).start()
+            self.writer = BackgroundWriter(self._write_output, maxsize=queue_size)
+            try:
+                self.process_messages(self.receiver, self.can_filters)
+            finally:
+                self._stop_pipeline()
         except can.CanError as e:
             err_msg = f"CAN error: {e}"
             if "Unknown interface" in str(e):
@@ -461,27 +579,67 @@ class J1939Runner:
                 except Exception as e:
                     logger.warning(f"Failed to shutdown bus cleanly: {e}")
 
+    def _open_candump(self, candump):
+        if candump == "-":
+            return sys.stdin
+        try:
+            return open(candump, "r")
+        except FileNotFoundError:
+            raise RuntimeError(f"Error: file '{candump}' not found")
+
+    def _flush_output(self):
+        self.stdout_writer.flush()
+        if self.write_f:
+            self.write_f.flush()
+
+    def _stop_pipeline(self):
+        self.receiver.stop()
+        writer, self.writer = self.writer, None
+        writer.close()
+        self._flush_output()
+
+        latency_ms = writer.latency_avg * 1000.0
+        print(
+            f"Pipeline: {self.receiver.received} frames received, "
+            f"{self.receiver.queue.dropped} dropped at receive "
+            f"(max queue depth {self.receiver.queue.max_depth}), "
+            f"output max queue depth {writer.queue.max_depth}, "
+            f"latency avg {latency_ms:.3f} ms max {writer.latency_max * 1000.0:.3f} ms",
+            file=sys.stderr,
+        )
+
     def _run_from_candump(self):
-        candump_file = None
-        if self.args.candump == "-":
-            candump_file = sys.stdin
-        elif self.args.candump:
-            try:
-                candump_file = open(self.args.candump, "r")
-            except FileNotFoundError:
-                raise RuntimeError(f"Error: file '{self.args.candump}' not found")
-        else:
+        candumps = self.args.candump
+        if isinstance(candumps, str):
+            candumps = [candumps]
+        if not candumps:
             raise ValueError(
                 "Error: must specify either a log file or an interface (-i)"
             )
+        if candumps.count("-") > 1:
+            raise ValueError("Error: stdin ('-') can only be given once")
 
+        candump_files = []
         try:
-            self.process_messages(candump_file, self.can_filters)
+            for candump in candumps:
+                candump_files.append(self._open_candump(candump))
+
+            if len(candump_files) == 1:
+                message_source = candump_files[0]
+            else:
+                # One decoded stream (and one summary) for several per-bus captures
+                message_source = merge_by_timestamp(
+                    *(self._iter_parsed_frames(f) for f in candump_files)
+                )
+            self.process_messages(message_source, self.can_filters)
         finally:
-            if candump_file is not None and candump_file is not sys.stdin:
-                candump_file.close()
+            for candump_file in candump_files:
+                if candump_file is not sys.stdin:
+                    candump_file.close()
 
     def run(self):
+        if self.reloader is not None:
+            self.reloader.start()
         try:
             if self.args.interface:
                 self._run_from_can_interface()
@@ -490,24 +648,39 @@ class J1939Runner:
         except KeyboardInterrupt:
             raise
         finally:
+            if self.reloader is not None:
+                self.reloader.stop()
             final_descriptions = self.describe_obj.cleanup()
             for desc in final_descriptions:
+                if self.ndjson:
+                    # incomplete transport sessions have no frame of their own
+                    self.stdout_writer.write_line(dumps_ndjson({"fields": desc}))
+                    continue
                 desc_line = self.render_description(desc, indent=self.args.format)
                 if len(desc_line) > 0:
-                    print(desc_line, flush=True)
+                    self.stdout_writer.write_line(desc_line)
 
             self.print_summary()
+            self.stdout_writer.close()
             if self.write_f:
                 self.write_f.close()
+            if self.reorder_buffer is not None:
+                print(
+                    f"Reorder buffer: {self.reorder_buffer.reordered} frames reordered, "
+                    f"{self.reorder_buffer.late} late, "
+                    f"max depth {self.reorder_buffer.max_depth}",
+                    file=sys.stderr,
+                )
 
 
 def _add_input_options(parser):
     input_group = parser.add_argument_group("Input and Interface Options")
     input_group.add_argument(
         "candump",
-        nargs="?",
-        default=None,
-        help="candump log, use - for stdin. (optional if -i is used)",
+        nargs="*",
+        default=[],
+        help="candump log(s), use - for stdin. Several logs are merged in timestamp order. "
+        "(optional if -i is used)",
     )
     input_group.add_argument(
         "-i",
@@ -526,6 +699,33 @@ def _add_input_options(parser):
         type=int,
         help="Bitrate to use for the python-can interface",
     )
+    input_group.add_argument(
+        "--queue-size",
+        type=int,
+        default=DEFAULT_QUEUE_SIZE,
+        help="frames buffered between the receive, decode and output threads of a live "
+        "capture (default: %(default)s)",
+    )
+    input_group.add_argument(
+        "--drop-policy",
+        choices=DROP_POLICIES,
+        default="drop-oldest",
+        help="what to do when the live-capture receive queue is full; the output queue "
+        "always blocks (default: %(default)s)",
+    )
+    input_group.add_argument(
+        "--reorder-window",
+        type=float,
+        metavar="MS",
+        help="re-sequence frames with timestamp inversions of up to MS milliseconds "
+        "before decoding",
+    )
+    input_group.add_argument(
+        "--reorder-frames",
+        type=int,
+        metavar="N",
+        help="re-sequence frames that arrive up to N frames out of timestamp order",
+    )
 
 
 def _add_filter_options(parser):
@@ -590,8 +790,31 @@ def _add_database_options(parser):
     da_group.add_argument(
         "--da-json",
         type=str,
-        default=describe.DEFAULT_DA_JSON,
-        help='absolute path to the input JSON DA (default: "%(default)s")',
+        action="append",
+        default=None,
+        help="absolute path to the input JSON DA; repeat to layer OEM or fleet overlays "
+        "over it, later files taking precedence for PGNs and SPNs "
+        f'(default: "{describe.DEFAULT_DA_JSON}")',
+    )
+    da_group.add_argument(
+        "--no-db-cache",
+        dest="db_cache",
+        action="store_false",
+        help="always parse the JSON DA instead of loading its compiled cache "
+        "(~/.cache/pretty_j1939)",
+    )
+    da_group.add_argument(
+        "--watch-da-json",
+        action="store_true",
+        help="reload the --da-json file when it changes, keeping transport sessions and "
+        "claimed NAMEs (for long-running live sessions)",
+    )
+    da_group.add_argument(
+        "--decoders",
+        type=str,
+        default=None,
+        help="JSON file of plugin decoders for proprietary PGNs, in addition to the "
+        "installed pretty_j1939.decoders plugins",
     )
 
 
@@ -705,11 +928,41 @@ def _add_output_options(parser):
     output_group.add_argument("--no-candata", dest="candata", action="store_false")
     parser.set_defaults(candata=False)
 
+    output_group.add_argument(
+        "--output",
+        choices=["json", "ndjson"],
+        default="json",
+        help="output format: 'json' pretty-prints each description (optionally after the "
+        "CAN line), 'ndjson' writes one JSON object per frame with timestamp, interface, "
+        "id, data and the decoded fields (default: %(default)s)",
+    )
+    output_group.add_argument(
+        "--typed-values",
+        action="store_true",
+        help="decode numeric SPNs as structured values; with --output ndjson they are "
+        'written as {"value", "units", "raw", "indicator", "label"} objects instead of text',
+    )
     output_group.add_argument(
         "-w",
         "--write",
         help="Write plain-text output to file (uses --candata=candump)",
     )
+    output_group.add_argument(
+        "--flush-interval",
+        type=float,
+        default=DEFAULT_FLUSH_INTERVAL_MS,
+        metavar="MS",
+        help="when not writing to a terminal, flush buffered output at least every MS "
+        "milliseconds (default: %(default)s)",
+    )
+    output_group.add_argument(
+        "--flush-size",
+        type=float,
+        default=DEFAULT_FLUSH_SIZE_KB,
+        metavar="KB",
+        help="when not writing to a terminal, flush buffered output once KB kilobytes "
+        "are pending (default: %(default)s)",
+    )
 
 
 def get_parser():
@@ -0,0 +1,194 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+
+import asyncio
+
+try:
+    import can
+except ImportError:
+    can = None
+
+from .describe import get_describer
+from .stream import DEFAULT_QUEUE_SIZE
+
+__all__ = ["describe_frames", "describe_bus"]
+
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_MAX_PENDING = 1024
+
+_END = object()
+
+_BUS_DROP_POLICIES = ("drop-oldest", "drop-newest")
+
+
+def _describe_frame(describer, frame):
+    if can is not None and isinstance(frame, can.Message):
+        return describer(frame.data, frame.arbitration_id, interface=frame.channel)
+    return describer(*frame)
+
+
+def _describe_batch(describer, batch):
+    descriptions = []
+    for frame in batch:
+        description = _describe_frame(describer, frame)
+        if description:
+            descriptions.append(description)
+    return descriptions
+
+
+async def _pump(frames, pending):
+    try:
+        async for frame in frames:
+            # blocks while the consumer is behind, so the source is not read ahead unbounded
+            await pending.put(frame)
+    except Exception:
+        # wake the consumer, which re-raises the error when it awaits this task
+        await pending.put(_END)
+        raise
+    await pending.put(_END)
+
+
+async def describe_frames(
+    frames,
+    describer=None,
+    batch_size=DEFAULT_BATCH_SIZE,
+    max_pending=DEFAULT_MAX_PENDING,
+    executor=None,
+):
+    """Asynchronously decodes a stream of CAN frames into J1939 descriptions.
+
+    Frames are read ahead into a queue of at most `max_pending` entries; a consumer that stops
+    iterating stops the source from being read further. Whatever frames are already queued
+    (up to `batch_size`) are decoded together, either inline on the event loop or, when an
+    `executor` is given, off the loop in one `run_in_executor` call per batch.
+
+    Args:
+        frames: An async iterable of `can.Message` objects or `(message_data, message_id)` /
+            `(message_data, message_id, interface)` tuples.
+        describer (J1939Describer, optional): The describer to use. Defaults to
+            `get_describer()`.
+        batch_size (int, optional): Maximum number of frames decoded per batch.
+        max_pending (int, optional): Maximum number of frames read ahead of the consumer.
+        executor (concurrent.futures.Executor, optional): Executor to decode batches in.
+
+    Yields:
+        OrderedDict: The description of each frame that produced one.
+    """
+    if describer is None:
+        describer = get_describer()
+    if batch_size < 1:
+        raise ValueError("Error: batch_size must be at least 1")
+
+    loop = asyncio.get_running_loop()
+    pending = asyncio.Queue(maxsize=max_pending)
+    pump = asyncio.ensure_future(_pump(frames, pending))
+    try:
+        finished = False
+        while not finished:
+            batch = [await pending.get()]
+            while len(batch) < batch_size and not pending.empty():
+                batch.append(pending.get_nowait())
+            if batch[-1] is _END:
+                batch.pop()
+                finished = True
+
+            if executor is None:
+                descriptions = _describe_batch(describer, batch)
+            else:
+                descriptions = await loop.run_in_executor(
+                    executor, _describe_batch, describer, batch
+                )
+            for description in descriptions:
+                yield description
+
+            if not finished:
+                # let other tasks run between batches even when frames keep coming
+                await asyncio.sleep(0)
+        # surface errors raised by the source iterator
+        await pump
+    finally:
+        if not pump.done():
+            pump.cancel()
+            try:
+                await pump
+            except asyncio.CancelledError:
+                pass
+
+
+class _BoundedBusReader(can.Listener if can is not None else object):
+    """An async iterable of the frames a `can.Notifier` receives, buffered up to `maxsize`.
+
+    Unlike `can.AsyncBufferedReader`, whose queue is unbounded, frames arriving while the
+    buffer is full are dropped according to `drop_policy`, as `BusReceiver` does. The
+    notifier can't be made to wait for the consumer, so there is no "block" policy.
+    """
+
+    def __init__(self, maxsize=DEFAULT_QUEUE_SIZE, drop_policy="drop-oldest"):
+        if drop_policy not in _BUS_DROP_POLICIES:
+            raise ValueError(
+                f"Error: unknown drop policy '{drop_policy}' "
+                f"(expected one of {', '.join(_BUS_DROP_POLICIES)})"
+            )
+        self.buffer = asyncio.Queue(maxsize=maxsize)
+        self.drop_policy = drop_policy
+        self.dropped = 0
+        self._is_stopped = False
+
+    def on_message_received(self, msg):
+        # the notifier calls this on the event loop it was given
+        if self._is_stopped:
+            return
+        buffer = self.buffer
+        if buffer.full():
+            self.dropped += 1
+            if self.drop_policy == "drop-newest":
+                return
+            buffer.get_nowait()
+        buffer.put_nowait(msg)
+
+    def stop(self):
+        self._is_stopped = True
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self.buffer.get()
+
+
+async def describe_bus(
+    bus,
+    describer=None,
+    max_buffered=DEFAULT_QUEUE_SIZE,
+    drop_policy="drop-oldest",
+    **kwargs,
+):
+    """Asynchronously decodes the frames received on a python-can bus.
+
+    The bus is read by a `can.Notifier` on the running event loop; no dedicated thread per bus
+    is needed. At most `max_buffered` received frames wait for the consumer; when it falls
+    further behind, frames are dropped according to `drop_policy` ("drop-oldest" or
+    "drop-newest"). See `describe_frames` for the other keyword arguments.
+
+    Args:
+        bus (can.BusABC): The bus to read from.
+        describer (J1939Describer, optional): The describer to use.
+        max_buffered (int, optional): Maximum number of received frames held for the consumer.
+        drop_policy (str, optional): Which frames to drop when the buffer is full.
+
+    Yields:
+        OrderedDict: The description of each frame that produced one.
+    """
+    if can is None:
+        raise RuntimeError("Error: 'python-can' is not installed")
+
+    loop = asyncio.get_running_loop()
+    reader = _BoundedBusReader(max_buffered, drop_policy)
+    notifier = can.Notifier(bus, [reader], loop=loop)
+    try:
+        async for description in describe_frames(reader, describer, **kwargs):
+            yield description
+    finally:
+        notifier.stop()
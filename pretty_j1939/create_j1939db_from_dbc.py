@@ -0,0 +1,338 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+from collections import OrderedDict
+import argparse
+import itertools
+import json
+import re
+import sys
+
+import unidecode
+
+from . import describe
+from .parse import parse_j1939_id
+
+__all__ = ["FIRST_DBC_SPN", "DbcConverter"]
+
+# SPN numbers given to signals without an "SPN" attribute start above the 19-bit J1939 range
+FIRST_DBC_SPN = 1 << 19
+
+EXTENDED_ID_FLAG = 0x80000000
+
+_STRING = r'"((?:[^"\\]|\\.)*)"'
+BO_RE = re.compile(r"BO_\s+(\d+)\s+(\w+)\s*:\s*(\d+)\s+(\w+)")
+SG_RE = re.compile(
+    r"SG_\s+(\w+)\s*(M|m\d+M?)?\s*:\s*(\d+)\|(\d+)@([01])([+-])\s*"
+    r"\(\s*([^,\s]+)\s*,\s*([^)\s]+)\s*\)\s*"
+    r"\[\s*([^|\s]*)\s*\|\s*([^\]\s]*)\s*\]\s*" + _STRING
+)
+VAL_RE = re.compile(r"VAL_\s+(\d+)\s+(\w+)\s+(.*);", re.DOTALL)
+VAL_ENTRY_RE = re.compile(r"(-?\d+)\s+" + _STRING)
+BA_SPN_RE = re.compile(r'BA_\s+"SPN"\s+SG_\s+(\d+)\s+(\w+)\s+(\d+)\s*;')
+BA_CYCLE_RE = re.compile(r'BA_\s+"GenMsgCycleTime"\s+BO_\s+(\d+)\s+(\d+)\s*;')
+CM_BO_RE = re.compile(r"CM_\s+BO_\s+(\d+)\s+" + _STRING + r"\s*;", re.DOTALL)
+
+# statements that end with a ';' and may span several lines
+MULTILINE_KEYWORDS = (
+    "CM_ ",
+    "VAL_ ",
+    "BA_ ",
+    "BA_DEF_ ",
+    "BA_DEF_DEF_ ",
+    "VAL_TABLE_ ",
+)
+
+
+def _number(text):
+    value = float(text)
+    return int(value) if value.is_integer() else value
+
+
+def _motorola_start_bits(start, length):
+    """Returns the J1939 start bits of a big-endian DBC signal, or None if it can't be read.
+
+    The decoder reads fields least significant bit first, and a field with two start bits
+    as two equal halves (see get_spn_cut_bytes), so a big-endian signal is supported if it
+    lies within one byte or is split evenly over two.
+    """
+    segments = []  # bit positions per byte, most significant byte first
+    position = start
+    for _ in range(length):
+        if not segments or segments[-1][0] != position // 8:
+            segments.append((position // 8, []))
+        segments[-1][1].append(position)
+        # the next lower bit is bit 7 of the next byte after bit 0 of this one
+        position = position + 15 if position % 8 == 0 else position - 1
+    if len(segments) == 1:
+        return [min(segments[0][1])]
+    if len(segments) == 2:
+        high, low = segments[0][1], segments[1][1]
+        if len(low) == length // 2 and len(high) == length - length // 2:
+            return [min(low), min(high)]
+    return None
+
+
+class DbcConverter:
+    """Converts DBC message and signal definitions into the J1939db JSON schema.
+
+    Extended-ID messages become J1939PGNdb records keyed by the PGN of their ID, their
+    signals J1939SPNdb records and their value tables J1939BitDecodings. Signals are
+    numbered by their "SPN" attribute (as in J1939 DBC files) or, without one, from
+    FIRST_DBC_SPN on. Files are read line by line and only the converted records are kept.
+    """
+
+    def __init__(self, dbc_list, first_spn=FIRST_DBC_SPN):
+        """
+        Args:
+            dbc_list (iterable): Paths of the DBC files.
+            first_spn (int): First SPN number given to signals without an "SPN" attribute.
+        """
+        self.dbc_list = list(dbc_list)
+        self.first_spn = first_spn
+        self.messages = OrderedDict()  # {message id: [name, dlc, [signal, ...]]}
+        self.spn_attributes = {}  # {(message id, signal name): SPN}
+        self.value_tables = {}  # {(message id, signal name): {value: description}}
+        self.cycle_times = {}  # {message id: ms}
+        self.comments = {}  # {message id: comment}
+        self.warnings = OrderedDict()  # {what: count}
+
+    def _warn(self, what):
+        self.warnings[what] = self.warnings.get(what, 0) + 1
+
+    @staticmethod
+    def statements(lines):
+        """Yields the statements of DBC `lines`, joining those spanning several lines."""
+        pending = None
+        for line in lines:
+            if pending is not None:
+                pending += "\n" + line.rstrip()
+            else:
+                stripped = line.strip()
+                if not stripped.startswith(MULTILINE_KEYWORDS):
+                    if stripped:
+                        yield stripped
+                    continue
+                pending = stripped
+            # complete once it ends with a ';' outside of a string
+            if pending.endswith(";") and pending.replace('\\"', "").count('"') % 2 == 0:
+                yield pending
+                pending = None
+        if pending is not None:
+            yield pending
+
+    def parse(self, lines):
+        """Reads the definitions of one DBC file, given as an iterable of lines."""
+        message = None
+        for statement in self.statements(lines):
+            keyword = statement.split(None, 1)[0]
+            if keyword == "BO_":
+                match = BO_RE.match(statement)
+                message = None
+                if match is None:
+                    continue
+                message_id = int(match.group(1))
+                if not message_id & EXTENDED_ID_FLAG:
+                    self._warn("standard-ID messages skipped")
+                    continue
+                message = [match.group(2), int(match.group(3)), []]
+                if message_id in self.messages:
+                    self._warn("messages defined twice skipped")
+                    message = None
+                    continue
+                self.messages[message_id] = message
+            elif keyword == "SG_":
+                if message is None:
+                    continue
+                match = SG_RE.match(statement)
+                if match is None:
+                    self._warn("unreadable signal definitions skipped")
+                    continue
+                if match.group(2) is not None and match.group(2).startswith("m"):
+                    self._warn("multiplexed signals skipped")
+                    continue
+                message[2].append(match.groups())
+            elif keyword == "VAL_":
+                match = VAL_RE.match(statement)
+                if match is not None:
+                    key = (int(match.group(1)), match.group(2))
+                    self.value_tables[key] = OrderedDict(
+                        (str(int(value)), unidecode.unidecode(text).strip())
+                        for value, text in VAL_ENTRY_RE.findall(match.group(3))
+                    )
+            elif keyword == "BA_":
+                match = BA_SPN_RE.match(statement)
+                if match is not None:
+                    key = (int(match.group(1)), match.group(2))
+                    self.spn_attributes[key] = int(match.group(3))
+                    continue
+                match = BA_CYCLE_RE.match(statement)
+                if match is not None:
+                    self.cycle_times[int(match.group(1))] = int(match.group(2))
+            elif keyword == "CM_":
+                match = CM_BO_RE.match(statement)
+                if match is not None:
+                    comment = " ".join(match.group(2).split())
+                    self.comments[int(match.group(1))] = unidecode.unidecode(comment)
+
+    def _spn_object(self, signal, units, value_table):
+        _, _, _, length, _, _, scale, offset, low, high, _ = signal
+        length = int(length)
+        scale, offset = _number(scale), _number(offset)
+        low, high = _number(low or 0), _number(high or 0)
+        if low == high:  # no range given, use what the field can hold
+            ends = (offset, (2**length - 1) * scale + offset)
+            low, high = min(ends), max(ends)
+        spn_object = OrderedDict()
+        spn_object["DataRange"] = f"{low} to {high} {units}".strip()
+        spn_object["Name"] = unidecode.unidecode(signal[0])
+        spn_object["Offset"] = offset
+        spn_object["OperationalHigh"] = high
+        spn_object["OperationalLow"] = low
+        spn_object["OperationalRange"] = ""
+        spn_object["Resolution"] = scale
+        spn_object["SPNLength"] = length
+        if value_table and scale == 1 and offset == 0:
+            spn_object["Units"] = "bit"
+        else:
+            # DBC signals are numbers even without units
+            spn_object["Units"] = units or "count"
+        return spn_object
+
+    def build(self):
+        """Returns the J1939db JSON of the definitions read so far."""
+        pgn_db = OrderedDict()
+        spn_db = OrderedDict()
+        bit_decodings = OrderedDict()
+        used_spns = set(self.spn_attributes.values())
+        next_spn = itertools.count(self.first_spn)
+
+        for message_id, (name, dlc, signals) in self.messages.items():
+            pgn, _, _ = parse_j1939_id(message_id & ~EXTENDED_ID_FLAG)
+            if str(pgn) in pgn_db:
+                self._warn("messages with an already converted PGN skipped")
+                continue
+            spns, start_bits = [], []
+            for signal in signals:
+                start, length, little_endian = int(signal[2]), int(signal[3]), signal[4]
+                if signal[5] == "-":
+                    # SPNs are decoded as unsigned; a two's complement field would show
+                    # wrong values rather than none
+                    self._warn("signed signals skipped")
+                    continue
+                if little_endian == "1":
+                    starts = [start]
+                else:
+                    starts = _motorola_start_bits(start, length)
+                    if starts is None:
+                        self._warn(
+                            "big-endian signals with an unsupported layout skipped"
+                        )
+                        continue
+                key = (message_id, signal[0])
+                spn = self.spn_attributes.get(key)
+                if spn is None:
+                    spn = next(next_spn)
+                    while spn in used_spns:
+                        spn = next(next_spn)
+                used_spns.add(spn)
+                units = unidecode.unidecode(signal[10]).strip()
+                value_table = self.value_tables.get(key)
+                spn_db[str(spn)] = self._spn_object(signal, units, value_table)
+                if value_table:
+                    bit_decodings[str(spn)] = value_table
+                spns.append(spn)
+                start_bits.append(starts)
+
+            pgn_object = OrderedDict()
+            pgn_object["Label"] = name
+            pgn_object["Name"] = self.comments.get(message_id, name)
+            pgn_object["PGNLength"] = str(dlc)
+            cycle_time = self.cycle_times.get(message_id)
+            pgn_object["Rate"] = f"{cycle_time} ms" if cycle_time else ""
+            pgn_object["SPNs"] = spns
+            if spns:
+                pgn_object["SPNStartBits"] = start_bits
+            pgn_db[str(pgn)] = pgn_object
+
+        j1939db = OrderedDict()
+        j1939db["J1939PGNdb"] = pgn_db
+        j1939db["J1939SPNdb"] = spn_db
+        j1939db["J1939BitDecodings"] = bit_decodings
+        return j1939db
+
+    def convert(self, output_file, base_json=None):
+        """Converts the DBC files and writes the J1939db JSON to `output_file` ('-': stdout).
+
+        Args:
+            output_file (str): Where to write the JSON.
+            base_json (str): A J1939db JSON file (e.g. converted from the Digital Annex) to
+                merge the DBC definitions into; they take precedence. Without it, only the
+                DBC definitions are written.
+        """
+        for dbc in self.dbc_list:
+            with open(dbc, "r", encoding="cp1252", errors="replace") as f:
+                self.parse(f)
+        j1939db = self.build()
+        for what, count in self.warnings.items():
+            print(f"Warning: {count} {what}", file=sys.stderr)
+        if base_json is not None:
+            with open(base_json, "r") as f:
+                j1939db = describe.merge_j1939db(json.load(f), j1939db)
+
+        out = open(output_file, "w") if output_file != "-" else sys.stdout
+        try:
+            # written as it is encoded, a multi-MB DBC makes a JSON many times its size
+            json.dump(j1939db, out, indent=2, sort_keys=False)
+        except BrokenPipeError:
+            pass
+        if out is not sys.stdout:
+            out.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="convert DBC message and signal definitions to J1939db JSON"
+    )
+    parser.add_argument(
+        "-f",
+        "--dbc",
+        type=str,
+        required=True,
+        action="append",
+        default=[],
+        nargs="+",
+        help="the .dbc file(s) used as input",
+    )
+    parser.add_argument(
+        "-w",
+        "--write-json",
+        type=str,
+        default="-",
+        help="where to write the output. defaults to stdout",
+    )
+    parser.add_argument(
+        "--base",
+        type=str,
+        default=None,
+        help="J1939db JSON to merge the DBC definitions into (they take precedence); "
+        "without it only the DBC definitions are written",
+    )
+    parser.add_argument(
+        "--first-spn",
+        type=int,
+        default=FIRST_DBC_SPN,
+        help="first SPN number for signals without an SPN attribute "
+        "(default: %(default)s)",
+    )
+    args = parser.parse_args()
+
+    all_inputs = itertools.chain(*args.dbc)
+    DbcConverter(all_inputs, first_spn=args.first_spn).convert(
+        args.write_json, base_json=args.base
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+
+import bisect
+import hashlib
+import json
+import logging
+import mmap
+import os
+import pickle
+import sys
+import tempfile
+from array import array
+from collections.abc import Mapping
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "CACHE_VERSION",
+    "get_default_cache_dir",
+    "get_cache_path",
+    "LazyRecordTable",
+    "load_compiled_json",
+]
+
+# Bump whenever the layout of the compiled objects changes, so stale caches are rebuilt.
+CACHE_VERSION = 4
+
+_MISSING = object()
+
+
+def get_default_cache_dir():
+    """Returns the per-user cache directory for compiled databases."""
+    if sys.platform == "win32":
+        cache_dir = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_dir, "pretty_j1939")
+
+
+def _layer_paths(json_path):
+    # a single path, or a sequence of paths (layers) merged into one database
+    if isinstance(json_path, (str, os.PathLike)):
+        return [json_path], False
+    return list(json_path), True
+
+
+def get_cache_path(json_path, cache_dir=None):
+    """Returns the cache file used for the JSON database at `json_path`.
+
+    Caches are named after the database file and a hash of its absolute path, so several
+    databases with the same file name don't evict each other. A sequence of paths (layered
+    databases) gets one cache per stack, named after its first file and the number of layers
+    over it.
+    """
+    if cache_dir is None:
+        cache_dir = get_default_cache_dir()
+    paths, _ = _layer_paths(json_path)
+    abs_paths = [os.path.abspath(path) for path in paths]
+    path_hash = hashlib.sha1("\0".join(abs_paths).encode("utf-8")).hexdigest()[:16]
+    name = os.path.splitext(os.path.basename(abs_paths[0]))[0]
+    if len(abs_paths) > 1:
+        name += f"+{len(abs_paths) - 1}"
+    return os.path.join(cache_dir, f"{name}-{path_hash}.pickle")
+
+
+class LazyRecordTable(Mapping):
+    """Read-only int-keyed table whose records are unpickled from the cache on first use.
+
+    Only the sorted keys and the record offsets are held in memory (16 bytes per record);
+    records are read from a memory-mapped cache file and kept once decoded, so memory use
+    follows the records actually looked up rather than the size of the database. Processes
+    mapping the same cache file share its pages.
+
+    A table pickles as a reference to its cache file, which is mapped again when unpickled,
+    so it can be sent to worker processes without copying the records.
+    """
+
+    __slots__ = ("_mm", "_base", "_keys", "_offsets", "_records", "_source")
+
+    def __init__(self, mm, base, keys, offsets, source=None):
+        self._mm = mm
+        self._base = base
+        self._keys = keys
+        self._offsets = offsets
+        self._records = {}
+        self._source = source  # (cache path, size, mtime_ns), for pickling
+
+    def __reduce__(self):
+        if self._source is None:
+            raise TypeError("LazyRecordTable without a cache file can't be pickled")
+        return (
+            _attach_table,
+            (self._source, self._base, self._keys.tobytes(), self._offsets.tobytes()),
+        )
+
+    def _load(self, key):
+        keys = self._keys
+        i = bisect.bisect_left(keys, key)
+        if i == len(keys) or keys[i] != key:
+            record = _MISSING
+        else:
+            start = self._base + self._offsets[i]
+            record = pickle.loads(self._mm[start : self._base + self._offsets[i + 1]])
+        self._records[key] = record  # misses too, unknown PGNs are looked up per frame
+        return record
+
+    def scan(self):
+        """Yields every (key, record) pair without keeping the records that weren't loaded."""
+        records, mm, base, offsets = self._records, self._mm, self._base, self._offsets
+        for i, key in enumerate(self._keys):
+            record = records.get(key, _MISSING)
+            if record is _MISSING:
+                record = pickle.loads(mm[base + offsets[i] : base + offsets[i + 1]])
+            yield key, record
+
+    def get(self, key, default=None):
+        record = self._records.get(key, _MISSING)
+        if record is _MISSING:
+            if key in self._records or not isinstance(key, int):
+                return default
+            record = self._load(key)
+            if record is _MISSING:
+                return default
+        return record
+
+    def __getitem__(self, key):
+        record = self.get(key, _MISSING)
+        if record is _MISSING:
+            raise KeyError(key)
+        return record
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __repr__(self):
+        return f"<LazyRecordTable {len(self)} records, {len(self._records)} loaded>"
+
+
+def _attach_table(source, base, key_bytes, offset_bytes):
+    path, size, mtime_ns = source
+    with open(path, "rb") as cache_file:
+        stat = os.fstat(cache_file.fileno())
+        if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+            raise RuntimeError(
+                f"Error: database cache {path} changed since it was pickled"
+            )
+        mm = mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_READ)
+    keys, offsets = array("q"), array("q")
+    keys.frombytes(key_bytes)
+    offsets.frombytes(offset_bytes)
+    return LazyRecordTable(mm, base, keys, offsets, source)
+
+
+def _read_header(cache_file):
+    header = pickle.load(cache_file)
+    if not isinstance(header, dict) or header.get("version") != CACHE_VERSION:
+        return None
+    return header
+
+
+def _read_compiled(cache_file):
+    body = pickle.load(cache_file)
+    compiled = body["compiled"]
+    if body["lazy"]:
+        compiled = dict(compiled)
+        base = cache_file.tell()
+        stat = os.fstat(cache_file.fileno())
+        source = (os.path.abspath(cache_file.name), stat.st_size, stat.st_mtime_ns)
+        mm = mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_READ)
+        for name, (key_bytes, offset_bytes) in body["lazy"].items():
+            keys, offsets = array("q"), array("q")
+            keys.frombytes(key_bytes)
+            offsets.frombytes(offset_bytes)
+            compiled[name] = LazyRecordTable(mm, base, keys, offsets, source)
+    return compiled
+
+
+def _write_cache(cache_path, header, compiled, lazy_tables):
+    compiled_part = compiled
+    lazy = {}
+    records = []
+    if lazy_tables:
+        compiled_part = {k: v for k, v in compiled.items() if k not in lazy_tables}
+        position = 0
+        for name in lazy_tables:
+            table = compiled[name]
+            keys = array("q", sorted(table))
+            offsets = array("q", [position])
+            for key in keys:
+                record = pickle.dumps(table[key], protocol=pickle.HIGHEST_PROTOCOL)
+                records.append(record)
+                position += len(record)
+                offsets.append(position)
+            lazy[name] = (keys.tobytes(), offsets.tobytes())
+
+    cache_dir = os.path.dirname(cache_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    # write to a temporary file and rename, so concurrent readers never see a partial cache
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(
+                {"compiled": compiled_part, "lazy": lazy},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+            f.writelines(records)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _open_cache(cache_path):
+    cache_file = open(cache_path, "rb")
+    try:
+        return _read_header(cache_file), cache_file
+    except BaseException:
+        cache_file.close()
+        raise
+
+
+def load_compiled_json(
+    json_path, compile_fn, cache_dir=None, use_cache=True, lazy_tables=()
+):
+    """Loads a JSON file through `compile_fn`, caching the compiled result on disk.
+
+    The cache holds a small header followed by the pickled result of `compile_fn`. It is
+    reused while the JSON file's size and mtime are unchanged; if those differ but the
+    file's SHA-256 still matches (e.g. after a fresh checkout) the cache is reused and its
+    header refreshed. Otherwise the JSON is parsed and compiled again and the cache
+    rewritten. Problems reading or writing the cache are logged and never fatal.
+
+    `json_path` can also be a sequence of paths, e.g. a base database and overlays over it;
+    `compile_fn` is then given the list of parsed files, in order, and the compiled result
+    is cached for the whole stack. It is reused while none of the files changed.
+
+    Args:
+        json_path (str or sequence): Path of the JSON file, or paths of the JSON files.
+        compile_fn (callable): Turns the parsed JSON into the object to cache; it must be
+            picklable and should depend on nothing but the JSON.
+        cache_dir (str): Directory for the cache file, defaults to get_default_cache_dir().
+        use_cache (bool): If False, always parse the JSON and don't touch the cache.
+        lazy_tables (tuple): Names of int-keyed tables in the (dict) result of `compile_fn`
+            to store record by record and return as LazyRecordTable when loaded from the
+            cache.
+
+    Returns:
+        The result of `compile_fn`.
+    """
+    paths, layered = _layer_paths(json_path)
+
+    def compile_raw(raws):
+        parsed = [json.loads(raw) for raw in raws]
+        return compile_fn(parsed if layered else parsed[0])
+
+    if not use_cache:
+        raws = []
+        for path in paths:
+            with open(path, "rb") as f:
+                raws.append(f.read())
+        return compile_raw(raws)
+
+    lazy_tables = tuple(lazy_tables)
+    stats = [os.stat(path) for path in paths]
+    sizes = tuple(stat.st_size for stat in stats)
+    mtimes = tuple(stat.st_mtime_ns for stat in stats)
+    cache_path = get_cache_path(json_path, cache_dir)
+    header = None
+    try:
+        header, cache_file = _open_cache(cache_path)
+        if header is not None and header.get("lazy_tables") != lazy_tables:
+            header = None
+        with cache_file:
+            if (
+                header is not None
+                and header.get("size") == sizes
+                and header.get("mtime_ns") == mtimes
+            ):
+                return _read_compiled(cache_file)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable database cache {cache_path}: {e}")
+        header = None
+
+    raws = []
+    for path in paths:
+        with open(path, "rb") as f:
+            raws.append(f.read())
+    digest = hashlib.sha256(
+        b"".join(hashlib.sha256(raw).digest() for raw in raws)
+    ).hexdigest()
+    compiled = None
+    if header is not None and header.get("sha256") == digest:
+        try:
+            _, cache_file = _open_cache(cache_path)
+            with cache_file:
+                compiled = _read_compiled(cache_file)
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable database cache {cache_path}: {e}")
+    if compiled is None:
+        compiled = compile_raw(raws)
+    elif lazy_tables:
+        # materialise the mapped tables, the cache file is about to be replaced
+        compiled = {k: dict(v) if k in lazy_tables else v for k, v in compiled.items()}
+    del raws
+
+    header = {
+        "version": CACHE_VERSION,
+        "size": sizes,
+        "mtime_ns": mtimes,
+        "sha256": digest,
+        "lazy_tables": lazy_tables,
+    }
+    try:
+        _write_cache(cache_path, header, compiled, lazy_tables)
+    except Exception as e:
+        logger.debug(f"Could not write database cache {cache_path}: {e}")
+        return compiled
+    if lazy_tables:
+        # reopen the new cache, so only the records in use stay in memory from now on
+        try:
+            _, cache_file = _open_cache(cache_path)
+            with cache_file:
+                return _read_compiled(cache_file)
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable database cache {cache_path}: {e}")
+    return compiled
@@ -3,14 +3,16 @@
 # See the file "LICENSE" for the full license governing this code.
 #
 
-import json
 import bitstring
+import gc
 import sys
 import math
 import os
 import re
+import threading
 import importlib.resources
 from collections import OrderedDict
+from collections.abc import Mapping, MutableMapping
 from .parse import (
     parse_j1939_id,
     is_connection_management_message,
@@ -19,10 +21,15 @@ from .parse import (
     is_spn_numerical_values,
     is_transport_message,
     is_transport_pgn,
+    ACK_MASK,
+    CM_MASK,
     DIAG3_MASK,
     PF_MASK,
+    TM_MASK,
 )
 from .isotp import IsoTpTracker
+from .dbcache import load_compiled_json
+from .search import NameIndex
 
 __all__ = [
     "get_spn_indicator_byte",
@@ -30,12 +37,29 @@ __all__ = [
     "is_spn_na",
     "is_spn_specific",
     "is_spn_reserved",
+    "SPNValue",
     "NameTracker",
+    "SPNSpec",
+    "PGNSpec",
+    "merge_j1939db",
+    "compile_j1939db",
+    "load_j1939db",
+    "preload_j1939db",
+    "PGN_CLASS_DATA",
+    "PGN_CLASS_TRANSPORT",
+    "PGN_CLASS_SPECIAL",
+    "get_pgn_class",
+    "register_pgn_handler",
+    "register_pf_handler",
+    "unregister_pgn_handler",
     "DADescriber",
     "get_spn_cut_bytes",
     "decode_j1939_name",
     "J1939TransportTracker",
+    "J1939ChannelContext",
+    "LazyDescription",
     "J1939Describer",
+    "DatabaseReloader",
     "get_default_da_json",
     "get_describer",
 ]
@@ -49,6 +73,341 @@ PRINTABLE_TABLE = str.maketrans(
 )
 
 
+def _printable(text):
+    """Replaces non-printable characters with '.' (safe for curses and JSON output)."""
+    return text if text.isprintable() else text.translate(PRINTABLE_TABLE)
+
+
+def _sanitize_db(obj):
+    """Returns the J1939db JSON with every key and string value made printable.
+
+    Names, units and labels from the database end up as description keys and values, so
+    sanitising them once here leaves only payload-derived strings (ASCII SPNs) to sanitise
+    per frame. Containers are only copied where something changed.
+    """
+    if isinstance(obj, str):
+        return _printable(obj)
+    if isinstance(obj, dict):
+        changed = False
+        items = []
+        for k, v in obj.items():
+            new_k = _printable(k) if isinstance(k, str) else k
+            new_v = _sanitize_db(v)
+            changed = changed or new_k is not k or new_v is not v
+            items.append((new_k, new_v))
+        return dict(items) if changed else obj
+    if isinstance(obj, list):
+        new_list = [_sanitize_db(v) for v in obj]
+        if any(new is not old for new, old in zip(new_list, obj)):
+            return new_list
+        return obj
+    return obj
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class _Spec(Mapping):
+    """Base of the slotted database records; read-only mapping view over the JSON fields.
+
+    Subclasses list `_FIELDS`, pairs of (JSON key, slot). Fields missing from the JSON are
+    None and left out of the mapping view; unknown fields are kept in `extra`.
+    """
+
+    __slots__ = ("extra",)
+    _FIELDS = ()
+    _SLOT_OF = {}
+
+    @classmethod
+    def from_json(cls, obj):
+        extra = {k: v for k, v in obj.items() if k not in cls._SLOT_OF}
+        return cls(*[obj.get(key) for key, _ in cls._FIELDS], extra=extra or None)
+
+    def __reduce__(self):
+        return (
+            self.__class__,
+            tuple(getattr(self, slot) for _, slot in self._FIELDS) + (self.extra,),
+        )
+
+    def __getitem__(self, key):
+        slot = self._SLOT_OF.get(key)
+        value = None if slot is None else getattr(self, slot)
+        if value is None:
+            if self.extra is None:
+                raise KeyError(key)
+            return self.extra[key]
+        return value
+
+    def __iter__(self):
+        for key, slot in self._FIELDS:
+            if getattr(self, slot) is not None:
+                yield key
+        if self.extra is not None:
+            yield from self.extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({dict(self)!r})"
+
+    def to_dict(self):
+        return dict(self)
+
+
+class SPNSpec(_Spec):
+    """An SPN record of the J1939 database (an entry of J1939SPNdb).
+
+    Reads like the JSON object it was built from (`spec["Units"]`, `spec.get("Delimiter")`),
+    while the decoder uses the attributes. `scale` is the resolution to apply: the
+    Resolution, or 1 if that isn't positive.
+    """
+
+    __slots__ = (
+        "name",
+        "units",
+        "length",
+        "resolution",
+        "offset",
+        "operational_low",
+        "operational_high",
+        "data_range",
+        "operational_range",
+        "delimiter",
+        "start_bit",
+        "scale",
+    )
+    _FIELDS = (
+        ("Name", "name"),
+        ("Units", "units"),
+        ("SPNLength", "length"),
+        ("Resolution", "resolution"),
+        ("Offset", "offset"),
+        ("OperationalLow", "operational_low"),
+        ("OperationalHigh", "operational_high"),
+        ("DataRange", "data_range"),
+        ("OperationalRange", "operational_range"),
+        ("Delimiter", "delimiter"),
+        ("StartBit", "start_bit"),
+    )
+    _SLOT_OF = dict(_FIELDS)
+
+    def __init__(
+        self,
+        name,
+        units,
+        length,
+        resolution,
+        offset,
+        operational_low=None,
+        operational_high=None,
+        data_range=None,
+        operational_range=None,
+        delimiter=None,
+        start_bit=None,
+        extra=None,
+    ):
+        self.name = _intern(name)
+        self.units = _intern(units)
+        self.length = _intern(length)
+        self.resolution = resolution
+        self.offset = offset
+        self.operational_low = operational_low
+        self.operational_high = operational_high
+        self.data_range = _intern(data_range)
+        self.operational_range = _intern(operational_range)
+        self.delimiter = _intern(delimiter)
+        self.start_bit = start_bit
+        self.extra = extra
+        try:
+            self.scale = resolution if resolution > 0 else 1
+        except TypeError:
+            self.scale = resolution
+
+
+class PGNSpec(_Spec):
+    """A PGN record of the J1939 database (an entry of J1939PGNdb).
+
+    Reads like the JSON object it was built from. `spns` is a tuple and `start_bits`, if the
+    database has SPNStartBits, a tuple with one tuple of start bits per SPN.
+    """
+
+    __slots__ = ("label", "name", "length", "rate", "spns", "start_bits")
+    _FIELDS = (
+        ("Label", "label"),
+        ("Name", "name"),
+        ("PGNLength", "length"),
+        ("Rate", "rate"),
+        ("SPNs", "spns"),
+        ("SPNStartBits", "start_bits"),
+    )
+    _SLOT_OF = dict(_FIELDS)
+
+    def __init__(
+        self,
+        label,
+        name,
+        length=None,
+        rate=None,
+        spns=None,
+        start_bits=None,
+        extra=None,
+    ):
+        self.label = _intern(label)
+        self.name = _intern(name)
+        self.length = _intern(length)
+        self.rate = _intern(rate)
+        self.spns = () if spns is None else tuple(spns)
+        if start_bits is not None:
+            start_bits = tuple(
+                tuple(s) if isinstance(s, (list, tuple)) else (s,) for s in start_bits
+            )
+        self.start_bits = start_bits
+        self.extra = extra
+
+
+def merge_j1939db(base, *overlays):
+    """Merges J1939db JSON objects; later ones take precedence.
+
+    Tables (J1939PGNdb, J1939SPNdb, J1939BitDecodings, J1939SATabledb, ...) are merged entry
+    by entry: an entry of a later database replaces the whole entry of the same key, e.g. a
+    PGN record with its SPN list, and entries only in one database are kept. Other values
+    are replaced. Neither argument is modified.
+
+    Returns:
+        dict: The merged J1939db JSON.
+    """
+    merged = dict(base)
+    for overlay in overlays:
+        for key, value in overlay.items():
+            table = merged.get(key)
+            if isinstance(table, dict) and isinstance(value, dict):
+                table = dict(table)
+                table.update(value)
+                merged[key] = table
+            else:
+                merged[key] = value
+    return merged
+
+
+def compile_j1939db(j1939db):
+    """Converts J1939db JSON into the lookup tables used by DADescriber.
+
+    Strings are sanitised, the PGN, SPN, address and bit decoding tables are keyed by int
+    and PGN and SPN records become PGNSpec and SPNSpec. The result can be pickled, so it
+    can be cached on disk (see dbcache).
+
+    Args:
+        j1939db (dict): The parsed J1939db JSON.
+
+    Returns:
+        dict: The tables, keyed by DADescriber attribute name.
+    """
+    j1939db = _sanitize_db(j1939db)
+    return {
+        # TODO check for all expected fields on each object
+        "pgn_objects": {
+            int(pgn_label): PGNSpec.from_json(pgn_object)
+            for pgn_label, pgn_object in j1939db.get("J1939PGNdb", {}).items()
+        },
+        "spn_objects": {
+            int(spn_label): SPNSpec.from_json(spn_object)
+            for spn_label, spn_object in j1939db.get("J1939SPNdb", {}).items()
+        },
+        "address_names": {
+            int(address): address_name
+            for address, address_name in j1939db.get("J1939SATabledb", {}).items()
+        },
+        "bit_encodings": {
+            int(spn_label): bit_encoding
+            for spn_label, bit_encoding in j1939db.get("J1939BitDecodings", {}).items()
+        },
+        "manufacturer_db": j1939db.get("J1939Manufacturerdb", {}),
+        "industry_db": j1939db.get("J1939IndustryGroupdb", {}),
+        "function_db": j1939db.get("J1939Functiondb", {}),
+        "vehicle_db": j1939db.get("J1939VehicleSystemdb", {}),
+    }
+
+
+# Compiled databases loaded by this process, by absolute path: (stamp, tables)
+_loaded_j1939dbs = {}
+_loaded_j1939dbs_lock = threading.Lock()
+
+
+def _compile_layers(j1939dbs):
+    return compile_j1939db(merge_j1939db(*j1939dbs))
+
+
+def _da_json_layers(da_json):
+    # a J1939db path, or a sequence of them layered over each other (see load_j1939db)
+    if isinstance(da_json, str):
+        return da_json
+    layers = tuple(da_json)
+    if not layers:
+        raise ValueError("Error: no J1939db JSON file given")
+    return layers[0] if len(layers) == 1 else layers
+
+
+def load_j1939db(da_json, db_cache=True, db_cache_dir=None):
+    """Returns the compiled tables of the J1939db JSON file `da_json` (see compile_j1939db).
+
+    `da_json` can also be a sequence of files, e.g. the Digital Annex database followed by
+    OEM or fleet overlays; they are merged with merge_j1939db, later files taking
+    precedence, and the merged tables are cached like those of a single file.
+
+    Tables are read-only and shared by every DADescriber of the process that uses the same
+    files, so several describers (or channels) don't each hold a copy. They are reloaded
+    when the size or mtime of any of the files changes.
+    """
+    da_json = _da_json_layers(da_json)
+    layered = not isinstance(da_json, str)
+    key = tuple(os.path.abspath(path) for path in (da_json if layered else (da_json,)))
+    stats = [os.stat(path) for path in key]
+    stamp = (
+        tuple((stat.st_size, stat.st_mtime_ns) for stat in stats),
+        db_cache,
+        db_cache_dir,
+    )
+    with _loaded_j1939dbs_lock:
+        loaded = _loaded_j1939dbs.get(key)
+        if loaded is not None and loaded[0] == stamp:
+            return loaded[1]
+        tables = load_compiled_json(
+            da_json,
+            _compile_layers if layered else compile_j1939db,
+            cache_dir=db_cache_dir,
+            use_cache=db_cache,
+            lazy_tables=("pgn_objects", "spn_objects", "bit_encodings"),
+        )
+        _loaded_j1939dbs[key] = (stamp, tables)
+        return tables
+
+
+def preload_j1939db(da_json=None, db_cache=True, db_cache_dir=None, freeze=True):
+    """Loads a J1939db once, before forking worker processes that decode with it.
+
+    Describers created afterwards, in this process or in forked children, use the preloaded
+    tables instead of loading the database again. With the on-disk cache the PGN, SPN and bit
+    decoding records are read from a memory-mapped file, whose pages all processes share.
+    `freeze` moves everything allocated so far out of the garbage collector's reach
+    (gc.freeze), so collections in the children don't write to, and so copy, the inherited
+    pages.
+
+    Spawned (rather than forked) workers can be passed the returned tables: the
+    memory-mapped tables pickle as a reference to the cache file, not as their records.
+
+    Returns:
+        dict: The compiled tables.
+    """
+    da_json = _resolve_da_json(da_json)
+    tables = load_j1939db(da_json, db_cache=db_cache, db_cache_dir=db_cache_dir)
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    return tables
+
+
 def get_spn_indicator_byte(value, length):
     """Returns the most significant byte of a parameter field for indicator checking.
 
@@ -138,6 +497,64 @@ NA_NAN = float("nan")
 EMPTY_BITS = bitstring.Bits(bytes=b"")
 
 
+class SPNValue:
+    """A decoded numeric SPN, kept as data and only formatted when rendered.
+
+    Emitted instead of the preformatted strings when a DADescriber is created with
+    `typed_values=True`. `str()` gives the same text the untyped description would contain
+    (e.g. "2308.0 [rpm]", "1 (Enabled)", "N/A"), and a value compares equal to that text.
+
+    Attributes:
+        value: The scaled value, or the raw value for bit-encoded SPNs; None for indicators.
+        units (str): The SPN's units, None for bit-encoded SPNs.
+        raw (int): The raw value as transmitted.
+        indicator (str): "N/A", "Error", "Reserved" or "Parameter specific" if the raw value
+            is one of the J1939 indicator ranges, else None.
+        label (str): The state name of a bit-encoded SPN, else None.
+    """
+
+    __slots__ = ("value", "units", "raw", "indicator", "label")
+
+    def __init__(self, value, units=None, raw=None, indicator=None, label=None):
+        self.value = value
+        self.units = units
+        self.raw = raw
+        self.indicator = indicator
+        self.label = label
+
+    def __str__(self):
+        if self.indicator is not None:
+            return self.indicator
+        if self.label is not None:
+            return "%d (%s)" % (self.raw, self.label)
+        return "%s [%s]" % (self.value, self.units)
+
+    def __repr__(self):
+        return (
+            f"SPNValue(value={self.value!r}, units={self.units!r}, raw={self.raw!r}, "
+            f"indicator={self.indicator!r}, label={self.label!r})"
+        )
+
+    def __eq__(self, other):
+        if isinstance(other, SPNValue):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, str):
+            return str(self) == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def to_dict(self):
+        return {
+            "value": self.value,
+            "units": self.units,
+            "raw": self.raw,
+            "indicator": self.indicator,
+            "label": self.label,
+        }
+
+
 class J1939Filter:
     """Handles J1939-specific filtering and CAN-level filter generation."""
 
@@ -417,6 +834,114 @@ class NameTracker:
         return None
 
 
+# PGN classes of the dispatch table
+PGN_CLASS_DATA = 0  # decoded from the SPNs of its database record
+PGN_CLASS_TRANSPORT = (
+    1  # transport protocol frames, reassembled by the transport trackers
+)
+PGN_CLASS_SPECIAL = 2  # described by a registered handler instead of its SPNs
+
+# WARNING: PERFORMANCE OPTIMIZATION
+# Rationale: Every frame used to walk chains of `if pgn == ...` tests (Request, Address
+# Claimed, DM1/DM2, the proprietary ranges) in get_pgn_acronym and
+# _describe_special_pgn_types, and evaluated is_transport_pgn up to three times. Each PGN is
+# now classified once, from a table of single PGNs and a table of PDU formats (indexed by
+# the extended data page, data page and PF bits), and the resolved entry is kept, so every
+# later classification is a single dict lookup.
+# Estimated Speed-up: special-PGN check ~0.55us -> ~0.2us, acronym lookup ~2x faster (~2% per
+# frame).
+_DATA_ENTRY = (PGN_CLASS_DATA, None, None)  # (class, acronym, handler)
+_PGN_DISPATCH = {}
+_PF_DISPATCH = [_DATA_ENTRY] * 0x400
+_resolved_pgns = {}
+# acronyms of the proprietary PGN ranges; a database label (e.g. from a converted DBC) is
+# shown in their place
+_PROPRIETARY_ACRONYMS = frozenset(("PropA", "PropA2", "PropB", "PropB2"))
+
+
+def _resolve_pgn_entry(pgn):
+    entry = _PGN_DISPATCH.get(pgn)
+    if entry is None:
+        entry = _PF_DISPATCH[(pgn >> 8) & 0x3FF] if pgn < 0x40000 else _DATA_ENTRY
+    _resolved_pgns[pgn] = entry
+    return entry
+
+
+def _make_entry(handler, acronym, pgn_class):
+    if pgn_class is None:
+        pgn_class = PGN_CLASS_DATA if handler is None else PGN_CLASS_SPECIAL
+    return (pgn_class, acronym, handler)
+
+
+def get_pgn_class(pgn):
+    """Returns the PGN_CLASS_* of `pgn`."""
+    return (_resolved_pgns.get(pgn) or _resolve_pgn_entry(pgn))[0]
+
+
+def register_pgn_handler(
+    pgn, handler=None, acronym=None, pgn_class=None, replace=False
+):
+    """Registers how frames of a single PGN are described.
+
+    Register handlers before creating describers; decode plans cached by existing describers
+    aren't updated.
+
+    Args:
+        pgn (int): The PGN.
+        handler (callable): Called as handler(da_describer, message_data_bitstring,
+            description, sa) to fill `description` (an OrderedDict) in place of the SPNs of
+            the PGN's database record. It returns True if it described the frame; with
+            include_raw_data, or if it returns False, the SPNs are decoded as well.
+        acronym (str): Shown for the PGN instead of its database label.
+        pgn_class (int): One of the PGN_CLASS_* constants; defaults to PGN_CLASS_SPECIAL
+            with a handler and PGN_CLASS_DATA without.
+        replace (bool): Replace an existing registration instead of raising.
+
+    Raises:
+        ValueError: If `pgn` is already registered and `replace` is False.
+    """
+    if pgn in _PGN_DISPATCH and not replace:
+        raise ValueError(f"Error: a handler for PGN {pgn} is already registered")
+    _PGN_DISPATCH[pgn] = _make_entry(handler, acronym, pgn_class)
+    _resolved_pgns.clear()
+
+
+def register_pf_handler(
+    pf, handler=None, acronym=None, pgn_class=None, data_page=0, replace=False
+):
+    """Registers how the frames of every PGN with PDU format `pf` are described.
+
+    Single PGNs registered with register_pgn_handler take precedence. See
+    register_pgn_handler for the arguments.
+
+    Args:
+        pf (int): The PDU format (PF) byte.
+        data_page (int): The data page bits (0-3, extended data page in bit 1).
+
+    Raises:
+        ValueError: If `pf` is already registered and `replace` is False.
+    """
+    index = (data_page << 8) | pf
+    if _PF_DISPATCH[index] is not _DATA_ENTRY and not replace:
+        raise ValueError(
+            f"Error: a handler for PF {pf} on data page {data_page} is already registered"
+        )
+    _PF_DISPATCH[index] = _make_entry(handler, acronym, pgn_class)
+    _resolved_pgns.clear()
+
+
+def unregister_pgn_handler(pgn):
+    """Removes the registration of a single PGN, if any."""
+    _PGN_DISPATCH.pop(pgn, None)
+    _resolved_pgns.clear()
+
+
+def _scan_records(table):
+    # iterate a record table without loading every record of a lazily loaded one for good
+    scan = getattr(table, "scan", None)
+    return scan() if scan is not None else table.items()
+
+
 class DADescriber:
     def __init__(
         self,
@@ -429,48 +954,34 @@ class DADescriber:
         include_transport_rawdata,
         include_na,
         include_raw_data,
+        typed_values=False,
+        db_cache=True,
+        db_cache_dir=None,
     ):
-        self.pgn_objects = {}
-        self.spn_objects = {}
-        self.address_names = {}
-        self.bit_encodings = {}
-        self.manufacturer_db = {}
-        self.industry_db = {}
-        self.function_db = {}
-        self.vehicle_db = {}
-
+        # WARNING: PERFORMANCE OPTIMIZATION
+        # Rationale: Parsing a full Digital Annex J1939db.json and building the int-keyed tables
+        # takes seconds. The on-disk cache stores the PGN, SPN and bit decoding records one by
+        # one behind an offset index, so startup only reads the index and memory follows the
+        # records a bus actually uses; loaded tables are shared within the process (and with
+        # forked workers, see preload_j1939db). See scripts/bench_db_load.py.
         if isinstance(da_json, dict):
-            j1939db = da_json
+            tables = compile_j1939db(da_json)
         else:
-            with open(da_json, "r") as j1939_file:
-                j1939db = json.load(j1939_file)
-
-        for pgn_label, pgn_object in j1939db.get("J1939PGNdb", {}).items():
-            # TODO check for all expected fields on each object
-            self.pgn_objects.update({int(pgn_label): pgn_object})
-
-        for spn_label, spn_object in j1939db.get("J1939SPNdb", {}).items():
-            # TODO check for all expected fields on each object
-            self.spn_objects.update({int(spn_label): spn_object})
-
-        for address, address_name in j1939db.get("J1939SATabledb", {}).items():
-            # TODO check for all expected fields on each object
-            self.address_names.update({int(address): address_name})
-
-        for spn_label, bit_encoding in j1939db.get("J1939BitDecodings", {}).items():
-            # TODO check for all expected fields on each object
-            self.bit_encodings.update({int(spn_label): bit_encoding})
-
-        self.manufacturer_db = j1939db.get("J1939Manufacturerdb", {})
-        self.industry_db = j1939db.get("J1939IndustryGroupdb", {})
-        self.function_db = j1939db.get("J1939Functiondb", {})
-        self.vehicle_db = j1939db.get("J1939VehicleSystemdb", {})
-
-        self.name_tracker = NameTracker(
-            self.manufacturer_db, self.industry_db, self.function_db, self.vehicle_db
-        )
-
-        self.da_json = da_json if isinstance(da_json, str) else "in-memory"
+            da_json = _da_json_layers(da_json)
+            tables = load_j1939db(da_json, db_cache=db_cache, db_cache_dir=db_cache_dir)
+        self.pgn_objects = tables["pgn_objects"]
+        self.spn_objects = tables["spn_objects"]
+        self.address_names = tables["address_names"]
+        self.bit_encodings = tables["bit_encodings"]
+        self.manufacturer_db = tables["manufacturer_db"]
+        self.industry_db = tables["industry_db"]
+        self.function_db = tables["function_db"]
+        self.vehicle_db = tables["vehicle_db"]
+
+        self.name_tracker = self.new_name_tracker()
+
+        # the file, the (base first) tuple of layered files, or "in-memory"
+        self.da_json = da_json if not isinstance(da_json, dict) else "in-memory"
         self.describe_pgns = describe_pgns
         self.describe_spns = describe_spns
         self.describe_link_layer = describe_link_layer
@@ -479,6 +990,9 @@ class DADescriber:
         self.include_transport_rawdata = include_transport_rawdata
         self.include_na = include_na
         self.include_raw_data = include_raw_data
+        self.typed_values = typed_values
+        self.db_cache = db_cache
+        self.db_cache_dir = db_cache_dir
         # WARNING: PERFORMANCE OPTIMIZATION
         # Rationale: Caching SPN properties avoids redundant dictionary lookups and pre-calculates
         # fixed values like start bits and lengths. This significantly reduces CPU time during the
@@ -487,37 +1001,104 @@ class DADescriber:
         self._spn_cache = (
             {}
         )  # Cache for (name, units, bitencoded, numerical, start, length, spn_obj)
+        self._decode_plans = {}  # Cache for get_decode_plan, by PGN
+        self._compiled_decoders = (
+            {}
+        )  # Plugin decoders compiled for this database, by (PGN, SA)
+        # name search indexes, built on first use by resolve_pgn/resolve_address/resolve_spn
+        self._pgn_index = None
+        self._address_index = None
+        self._spn_index = None
+
+    def new_name_tracker(self):
+        """Returns an empty NameTracker that shares this database's lookup tables."""
+        return NameTracker(
+            self.manufacturer_db, self.industry_db, self.function_db, self.vehicle_db
+        )
+
+    def adopt_name_tracker(self, name_tracker):
+        """Points an existing NameTracker (and its claimed NAMEs) at this database's tables."""
+        name_tracker.manufacturer_db = self.manufacturer_db
+        name_tracker.industry_db = self.industry_db
+        name_tracker.function_db = self.function_db
+        name_tracker.vehicle_db = self.vehicle_db
+        return name_tracker
+
+    def reload(self):
+        """Returns a new DADescriber for the current contents of this one's da_json file(s).
+
+        Options are kept, and decode cache entries of PGNs and SPNs whose records didn't
+        change are carried over, so only the affected PGNs are planned again.
+
+        Raises:
+            ValueError: If this describer was built from an in-memory database.
+        """
+        if self.da_json == "in-memory":
+            raise ValueError("Error: an in-memory database can't be reloaded")
+        reloaded = DADescriber(
+            self.da_json,
+            self.describe_pgns,
+            self.describe_spns,
+            self.describe_link_layer,
+            self.describe_transport_layer,
+            self.real_time,
+            self.include_transport_rawdata,
+            self.include_na,
+            self.include_raw_data,
+            typed_values=self.typed_values,
+            db_cache=self.db_cache,
+            db_cache_dir=self.db_cache_dir,
+        )
+        reloaded._inherit_caches(self)
+        return reloaded
+
+    def _inherit_caches(self, previous):
+        # the caches only depend on the PGN and SPN records; bit decodings and address names
+        # are looked up per frame
+        unchanged = {}
+
+        def is_unchanged(table, key):
+            try:
+                return unchanged[table, key]
+            except KeyError:
+                if table == "pgn":
+                    new, old = self.pgn_objects.get(key), previous.pgn_objects.get(key)
+                else:
+                    new, old = self.spn_objects.get(key), previous.spn_objects.get(key)
+                same = new is old or new == old
+                unchanged[table, key] = same
+                return same
+
+        # the decoding thread keeps adding to the previous caches while this runs on the
+        # watcher thread, so iterate over snapshots
+        for (pgn, spn), properties in list(previous._spn_cache.items()):
+            if is_unchanged("pgn", pgn) and is_unchanged("spn", spn):
+                self._spn_cache[pgn, spn] = properties[:6] + (self.spn_objects[spn],)
+        for pgn, plan in list(previous._decode_plans.items()):
+            if is_unchanged("pgn", pgn) and all(
+                is_unchanged("spn", spn)
+                for spns in (plan or {}).values()
+                for spn in spns
+            ):
+                self._decode_plans[pgn] = plan
 
     def get_pgn_acronym(self, pgn):
-        if pgn == 59904:
-            return "Request"
-        if pgn == 60928:
-            return "Address Claimed"
-        if pgn == 65226:
-            return "DM1"
-        if pgn == 65227:
-            return "DM2"
-        if pgn == 61184:
-            return "PropA"
-        if pgn == 126720:
-            return "PropA2"
-        if 65280 <= pgn <= 65535:
-            return "PropB"
-        if 130816 <= pgn <= 131071:
-            return "PropB2"
+        acronym = (_resolved_pgns.get(pgn) or _resolve_pgn_entry(pgn))[1]
+        if acronym is not None and acronym not in _PROPRIETARY_ACRONYMS:
+            return acronym
         pgn_object = self.pgn_objects.get(pgn)
         if pgn_object is None:
-            return None
-        acronym = pgn_object["Label"]
-        if acronym == "":
-            return None
-        return acronym
+            return acronym
+        label = pgn_object.label
+        if not label:
+            return acronym
+        return label
 
     def get_spn_name(self, spn):
         spn_object = self.spn_objects.get(spn)
         if spn_object is None:
             return "Unknown"
-        return spn_object["Name"]
+        return spn_object.name
 
     def _clean_name(self, name):
         if not name:
@@ -560,55 +1141,78 @@ class DADescriber:
                 address_name = "???"
         return formatted_address, self._clean_name(address_name)
 
-    def resolve_pgn(self, query):
+    # WARNING: PERFORMANCE OPTIMIZATION
+    # Rationale: The viewer and filters resolve names interactively; scanning and lowercasing
+    # every label and name of a full Digital Annex took tens of milliseconds per query. The
+    # NameIndex is built once, from records read without keeping them loaded, and answers
+    # a query from the names sharing its rarest 3-character gram.
+    # Estimated Speed-up: ~100x per query on a full-size database.
+    def _get_pgn_index(self):
+        if self._pgn_index is None:
+
+            def entries():
+                # registered acronyms that aren't database labels
+                for pgn, (_, acronym, _) in _PGN_DISPATCH.items():
+                    yield pgn, acronym
+                for pgn, obj in _scan_records(self.pgn_objects):
+                    yield pgn, obj.label
+                    yield pgn, obj.name
+
+            self._pgn_index = NameIndex(entries())
+        return self._pgn_index
+
+    def _get_address_index(self):
+        if self._address_index is None:
+            entries = [(255, "All"), (255, "Global")]
+            entries.extend(self.address_names.items())
+            self._address_index = NameIndex(entries)
+        return self._address_index
+
+    def _get_spn_index(self):
+        if self._spn_index is None:
+            self._spn_index = NameIndex(
+                (spn, obj.name) for spn, obj in _scan_records(self.spn_objects)
+            )
+        return self._spn_index
+
+    def resolve_pgn(self, query, prefix=False, ranked=False):
         """Find PGNs matching query string (case-insensitive substring match).
 
         Args:
             query (str): The search query.
+            prefix (bool): Only match labels or names with a word starting with the query.
+            ranked (bool): Return the best matches first (see NameIndex.search).
 
         Returns:
-            set: A set of matching PGN items.
+            list: The matching PGNs, sorted unless `ranked`.
         """
-        query = query.lower()
-        results = set()
-
-        # 1. Check hardcoded acronyms
-        hardcoded_pgns = [59904, 60928, 65226, 61184, 126720]
-        for p in hardcoded_pgns:
-            acr = self.get_pgn_acronym(p)
-            if acr and query in acr.lower():
-                results.add(p)
-
-        # 2. Check database PGNs
-        for pgn, obj in self.pgn_objects.items():
-            label = obj.get("Label", "").lower()
-            name = obj.get("Name", "").lower()
-            if query in label or query in name:
-                results.add(pgn)
-
-        return sorted(list(results))
-
-    def resolve_address(self, query):
+        return self._get_pgn_index().search(query, prefix, ranked)
+
+    def resolve_address(self, query, prefix=False, ranked=False):
         """Find addresses matching query string (case-insensitive substring match).
 
         Args:
             query (str): The search query.
+            prefix (bool): Only match names with a word starting with the query.
+            ranked (bool): Return the best matches first (see NameIndex.search).
 
         Returns:
-            set: A set of matching address items.
+            list: The matching addresses, sorted unless `ranked`.
         """
-        query = query.lower()
-        results = set()
+        return self._get_address_index().search(query, prefix, ranked)
 
-        # Include hardcoded "All"
-        if query in "all" or query in "global":
-            results.add(255)
+    def resolve_spn(self, query, prefix=False, ranked=False):
+        """Find SPNs whose name matches query string (case-insensitive substring match).
 
-        for addr, name in self.address_names.items():
-            if query in name.lower():
-                results.add(addr)
+        Args:
+            query (str): The search query.
+            prefix (bool): Only match names with a word starting with the query.
+            ranked (bool): Return the best matches first (see NameIndex.search).
 
-        return sorted(list(results))
+        Returns:
+            list: The matching SPNs, sorted unless `ranked`.
+        """
+        return self._get_spn_index().search(query, prefix, ranked)
 
     def describe_message_id(self, message_id):
         description = OrderedDict()
@@ -619,11 +1223,12 @@ class DADescriber:
         da_formatted_address, da_address_name = self.get_formatted_address_and_name(da)
         sa_formatted_address, sa_address_name = self.get_formatted_address_and_name(sa)
 
-        if priority != 6:  # 6 is 0x18 shifted
-            description["Priority"] = str(priority)
+        # built in display order: PGN, SA, DA, Priority, then everything else
         description["PGN"] = self.get_pgn_description(pgn)
         description["SA"] = "%s%s" % (sa_address_name, sa_formatted_address)
         description["DA"] = "%s%s" % (da_address_name, da_formatted_address)
+        if priority != 6:  # 6 is 0x18 shifted
+            description["Priority"] = str(priority)
 
         description["_pgn"] = pgn
         description["_sa"] = sa
@@ -660,15 +1265,15 @@ class DADescriber:
         return name, offset, scale, spn_end, spn_length, spn_start, units
 
     def lookup_spn_startbit(self, spn_object, spn, pgn):
-        pgn_object = self.pgn_objects.get(pgn, {})
-        spns_in_pgn = pgn_object.get("SPNs", [])
-        startbits_in_pgn = pgn_object.get("SPNStartBits")
+        pgn_object = self.pgn_objects.get(pgn)
+        startbits_in_pgn = None if pgn_object is None else pgn_object.start_bits
 
         if startbits_in_pgn is not None:
+            spns_in_pgn = pgn_object.spns
             if spn in spns_in_pgn:
                 idx = spns_in_pgn.index(spn)
                 if idx < len(startbits_in_pgn):
-                    spn_start = startbits_in_pgn[idx]
+                    spn_start = list(startbits_in_pgn[idx])
                 else:
                     spn_start = -1
             else:
@@ -695,39 +1300,20 @@ class DADescriber:
 
     def get_spn_bytes(self, message_data_bitstring, spn, pgn, is_complete_message):
         # Use cached properties
-        cache_key = (pgn, spn)
-        if cache_key not in self._spn_cache:
+        spn_properties = self._spn_cache.get((pgn, spn))
+        if spn_properties is None:
             # Defensive: populate cache if missing
-            spn_obj = self.spn_objects.get(spn)
-            if not spn_obj:
+            spn_properties = self._get_spn_cached_properties(pgn, spn)
+            if spn_properties is None:
                 return EMPTY_BITS
-            spn_name = spn_obj["Name"]
-            spn_units = spn_obj["Units"]
-            is_num = is_spn_numerical_values(spn_units)
-            is_bit = is_spn_bitencoded(spn_units)
-            spn_start = self.lookup_spn_startbit(spn_obj, spn, pgn)
-            spn_length = spn_obj["SPNLength"]
-            self._spn_cache[cache_key] = (
-                spn_name,
-                spn_units,
-                is_num,
-                is_bit,
-                spn_start,
-                spn_length,
-                spn_obj,
-            )
-
         spn_name, spn_units, is_num, is_bit, spn_start, spn_length, spn_obj = (
-            self._spn_cache[cache_key]
+            spn_properties
         )
 
-        if not isinstance(spn_start, list):
-            spn_start = [spn_start]
-
         if type(spn_length) is str and spn_length.startswith("Variable"):
-            delimiter = spn_obj.get("Delimiter")
-            pgn_object = self.pgn_objects.get(pgn, {})
-            spn_list = pgn_object["SPNs"]
+            delimiter = spn_obj.delimiter
+            pgn_object = self.pgn_objects[pgn]
+            spn_list = pgn_object.spns
             if delimiter is None:
                 if len(spn_list) == 1:
                     effective_start = spn_start
@@ -769,14 +1355,16 @@ class DADescriber:
                     ]
                     return cut_data
                 else:  # variable-len field with unspecified start; requires field counting
-                    startbits_list = pgn_object.get("SPNStartBits")
+                    startbits_list = pgn_object.start_bits
                     if startbits_list is None:
                         # Old schema: derive start bits from SPN objects
                         startbits_list = [
                             self.spn_objects.get(s, {}).get("StartBit", -1)
                             for s in spn_list
                         ]
-                    num_fixedlen_spn_fields = sum(1 for s in startbits_list if s != -1)
+                    num_fixedlen_spn_fields = sum(
+                        1 for s in startbits_list if s not in (-1, (-1,))
+                    )
                     variable_spn_ordinal = spn_ordinal - num_fixedlen_spn_fields
                     if num_fixedlen_spn_fields > 0:
                         variable_spn_fields = spn_fields[1:]
@@ -809,38 +1397,18 @@ class DADescriber:
         raw=False,
     ):
         # Use cached properties
-        cache_key = (pgn, spn)
-        if cache_key not in self._spn_cache:
+        spn_properties = self._spn_cache.get((pgn, spn))
+        if spn_properties is None:
             # Defensive: populate cache if missing
-            spn_obj = self.spn_objects.get(spn)
-            if not spn_obj:
+            spn_properties = self._get_spn_cached_properties(pgn, spn)
+            if spn_properties is None:
                 return NA_NAN
-            spn_name = spn_obj["Name"]
-            spn_units = spn_obj["Units"]
-            is_num = is_spn_numerical_values(spn_units)
-            is_bit = is_spn_bitencoded(spn_units)
-            spn_start = self.lookup_spn_startbit(spn_obj, spn, pgn)
-            spn_length = spn_obj["SPNLength"]
-            self._spn_cache[cache_key] = (
-                spn_name,
-                spn_units,
-                is_num,
-                is_bit,
-                spn_start,
-                spn_length,
-                spn_obj,
-            )
-
         spn_name, spn_units, is_num, is_bit, spn_start, spn_length, spn_obj = (
-            self._spn_cache[cache_key]
+            spn_properties
         )
 
-        if isinstance(spn_start, int):
-            spn_start = [spn_start]
-        offset = spn_obj["Offset"]
-        scale = spn_obj["Resolution"]
-        if scale <= 0:
-            scale = 1
+        offset = spn_obj.offset
+        scale = spn_obj.scale
 
         # WARNING: PERFORMANCE OPTIMIZATION
         # Rationale: Fast path for byte-aligned SPNs using direct byte access and int.from_bytes.
@@ -885,8 +1453,8 @@ class DADescriber:
                     value = value * scale + offset
                     if validate:
                         if (
-                            value < spn_obj["OperationalLow"]
-                            or value > spn_obj["OperationalHigh"]
+                            value < spn_obj.operational_low
+                            or value > spn_obj.operational_high
                         ):
                             raise ValueError
                 return value
@@ -915,8 +1483,8 @@ class DADescriber:
             value = value * scale + offset
 
             if validate:
-                operational_min = spn_obj["OperationalLow"]
-                operational_max = spn_obj["OperationalHigh"]
+                operational_min = spn_obj.operational_low
+                operational_max = spn_obj.operational_high
                 if value < operational_min or value > operational_max:
                     raise ValueError
 
@@ -1011,48 +1579,52 @@ class DADescriber:
     def _describe_special_pgn_types(
         self, pgn, message_data_bitstring, description, sa, include_raw_data
     ):
-        if is_transport_pgn(pgn):
+        pgn_class, _, handler = _resolved_pgns.get(pgn) or _resolve_pgn_entry(pgn)
+        if pgn_class == PGN_CLASS_TRANSPORT:
             return (
                 True  # Indicate that it was a transport PGN and processing should stop
             )
+        if handler is None:
+            return False
+        # True if the special PGN was handled and nothing else should be described
+        return (
+            handler(self, message_data_bitstring, description, sa)
+            and not include_raw_data
+        )
 
-        if pgn == 59904:  # Request
-            if len(message_data_bitstring.bytes) >= 3:
-                requested_pgn = (
-                    message_data_bitstring.bytes[0]
-                    + (message_data_bitstring.bytes[1] << 8)
-                    + (message_data_bitstring.bytes[2] << 16)
-                )
-                requested_pgn_desc = self.get_pgn_description(requested_pgn)
-                description["Requested:"] = requested_pgn_desc
-                description["_requested_pgn"] = requested_pgn
-            if not include_raw_data:
-                return True  # Indicate that special PGN was handled
-
-        if pgn == 60928:  # Address Claimed
-            name_decoded = decode_j1939_name(
-                message_data_bitstring.bytes,
-                manufacturer_db=self.manufacturer_db,
-                industry_db=self.industry_db,
-                function_db=self.function_db,
-                vehicle_db=self.vehicle_db,
+    def describe_request(self, message_data_bitstring, description, sa=None):
+        """Describes a Request (PGN 59904): the requested PGN."""
+        if len(message_data_bitstring.bytes) >= 3:
+            requested_pgn = (
+                message_data_bitstring.bytes[0]
+                + (message_data_bitstring.bytes[1] << 8)
+                + (message_data_bitstring.bytes[2] << 16)
             )
-            if name_decoded:
-                description.update(name_decoded)
-                if sa is not None:
-                    self.name_tracker.update(sa, name_decoded)
-
-            if not include_raw_data:
-                return True  # Indicate that special PGN was handled
-
-        if pgn in (65226, 65227):  # DM1, DM2
-            self.describe_diagnostic_message(message_data_bitstring.bytes, description)
-
-            if not include_raw_data:
-                # If we have something, return it now
-                if len(description) > 0:
-                    return True  # Indicate that special PGN was handled
-        return False  # Indicate that no special PGN was handled or not fully handled without raw data
+            requested_pgn_desc = self.get_pgn_description(requested_pgn)
+            description["Requested:"] = requested_pgn_desc
+            description["_requested_pgn"] = requested_pgn
+        return True
+
+    def describe_address_claimed(self, message_data_bitstring, description, sa=None):
+        """Describes an Address Claimed (PGN 60928): the decoded NAME, also tracked by SA."""
+        name_decoded = decode_j1939_name(
+            message_data_bitstring.bytes,
+            manufacturer_db=self.manufacturer_db,
+            industry_db=self.industry_db,
+            function_db=self.function_db,
+            vehicle_db=self.vehicle_db,
+        )
+        if name_decoded:
+            description.update(name_decoded)
+            if sa is not None:
+                self.name_tracker.update(sa, name_decoded)
+        return True
+
+    def describe_dm(self, message_data_bitstring, description, sa=None):
+        """Describes a DM1/DM2: lamp status and DTCs."""
+        self.describe_diagnostic_message(message_data_bitstring.bytes, description)
+        # If we have something, return it now
+        return len(description) > 0
 
     def _get_spn_cached_properties(self, pgn, spn):
         cache_key = (pgn, spn)
@@ -1063,12 +1635,12 @@ class DADescriber:
         if not spn_obj:
             return None
 
-        spn_name = spn_obj["Name"]
-        spn_units = spn_obj["Units"]
+        spn_name = spn_obj.name
+        spn_units = spn_obj.units
         is_num = is_spn_numerical_values(spn_units)
         is_bit = is_spn_bitencoded(spn_units)
         spn_start = self.lookup_spn_startbit(spn_obj, spn, pgn)
-        spn_length = spn_obj["SPNLength"]
+        spn_length = spn_obj.length
 
         cached_properties = (
             spn_name,
@@ -1082,6 +1654,34 @@ class DADescriber:
         self._spn_cache[cache_key] = cached_properties
         return cached_properties
 
+    def get_decode_plan(self, pgn):
+        """Returns what decoding `pgn`'s data can produce, for lazy descriptions.
+
+        Returns:
+            dict: Maps each description key (an SPN name) to the SPNs decoded into it; or None
+            if the PGN has no SPNs or is one of the special PGNs (transport, Request, Address
+            Claimed, DM1/DM2) whose description isn't made of independent SPNs.
+        """
+        try:
+            return self._decode_plans[pgn]
+        except KeyError:
+            pass
+
+        plan = None
+        pgn_object = self.pgn_objects.get(pgn)
+        spn_list = () if pgn_object is None else pgn_object.spns
+        pgn_class = (_resolved_pgns.get(pgn) or _resolve_pgn_entry(pgn))[0]
+        if spn_list and pgn_class == PGN_CLASS_DATA:
+            plan = {}
+            for spn in spn_list:
+                spn_properties = self._get_spn_cached_properties(pgn, spn)
+                if spn_properties is None:
+                    continue
+                name = spn_properties[0]
+                plan[name] = plan.get(name, ()) + (spn,)
+        self._decode_plans[pgn] = plan
+        return plan
+
     def _mark_spn_covered(self, new_spn, new_spn_name, new_spn_description, skip_spns):
         skip_spns[new_spn] = (
             new_spn_name,
@@ -1101,7 +1701,13 @@ class DADescriber:
         is_complete_message=True,
         skip_spns=None,
         sa=None,
+        spns=None,
     ):
+        """Decodes the SPNs of `pgn` from `message_data_bitstring`.
+
+        `spns` restricts decoding to the given SPNs of the PGN (see LazyDescription); the raw
+        "Bytes" fallback is then left out.
+        """
         # WARNING: PERFORMANCE OPTIMIZATION
         # Rationale: Inlining _add_spn_description and _mark_spn_covered here reduces function call
         # overhead in the hottest loop of the application.
@@ -1118,15 +1724,18 @@ class DADescriber:
         if special_pgn_handled:
             return description
 
-        pgn_object = self.pgn_objects.get(pgn, {})
-        spn_list = pgn_object.get("SPNs", [])
+        if spns is None:
+            pgn_object = self.pgn_objects.get(pgn)
+            spn_list = () if pgn_object is None else pgn_object.spns
+        else:
+            spn_list = spns
         if not spn_list:
-            if (
-                len(description) == 0 and not is_transport_pgn(pgn)
-            ) or self.include_raw_data:
+            # transport PGNs returned above
+            if spns is None and (len(description) == 0 or self.include_raw_data):
                 description["Bytes"] = message_data_bitstring.hex.upper()
             return description
 
+        typed_values = self.typed_values
         for spn in spn_list:
             spn_properties = self._get_spn_cached_properties(pgn, spn)
             if spn_properties is None:
@@ -1172,7 +1781,7 @@ class DADescriber:
                             continue
 
                     # J1939 ASCII is delimited by '*' and padded with nulls. Non-ASCII are replaced by '.'.
-                    ascii_str = (
+                    ascii_str = _printable(
                         raw_bytes.decode(encoding="ascii", errors="replace")
                         .replace("\ufffd", ".")
                         .rstrip("*\x00")
@@ -1201,11 +1810,14 @@ class DADescriber:
                     if not should_decode_as_ascii and is_spn_na(
                         raw_spn_value, spn_length
                     ):
+                        val_desc = (
+                            SPNValue(None, spn_units, raw_spn_value, "N/A")
+                            if typed_values
+                            else "N/A"
+                        )
                         if self.include_na:
-                            description[spn_name] = "N/A"
-                            skip_spns[spn] = (spn_name, "N/A")
-                        else:
-                            skip_spns[spn] = (spn_name, "N/A")
+                            description[spn_name] = val_desc
+                        skip_spns[spn] = (spn_name, val_desc)
                         continue
 
                     # Priority 1: Check if this explicit value is defined in J1939BitDecodings
@@ -1222,16 +1834,21 @@ class DADescriber:
                     # Priority 2: If no explicit DA mapping, check remaining standard J1939 Indicators
                     if not should_decode_as_ascii and spn_value_description is None:
                         if is_spn_error(raw_spn_value, spn_length):
-                            description[spn_name] = "Error"
-                            skip_spns[spn] = (spn_name, "Error")
-                            continue
+                            indicator = "Error"
                         elif is_spn_reserved(raw_spn_value, spn_length):
-                            description[spn_name] = "Reserved"
-                            skip_spns[spn] = (spn_name, "Reserved")
-                            continue
+                            indicator = "Reserved"
                         elif is_spn_specific(raw_spn_value, spn_length):
-                            description[spn_name] = "Parameter specific"
-                            skip_spns[spn] = (spn_name, "Parameter specific")
+                            indicator = "Parameter specific"
+                        else:
+                            indicator = None
+                        if indicator is not None:
+                            val_desc = (
+                                SPNValue(None, spn_units, raw_spn_value, indicator)
+                                if typed_values
+                                else indicator
+                            )
+                            description[spn_name] = val_desc
+                            skip_spns[spn] = (spn_name, val_desc)
                             continue
 
                     # Priority 3: Final decoding (scaling or enum lookup)
@@ -1251,17 +1868,19 @@ class DADescriber:
                                 elif raw_spn_value == 15:
                                     spn_value_description = "N/A"
 
-                        if spn_value_description:
-                            val_desc = "%d (%s)" % (
-                                raw_spn_value,
-                                spn_value_description.strip(),
+                        label = (
+                            spn_value_description.strip()
+                            if spn_value_description
+                            else "Unknown"
+                        )
+                        if typed_values:
+                            val_desc = SPNValue(
+                                raw_spn_value, None, raw_spn_value, label=label
                             )
-                            description[spn_name] = val_desc
-                            skip_spns[spn] = (spn_name, val_desc)
                         else:
-                            val_desc = "%d (Unknown)" % raw_spn_value
-                            description[spn_name] = val_desc
-                            skip_spns[spn] = (spn_name, val_desc)
+                            val_desc = "%d (%s)" % (raw_spn_value, label)
+                        description[spn_name] = val_desc
+                        skip_spns[spn] = (spn_name, val_desc)
                     elif (
                         should_decode_as_ascii
                     ):  # This else-if is technically redundant due to the initial if, but kept for clarity
@@ -1270,7 +1889,7 @@ class DADescriber:
                         spn_bytes = self.get_spn_bytes(
                             message_data_bitstring, spn, pgn, is_complete_message
                         )
-                        ascii_str = (
+                        ascii_str = _printable(
                             spn_bytes.bytes.decode(encoding="ascii", errors="replace")
                             .replace("\ufffd", ".")
                             .rstrip("*\x00")
@@ -1282,7 +1901,10 @@ class DADescriber:
                         spn_value = self.get_spn_value(
                             message_data_bitstring, spn, pgn, is_complete_message
                         )
-                        val_desc = "%s [%s]" % (spn_value, spn_units)
+                        if typed_values:
+                            val_desc = SPNValue(spn_value, spn_units, raw_spn_value)
+                        else:
+                            val_desc = "%s [%s]" % (spn_value, spn_units)
                         description[spn_name] = val_desc
                         skip_spns[spn] = (spn_name, val_desc)
                 else:
@@ -1342,7 +1964,7 @@ class DADescriber:
                             description[spn_name] = val_desc
                             skip_spns[spn] = (spn_name, val_desc)
                         elif spn_units.lower() in ("ascii",):
-                            val_desc = (
+                            val_desc = _printable(
                                 spn_bytes.bytes.decode(
                                     encoding="ascii", errors="replace"
                                 )
@@ -1366,14 +1988,26 @@ class DADescriber:
                 description[spn_name] = val_desc
                 skip_spns[spn] = (spn_name, val_desc)
 
-        if (
-            len(description) == 0 and not is_transport_pgn(pgn)
-        ) or self.include_raw_data:
+        if spns is None and (len(description) == 0 or self.include_raw_data):
             description["Bytes"] = message_data_bitstring.hex.upper()
 
         return description
 
 
+for _pgn in (TM_MASK >> 8, CM_MASK >> 8, ACK_MASK >> 8):
+    register_pgn_handler(_pgn, pgn_class=PGN_CLASS_TRANSPORT)
+register_pgn_handler(59904, DADescriber.describe_request, "Request")
+register_pgn_handler(60928, DADescriber.describe_address_claimed, "Address Claimed")
+register_pgn_handler(65226, DADescriber.describe_dm, "DM1")
+register_pgn_handler(65227, DADescriber.describe_dm, "DM2")
+# the proprietary ranges only get a generic acronym when the database doesn't label the PGN
+register_pgn_handler(61184, acronym="PropA")
+register_pgn_handler(126720, acronym="PropA2")
+register_pf_handler(0xFF, acronym="PropB")
+register_pf_handler(0xFF, acronym="PropB2", data_page=1)
+del _pgn
+
+
 def get_spn_cut_bytes(
     spn_start, spn_length, message_data_bitstring, is_complete_message
 ):
@@ -1587,6 +2221,135 @@ class J1939TransportTracker:
                     del self.sessions[(da, sa)]
 
 
+class J1939ChannelContext:
+    """Decoder state that belongs to a single CAN interface.
+
+    Transport sessions, dynamically claimed NAMEs and the network summary are only meaningful
+    per bus; keeping them apart stops SA collisions between e.g. a powertrain and a body bus
+    from corrupting reassembly or mislabelling ECUs.
+    """
+
+    def __init__(self, interface, trackers, name_tracker):
+        self.interface = interface
+        self.trackers = trackers
+        self.name_tracker = name_tracker
+        self.summary_data = {}
+        self.current_da = 0
+
+
+_MISSING = object()
+
+
+class LazyDescription(MutableMapping):
+    """A frame description whose SPN values are decoded when first accessed.
+
+    Returned by a J1939Describer created with `lazy=True` for ordinary single-frame PGNs.
+    The link-layer keys (Priority, PGN, SA, DA, _pgn, _sa, _da) are available immediately;
+    looking up an SPN decodes just that SPN. Anything that needs the whole description --
+    iteration, len(), keys()/items(), mutation -- decodes every SPN once, after which this
+    behaves exactly like the OrderedDict an eager describer returns (same keys, values and
+    order).
+    """
+
+    __slots__ = ("_header", "_full", "_partial", "_describer", "_plan", "_frame")
+
+    def __init__(self, describer, header, plan, pgn, message_data, sa):
+        self._header = header
+        self._full = None
+        self._partial = {}
+        self._describer = describer
+        self._plan = plan
+        self._frame = (pgn, message_data, sa)
+
+    def _materialize(self):
+        full = self._full
+        if full is None:
+            pgn, message_data, sa = self._frame
+            description = self._header.copy()
+            description.update(
+                self._describer.da_describer.describe_message_data(
+                    pgn, message_data, is_complete_message=True, sa=sa
+                )
+            )
+            full = self._full = description
+            self._partial = self._describer = self._plan = self._frame = None
+        return full
+
+    def __getitem__(self, key):
+        if self._full is not None:
+            return self._full[key]
+        value = self._header.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        value = self._partial.get(key, _MISSING)
+        if value is _MISSING:
+            planned = self._plan.get(key)
+            if planned is None:
+                # besides its SPNs, a PGN's data only ever describes its raw "Bytes"
+                if key == "Bytes":
+                    return self._materialize()[key]
+                raise KeyError(key)
+            pgn, message_data, sa = self._frame
+            value = self._describer.da_describer.describe_message_data(
+                pgn, message_data, is_complete_message=True, sa=sa, spns=planned
+            ).get(
+                key, _MISSING
+            )  # missing e.g. when N/A and not included
+            self._partial[key] = value
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key, value):
+        self._materialize()[key] = value
+
+    def __delitem__(self, key):
+        del self._materialize()[key]
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __reversed__(self):
+        return reversed(self._materialize())
+
+    def __len__(self):
+        return len(self._materialize())
+
+    def __bool__(self):
+        # the link-layer keys are always present, no need to decode to know it's not empty
+        return bool(self._header) or bool(self._materialize())
+
+    def __eq__(self, other):
+        if isinstance(other, LazyDescription):
+            other = other._materialize()
+        return self._materialize() == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"LazyDescription({list(self._materialize().items())!r})"
+
+    def move_to_end(self, key, last=True):
+        self._materialize().move_to_end(key, last=last)
+
+    def popitem(self, last=True):
+        return self._materialize().popitem(last=last)
+
+    def copy(self):
+        return self._materialize().copy()
+
+    def to_dict(self):
+        """Returns the fully decoded description as an OrderedDict."""
+        return self._materialize()
+
+
 class J1939Describer:
     da_describer: DADescriber = None
 
@@ -1601,6 +2364,7 @@ class J1939Describer:
         include_raw_data,
         enable_isotp=True,
         real_time=False,
+        lazy=False,
     ):
         self.describe_link_layer = describe_link_layer
         self.describe_pgns = describe_pgns
@@ -1611,23 +2375,84 @@ class J1939Describer:
         self.include_raw_data = include_raw_data
         self.real_time = real_time
 
+        self.enable_isotp = enable_isotp
+        self.lazy = lazy
+
         self.transport_messages = list()
 
+        # Per-interface decoder state, created lazily on the first frame of each channel.
+        # The active context's trackers and summary are aliased onto self.trackers and
+        # self.summary_data so that the single-bus hot path only pays an equality check.
+        self.contexts = {}
+        self._context = None
         self.trackers = []
-        self.trackers.append(J1939TransportTracker(real_time=real_time))
-        if enable_isotp:
-            self.trackers.append(IsoTpTracker(real_time=real_time))
-
         self.summary_data = {}
 
+    def _new_trackers(self):
+        trackers = [J1939TransportTracker(real_time=self.real_time)]
+        if self.enable_isotp:
+            trackers.append(IsoTpTracker(real_time=self.real_time))
+        return trackers
+
+    def _select_context(self, interface):
+        """Makes the decoder state for `interface` the active one, creating it if needed."""
+        context = self.contexts.get(interface)
+        if context is None:
+            if not self.contexts:
+                # The first channel adopts the DADescriber's own NameTracker
+                name_tracker = self.da_describer.name_tracker
+            else:
+                name_tracker = self.da_describer.new_name_tracker()
+            context = J1939ChannelContext(interface, self._new_trackers(), name_tracker)
+            self.contexts[interface] = context
+
+        self._context = context
+        self.trackers = context.trackers
+        self.summary_data = context.summary_data
+        self.da_describer.name_tracker = context.name_tracker
+        return context
+
     def get_summary(self):
-        if not self.summary_data:
+        if not self.contexts:
+            return {}
+
+        if len(self.contexts) == 1:
+            (context,) = self.contexts.values()
+            return self._merge_summary(context.summary_data)
+
+        # Keep the same SA seen on different buses apart by labelling nodes with the channel
+        active_interface = self._context.interface
+        final_summary = {}
+        for interface, context in self.contexts.items():
+            self._select_context(interface)
+            for (sa, da, sa_name, da_name), data in self._merge_summary(
+                context.summary_data
+            ).items():
+                final_key = (
+                    sa,
+                    da,
+                    self._channel_node_name(sa, sa_name, interface),
+                    self._channel_node_name(da, da_name, interface),
+                )
+                final_summary[final_key] = data
+        self._select_context(active_interface)
+        return final_summary
+
+    def _channel_node_name(self, addr, name, interface):
+        if addr == 255:
+            return None
+        if not name:
+            name = self.da_describer.get_formatted_address_and_name(addr)[1]
+        return f"{name} [{interface}]"
+
+    def _merge_summary(self, summary_data):
+        if not summary_data:
             return {}
 
         # First, find the "best" name for each address across all summary entries
         # best_names[sa] = set of names seen for this SA
         addr_to_names = {}
-        for (sa, da, sa_name, da_name), _ in self.summary_data.items():
+        for (sa, da, sa_name, da_name), _ in summary_data.items():
             for addr, name in [(sa, sa_name), (da, da_name)]:
                 if addr not in addr_to_names:
                     addr_to_names[addr] = set()
@@ -1650,7 +2475,7 @@ class J1939Describer:
         # Merge entries that have the same (sa, da) using the best names
         merged = {}  # (sa, da) -> { "sent": set, "req": set }
 
-        for (sa, da, _, _), data in self.summary_data.items():
+        for (sa, da, _, _), data in summary_data.items():
             key = (sa, da)
             if key not in merged:
                 merged[key] = {"sent": set(), "req": set()}
@@ -1684,9 +2509,10 @@ class J1939Describer:
                 spn_coverage = {}
 
             # Update summary for transport
+            current_da = self._context.current_da
             found_sa_name = self.da_describer.name_tracker.get_name(found_sa)
-            da_name = self.da_describer.name_tracker.get_name(self.current_da)
-            t_key = (found_sa, self.current_da, found_sa_name, da_name)
+            da_name = self.da_describer.name_tracker.get_name(current_da)
+            t_key = (found_sa, current_da, found_sa_name, da_name)
             if t_key not in self.summary_data:
                 self.summary_data[t_key] = {"sent": set(), "req": set()}
             self.summary_data[t_key]["sent"].add(found_pgn)
@@ -1720,21 +2546,33 @@ class J1939Describer:
             if is_last_packet and self.include_transport_rawdata:
                 description.update({"Bytes": transport_bits.hex.upper()})
 
-            final_descriptions.append(self.reorder_description(description))
-
-        # Keep track of the DA that was active for the *last* processed message in __call__
-        # This is a bit of a hack, but necessary to properly update the summary_data on cleanup
-        self.current_da = self.current_da if hasattr(self, "current_da") else 0
+            final_descriptions.append(description)
 
-        for tracker in self.trackers:
-            tracker.cleanup(on_transport_found)
+        # Each channel remembers the DA that was active for the *last* message processed on it
+        # in __call__; this is a bit of a hack, but necessary to properly update the
+        # summary_data on cleanup
+        active_context = self._context
+        for interface in list(self.contexts):
+            self._select_context(interface)
+            for tracker in self.trackers:
+                tracker.cleanup(on_transport_found)
+        if active_context is not None:
+            self._select_context(active_context.interface)
 
         return final_descriptions
 
     def set_da_describer(self, da_describer):
         self.da_describer = da_describer
+        # keep tracking NAMEs on every channel across database swaps
+        for context in self.contexts.values():
+            da_describer.adopt_name_tracker(context.name_tracker)
+        if self._context is not None:
+            da_describer.name_tracker = self._context.name_tracker
+
+    def __call__(self, message_data, message_id_uint: int, interface=None):
+        if self._context is None or interface != self._context.interface:
+            self._select_context(interface)
 
-    def __call__(self, message_data, message_id_uint: int):
         if isinstance(message_data, (bytes, bytearray)):
             message_data = bitstring.Bits(bytes=message_data)
         elif not isinstance(message_data, bitstring.Bits):
@@ -1744,7 +2582,7 @@ class J1939Describer:
         self.transport_messages.clear()
 
         pgn, da, sa = parse_j1939_id(message_id_uint)
-        self.current_da = da  # Store current DA for cleanup
+        self._context.current_da = da  # Store current DA for cleanup
 
         # Get CURRENT names for this SA/DA to include in summary key
         # This enables "NAME following" by separating traffic from different ECUs
@@ -1800,7 +2638,9 @@ class J1939Describer:
                 tracker.process(on_transport_found, message_data.bytes, message_id_uint)
 
         # Also add the immediate PGN if it's not a transport management PGN
-        if not is_transport_pgn(pgn):
+        if (_resolved_pgns.get(pgn) or _resolve_pgn_entry(pgn))[
+            0
+        ] != PGN_CLASS_TRANSPORT:
             self.summary_data[summary_key]["sent"].add(pgn)
 
         description = OrderedDict()
@@ -1812,6 +2652,24 @@ class J1939Describer:
             is_transport_lower_layer_message and self.describe_link_layer
         )  # or others when configured to describe 'link layer' frames
 
+        if (
+            self.lazy
+            and is_describe_this_frame
+            and self.describe_pgns
+            and self.describe_spns
+            and not (self.describe_transport_layer and self.transport_messages)
+        ):
+            plan = self.da_describer.get_decode_plan(pgn)
+            if plan is not None:
+                return LazyDescription(
+                    self,
+                    self.da_describer.describe_message_id(message_id_uint),
+                    plan,
+                    pgn,
+                    message_data,
+                    sa,
+                )
+
         if is_describe_this_frame:
             if self.describe_pgns:
                 description.update(
@@ -1864,9 +2722,15 @@ class J1939Describer:
             if is_complete_message and self.include_transport_rawdata:
                 description.update({"Bytes": transport_bits.hex.upper()})
 
-        return self.reorder_description(description)
+        return description
 
     def reorder_description(self, description):
+        """Returns a sanitised copy of `description` with PGN, SA, DA and Priority first.
+
+        Descriptions are already built in this order from a sanitised database, so the
+        describer no longer calls this per frame; it is kept for descriptions assembled
+        elsewhere.
+        """
         # WARNING: PERFORMANCE OPTIMIZATION
         # Rationale: Using str.translate and minimizing OrderedDict creation significantly reduces
         # overhead during the final description assembly.
@@ -1893,6 +2757,123 @@ class J1939Describer:
         return description
 
 
+DEFAULT_RELOAD_INTERVAL = 2.0  # seconds
+
+
+class DatabaseReloader:
+    """Watches a J1939Describer's da_json file(s) and swaps in the database when they change.
+
+    A background thread polls the size and mtime of the file, or of every layered file.
+    Once two consecutive polls see the same change (so a file still being written isn't
+    read), it builds a new DADescriber with DADescriber.reload() while the old one keeps
+    decoding. The decoding thread calls apply() between frames to swap it in; transport
+    sessions, claimed NAMEs and summaries live in the J1939Describer's channel contexts and
+    are kept. If the new file can't be loaded, the error is reported once and the old
+    database stays in use; loading is retried on every poll until it succeeds.
+    """
+
+    def __init__(
+        self,
+        describer,
+        interval=DEFAULT_RELOAD_INTERVAL,
+        on_reload=None,
+        report=None,
+    ):
+        """
+        Args:
+            describer (J1939Describer): The describer whose database is reloaded.
+            interval (float): Seconds between checks of the file.
+            on_reload (callable): Called with the new DADescriber after it was swapped in,
+                from the thread that called apply().
+            report (callable): Called with a status message for each reload or failed
+                reload; defaults to printing to stderr.
+        """
+        self.describer = describer
+        self.path = describer.da_describer.da_json
+        self.paths = (self.path,) if isinstance(self.path, str) else self.path
+        self.interval = interval
+        self.on_reload = on_reload
+        self.report = report if report is not None else self._print
+        self.pending = None  # the next DADescriber, set by the watcher thread
+        self.reloads = 0
+        self._stamp = self._stat()
+        self._candidate = None
+        self._failed = None  # stamp of the file(s) the last reload failed on
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def _print(message):
+        print(message, file=sys.stderr)
+
+    def _stat(self):
+        try:
+            stats = [os.stat(path) for path in self.paths]
+        except OSError:
+            return None
+        return tuple((stat.st_size, stat.st_mtime_ns) for stat in stats)
+
+    def poll(self):
+        """Checks the file(s) once; builds the new database if they changed and settled.
+
+        Returns:
+            bool: True if a new database is pending.
+        """
+        stamp = self._stat()
+        if stamp is None or stamp == self._stamp:
+            self._candidate = None
+            return False
+        if stamp != self._candidate:
+            self._candidate = stamp  # changed, wait for it to settle
+            return False
+        try:
+            pending = self.describer.da_describer.reload()
+        except Exception as e:
+            # retried on the next poll, but reported once per state of the file(s)
+            if stamp != self._failed:
+                self._failed = stamp
+                self.report(f"Error: reloading {' + '.join(self.paths)} failed: {e}")
+            return False
+        self._stamp, self._candidate, self._failed = stamp, None, None
+        self.pending = pending
+        return True
+
+    def apply(self):
+        """Swaps in a pending database; call between frames from the decoding thread.
+
+        Returns:
+            bool: True if a new database was swapped in.
+        """
+        da_describer = self.pending
+        if da_describer is None:
+            return False
+        self.pending = None
+        self.describer.set_da_describer(da_describer)
+        self.reloads += 1
+        self.report(f"Reloaded J1939 database from {' + '.join(self.paths)}")
+        if self.on_reload is not None:
+            self.on_reload(da_describer)
+        return True
+
+    def _watch(self):
+        while not self._stop_event.wait(self.interval):
+            if self.pending is None:
+                self.poll()
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._watch, name="pretty_j1939-db-reloader", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
 def get_default_da_json():
     filename = "J1939db.json"
 
@@ -1937,9 +2918,20 @@ DEFAULT_REAL_TIME = False
 DEFAULT_INCLUDE_RAW_DATA = False
 
 
-def get_describer(da_json=None, **kwargs):
+def _resolve_da_json(da_json):
+    # the default name is looked up in the usual places, also as the base of layered files
     if da_json is None or da_json == DEFAULT_DA_JSON:
-        da_json = get_default_da_json()
+        return get_default_da_json()
+    if isinstance(da_json, (list, tuple)):
+        return [
+            get_default_da_json() if path == DEFAULT_DA_JSON else path
+            for path in da_json
+        ]
+    return da_json
+
+
+def get_describer(da_json=None, **kwargs):
+    da_json = _resolve_da_json(da_json)
 
     # Apply default configuration values to kwargs
     kwargs.setdefault("describe_pgns", DEFAULT_PGN)
@@ -1951,12 +2943,23 @@ def get_describer(da_json=None, **kwargs):
     kwargs.setdefault("include_na", DEFAULT_INCLUDE_NA)
     kwargs.setdefault("include_raw_data", DEFAULT_INCLUDE_RAW_DATA)
 
-    # enable_isotp is only used by J1939Describer
+    # enable_isotp and lazy are only used by J1939Describer, typed_values and the db_cache
+    # options only by DADescriber
     enable_isotp = kwargs.pop("enable_isotp", True)
-
-    describer = J1939Describer(enable_isotp=enable_isotp, **kwargs)
-
-    da_describer = DADescriber(da_json=da_json, **kwargs)
+    lazy = kwargs.pop("lazy", False)
+    typed_values = kwargs.pop("typed_values", False)
+    db_cache = kwargs.pop("db_cache", True)
+    db_cache_dir = kwargs.pop("db_cache_dir", None)
+
+    describer = J1939Describer(enable_isotp=enable_isotp, lazy=lazy, **kwargs)
+
+    da_describer = DADescriber(
+        da_json=da_json,
+        typed_values=typed_values,
+        db_cache=db_cache,
+        db_cache_dir=db_cache_dir,
+        **kwargs,
+    )
     describer.set_da_describer(da_describer)
 
     return describer
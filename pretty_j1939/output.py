@@ -0,0 +1,362 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+
+import io
+import json
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = [
+    "BufferedLineWriter",
+    "OutputFrame",
+    "OutputSink",
+    "ColorSink",
+    "PlainSink",
+    "NdjsonSink",
+    "dumps_ndjson",
+]
+
+DEFAULT_FLUSH_INTERVAL_MS = 100
+DEFAULT_FLUSH_SIZE_KB = 64
+
+
+class BufferedLineWriter:
+    """Batches output lines into large writes with a configurable flush policy.
+
+    Writing and flushing every decoded frame costs at least one syscall per line, which makes
+    piping decoded logs to files syscall-bound. Lines are encoded once and collected in a
+    buffer that is written to the underlying binary stream (e.g. `sys.stdout.buffer`):
+
+    * per line, when `line_buffered` (the default for interactive TTYs);
+    * otherwise once `flush_size_kb` kilobytes are pending, or when the oldest pending line
+      is `flush_interval_ms` milliseconds old, so slow streams (`tail -f | pretty_j1939 -`)
+      still appear promptly.
+
+    Text streams without a binary buffer (e.g. `io.StringIO`) are written to as text.
+    """
+
+    def __init__(
+        self,
+        stream,
+        line_buffered=None,
+        flush_interval_ms=DEFAULT_FLUSH_INTERVAL_MS,
+        flush_size_kb=DEFAULT_FLUSH_SIZE_KB,
+        close_stream=False,
+    ):
+        self.stream = stream
+        self.close_stream = close_stream
+        if line_buffered is None:
+            try:
+                line_buffered = stream.isatty()
+            except (AttributeError, ValueError, OSError):
+                line_buffered = False
+        self.line_buffered = line_buffered
+        self.flush_interval = (flush_interval_ms or 0) / 1000.0
+        self.flush_size = int((flush_size_kb or 0) * 1024)
+
+        if isinstance(stream, io.TextIOBase):
+            binary = getattr(stream, "buffer", None)
+            if binary is not None:
+                # anything already printed through the text layer must go out first
+                stream.flush()
+            self.encoding = getattr(stream, "encoding", None) or "utf-8"
+            self.errors = getattr(stream, "errors", None) or "strict"
+        else:
+            binary = stream
+            self.encoding = "utf-8"
+            self.errors = "strict"
+        self._binary = binary
+        self._empty = b"" if binary is not None else ""
+
+        self._pending = []
+        self._pending_size = 0
+        self._oldest = None
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._flusher = None
+        if not self.line_buffered and self.flush_interval > 0:
+            self._flusher = threading.Thread(
+                target=self._flush_periodically,
+                name="pretty_j1939-flusher",
+                daemon=True,
+            )
+            self._flusher.start()
+
+    def write_line(self, line):
+        """Queues `line` plus a newline for output.
+
+        `line` is a str, or bytes that are already UTF-8 encoded (e.g. from orjson).
+        """
+        if type(line) is bytes:
+            if self._binary is not None:
+                data = line + b"\n"
+            else:
+                data = line.decode("utf-8") + "\n"
+        elif self._binary is not None:
+            data = (line + "\n").encode(self.encoding, self.errors)
+        else:
+            data = line + "\n"
+        with self._lock:
+            self._pending.append(data)
+            self._pending_size += len(data)
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            if self.line_buffered or self._pending_size >= self.flush_size:
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self._pending:
+            data = self._empty.join(self._pending)
+            self._pending.clear()
+            self._pending_size = 0
+            self._oldest = None
+            target = self._binary if self._binary is not None else self.stream
+            target.write(data)
+        target = self._binary if self._binary is not None else self.stream
+        target.flush()
+
+    def _flush_periodically(self):
+        interval = self.flush_interval
+        while not self._closed.wait(interval):
+            with self._lock:
+                if (
+                    self._oldest is not None
+                    and time.monotonic() - self._oldest >= interval
+                ):
+                    try:
+                        self._flush_locked()
+                    except (ValueError, OSError):
+                        # the stream was closed underneath us; nothing left to flush to
+                        return
+
+    def close(self):
+        """Flushes everything pending and stops the periodic flusher."""
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
+        if self.close_stream:
+            self.stream.close()
+
+
+def join_can_line(can_line, json_str, indent=False):
+    """Prefixes rendered JSON with a CAN line, aligning indented continuation lines."""
+    if not can_line:
+        return json_str
+    if not indent:
+        return can_line + json_str
+    spacer = (
+        " " * (len(can_line) - 3) + " ; "
+        if can_line.endswith(" ; ")
+        else " " * len(can_line)
+    )
+    lines = json_str.splitlines()
+    res = can_line + lines[0]
+    for line in lines[1:]:
+        res += "\n" + spacer + line
+    return res
+
+
+class OutputFrame:
+    """One decoded frame as handed to the output sinks.
+
+    The representations sinks have in common -- the fields without internal `_` metadata,
+    the candump prefix and the plain JSON -- are built lazily and at most once per frame, so
+    adding a sink doesn't add another render pass.
+    """
+
+    __slots__ = (
+        "timestamp",
+        "interface",
+        "message_id",
+        "message_data",
+        "candump_line",
+        "description",
+        "indent",
+        "highlight",
+        "_fields",
+        "_candump_prefix",
+        "_raw_prefix",
+        "_json",
+        "_plain_prefix",
+        "_plain",
+    )
+
+    def __init__(
+        self,
+        timestamp,
+        interface,
+        message_id,
+        message_data,
+        candump_line,
+        description,
+        indent=False,
+        highlight=False,
+    ):
+        self.timestamp = timestamp
+        self.interface = interface
+        self.message_id = message_id
+        self.message_data = message_data
+        self.candump_line = candump_line
+        self.description = description
+        self.indent = indent
+        self.highlight = highlight
+        self._fields = None
+        self._candump_prefix = None
+        self._raw_prefix = None
+        self._json = None
+        self._plain_prefix = None
+        self._plain = None
+
+    @property
+    def fields(self):
+        if self._fields is None:
+            self._fields = {
+                k: v for k, v in self.description.items() if not k.startswith("_")
+            }
+        return self._fields
+
+    @property
+    def candump_prefix(self):
+        """The frame reformatted as `(TIMESTAMP) INTERFACE ID#DATA`, padded for a ` ; `."""
+        if self._candump_prefix is None:
+            self._candump_prefix = (
+                f"({self.timestamp:17.6f}) {self.interface} "
+                f"{self.message_id.hex.upper()}#{self.message_data.hex.upper()}"
+            ).ljust(80) + " ; "
+        return self._candump_prefix
+
+    @property
+    def raw_prefix(self):
+        """The input line as given, padded for a ` ; `."""
+        if self._raw_prefix is None:
+            self._raw_prefix = (
+                self.candump_line.split(";", 1)[0].rstrip().ljust(80) + " ; "
+            )
+        return self._raw_prefix
+
+    @property
+    def json(self):
+        """The fields as uncolored JSON, without any prefix."""
+        if self._json is None:
+            if self.indent:
+                self._json = json.dumps(self.fields, indent=4, default=str)
+            else:
+                self._json = json.dumps(self.fields, separators=(",", ":"), default=str)
+        return self._json
+
+    def plain(self, can_line=None):
+        """The uncolored output line, prefixed with `can_line` if given."""
+        if can_line is None:
+            return self.json
+        if can_line is not self._plain_prefix:
+            self._plain = join_can_line(can_line, self.json, self.indent)
+            self._plain_prefix = can_line
+        return self._plain
+
+
+class OutputSink:
+    """Renders frames for one destination and writes them to a BufferedLineWriter.
+
+    Args:
+        writer (BufferedLineWriter): Where rendered lines go.
+        can_line (str, optional): Which CAN line to prefix each description with: None,
+            "candump" (reformatted) or "raw" (the input line).
+    """
+
+    def __init__(self, writer, can_line=None):
+        if can_line not in (None, "candump", "raw"):
+            raise ValueError(f"Error: unknown CAN line format '{can_line}'")
+        self.writer = writer
+        self.can_line = can_line
+
+    def prefix(self, frame):
+        if self.can_line == "candump":
+            return frame.candump_prefix
+        if self.can_line == "raw":
+            return frame.raw_prefix
+        return None
+
+    def render(self, frame):
+        """Returns the line to write for `frame`, or None to write nothing."""
+        raise NotImplementedError
+
+    def emit(self, frame):
+        line = self.render(frame)
+        if line:
+            self.writer.write_line(line)
+
+
+class PlainSink(OutputSink):
+    """Uncolored JSON, e.g. for --write files and non-terminal stdout."""
+
+    def render(self, frame):
+        return frame.plain(self.prefix(frame))
+
+
+class ColorSink(OutputSink):
+    """ANSI-colorized output rendered by a HighPerformanceRenderer."""
+
+    def __init__(self, writer, renderer, can_line=None):
+        super().__init__(writer, can_line)
+        self.renderer = renderer
+
+    def render(self, frame):
+        return self.renderer.render_fields(
+            frame.fields,
+            indent=frame.indent,
+            can_line=self.prefix(frame),
+            highlight=frame.highlight,
+        )
+
+
+def _ndjson_default(value):
+    # typed values (describe.SPNValue) become objects, anything else its text
+    to_dict = getattr(value, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
+    return str(value)
+
+
+def dumps_ndjson(record):
+    """Serializes `record` as one line of compact JSON.
+
+    Uses orjson when it is installed (returning UTF-8 bytes), else the standard library
+    (returning str); BufferedLineWriter.write_line accepts either.
+    """
+    if orjson is not None:
+        return orjson.dumps(record, default=_ndjson_default)
+    return json.dumps(
+        record, separators=(",", ":"), ensure_ascii=False, default=_ndjson_default
+    )
+
+
+class NdjsonSink(OutputSink):
+    """One JSON object per line with the frame's metadata and its decoded fields.
+
+    The description is serialized as is, without the filtering copy the other sinks make;
+    its `_`-prefixed entries are the numeric PGN/SA/DA, which suit machine consumers.
+    """
+
+    def render(self, frame):
+        return dumps_ndjson(
+            {
+                "timestamp": frame.timestamp,
+                "interface": frame.interface,
+                "id": frame.message_id.uint,
+                "data": frame.message_data.hex.upper(),
+                "fields": frame.description,
+            }
+        )
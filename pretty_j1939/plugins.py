@@ -0,0 +1,237 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+"""Plugin decoders for proprietary (or any other) PGNs.
+
+A decoder is a compile function, called once per describer, PGN and source address:
+
+    def compile_decoder(da_describer, pgn, sa):
+        # look things up in the database, precompute offsets ...
+        def decode(message_data_bitstring, description):
+            description["Counter"] = message_data_bitstring.bytes[0]
+            return True  # described, don't decode the PGN's SPNs
+        return decode  # or None to decode this SA's frames as usual
+
+Non-printable characters in the string keys and values a decoder writes (e.g. text taken
+from the payload) are replaced with '.', as for ASCII SPNs.
+
+Decoders are registered for a PGN and optionally a single SA with register_decoder(), by
+installed packages through the "pretty_j1939.decoders" entry point group (each entry point
+names a function called with register_decoder), or from a JSON config file:
+
+    {"decoders": [{"pgn": 65300, "sa": 3, "acronym": "CNT",
+                   "decoder": "my_package.decoders:compile_counter"}]}
+"""
+
+import importlib
+import json
+import logging
+import sys
+
+from . import describe
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "ENTRY_POINT_GROUP",
+    "register_decoder",
+    "clear_decoders",
+    "load_entry_points",
+    "load_decoders_config",
+    "load_plugins",
+]
+
+ENTRY_POINT_GROUP = "pretty_j1939.decoders"
+
+_decoders = {}  # {pgn: {sa or None: compile function}}
+_replaced = {}  # {pgn: dispatch entry the plugin handler replaced, or None}
+_loaded_entry_points = set()
+
+
+def _make_handler(pgn, by_sa):
+    # WARNING: PERFORMANCE OPTIMIZATION
+    # Rationale: Plugins are attached through the PGN dispatch table, so PGNs without a
+    # plugin pay nothing. Compiled decoders are kept per describer next to its decode
+    # plans, so a frame of a plugin PGN costs one dict lookup before the decoder runs.
+    # Estimated Speed-up: N/A (no per-frame cost for PGNs without plugins).
+    def describe_with_plugin(da_describer, message_data_bitstring, description, sa):
+        compiled = da_describer._compiled_decoders
+        try:
+            decode = compiled[pgn, sa]
+        except KeyError:
+            compile_decoder = by_sa.get(sa) or by_sa.get(None)
+            decode = None
+            if compile_decoder is not None:
+                decode = compile_decoder(da_describer, pgn, sa)
+            compiled[pgn, sa] = decode
+        if decode is None:
+            return False
+        described = decode(message_data_bitstring, description)
+        _make_printable(description)
+        return described
+
+    return describe_with_plugin
+
+
+def _make_printable(description):
+    """Makes the string keys and values a decoder wrote printable, in place.
+
+    Decoders often pull text out of the payload, so their output is sanitised like the
+    ASCII SPNs are before it reaches curses or JSON output.
+    """
+    if all(
+        (type(key) is not str or key.isprintable())
+        and (type(value) is not str or value.isprintable())
+        for key, value in description.items()
+    ):
+        return
+    items = [
+        (
+            describe._printable(key) if type(key) is str else key,
+            describe._printable(value) if type(value) is str else value,
+        )
+        for key, value in description.items()
+    ]
+    description.clear()
+    description.update(items)
+
+
+def register_decoder(pgn, compile_decoder, sa=None, acronym=None, replace=False):
+    """Registers a plugin decoder for `pgn`, for frames from `sa` or from every SA.
+
+    A decoder for a single SA takes precedence over one for every SA. Register decoders
+    before creating describers; describers that already compiled a decoder for the PGN keep
+    it.
+
+    Args:
+        pgn (int): The PGN.
+        compile_decoder (callable): compile_decoder(da_describer, pgn, sa) returns the
+            decode(message_data_bitstring, description) function for the frames of `pgn`
+            from `sa` (None to decode them from the database as usual). `decode` fills the
+            `description` OrderedDict and returns True if it described the frame.
+        sa (int): Source address, or None for every source address.
+        acronym (str): Shown for the PGN instead of its current acronym.
+        replace (bool): Replace an existing decoder for `pgn` and `sa` instead of raising.
+
+    Raises:
+        ValueError: If a decoder for `pgn` and `sa` is already registered and `replace` is
+            False, or if `pgn` is handled by a built-in handler (e.g. DM1 or transport).
+    """
+    by_sa = _decoders.get(pgn)
+    if by_sa is None:
+        previous = describe._PGN_DISPATCH.get(pgn)
+        pgn_class, previous_acronym, _ = describe._resolve_pgn_entry(pgn)
+        if pgn_class != describe.PGN_CLASS_DATA:
+            raise ValueError(
+                f"Error: PGN {pgn} has a built-in handler and can't take plugin decoders"
+            )
+        by_sa = {}
+        describe.register_pgn_handler(
+            pgn,
+            _make_handler(pgn, by_sa),
+            acronym=acronym or previous_acronym,
+            replace=True,
+        )
+        _decoders[pgn] = by_sa
+        _replaced[pgn] = previous
+    elif sa in by_sa and not replace:
+        sa_text = "every SA" if sa is None else f"SA {sa}"
+        raise ValueError(
+            f"Error: a decoder for PGN {pgn} from {sa_text} is already registered"
+        )
+    elif acronym is not None:
+        pgn_class, _, handler = describe._PGN_DISPATCH[pgn]
+        describe.register_pgn_handler(
+            pgn, handler, acronym=acronym, pgn_class=pgn_class, replace=True
+        )
+    by_sa[sa] = compile_decoder
+
+
+def clear_decoders():
+    """Removes every plugin decoder, restoring the PGNs' previous acronyms."""
+    for pgn in list(_decoders):
+        previous = _replaced.pop(pgn)
+        if previous is None:
+            describe.unregister_pgn_handler(pgn)
+        else:
+            pgn_class, acronym, handler = previous
+            describe.register_pgn_handler(
+                pgn, handler, acronym=acronym, pgn_class=pgn_class, replace=True
+            )
+        del _decoders[pgn]
+
+
+def _entry_points():
+    from importlib.metadata import entry_points
+
+    if sys.version_info >= (3, 10):
+        return entry_points(group=ENTRY_POINT_GROUP)
+    return entry_points().get(ENTRY_POINT_GROUP, [])
+
+
+def load_entry_points():
+    """Calls every installed "pretty_j1939.decoders" entry point with register_decoder.
+
+    Entry points are loaded once per process. A plugin that fails to load is reported on
+    stderr and skipped.
+
+    Returns:
+        list: The names of the entry points loaded by this call.
+    """
+    loaded = []
+    for entry_point in _entry_points():
+        if entry_point.name in _loaded_entry_points:
+            continue
+        _loaded_entry_points.add(entry_point.name)
+        try:
+            entry_point.load()(register_decoder)
+        except Exception as e:
+            print(
+                f"Error: decoder plugin {entry_point.name} failed to load: {e}",
+                file=sys.stderr,
+            )
+            continue
+        loaded.append(entry_point.name)
+    return loaded
+
+
+def _import_object(reference):
+    module_name, _, attribute = reference.partition(":")
+    obj = importlib.import_module(module_name)
+    for name in attribute.split(".") if attribute else ():
+        obj = getattr(obj, name)
+    return obj
+
+
+def load_decoders_config(path):
+    """Registers the decoders listed in a JSON config file.
+
+    Raises:
+        ValueError: If an entry is malformed or its decoder can't be imported.
+    """
+    with open(path, "r") as f:
+        config = json.load(f)
+    for entry in config.get("decoders", []):
+        try:
+            pgn = int(entry["pgn"])
+            sa = entry.get("sa")
+            compile_decoder = _import_object(entry["decoder"])
+        except (KeyError, TypeError, ValueError, ImportError, AttributeError) as e:
+            raise ValueError(f"Error: invalid decoder {entry!r} in {path}: {e}")
+        register_decoder(
+            pgn,
+            compile_decoder,
+            sa=None if sa is None else int(sa),
+            acronym=entry.get("acronym"),
+        )
+
+
+def load_plugins(config=None, entry_points=True):
+    """Registers the installed decoder plugins and those of the `config` file, if any."""
+    if entry_points:
+        names = load_entry_points()
+        if names:
+            logger.debug(f"Loaded decoder plugins: {', '.join(names)}")
+    if config:
+        load_decoders_config(config)
@@ -17,6 +17,20 @@ __all__ = ["HighPerformanceRenderer"]
 
 NUM_IN_PARENS_RE = re.compile(r"(\()([^)]*[0-9/x][^)]*)(\))")
 
+# bound on each of the renderer's fragment caches; they are emptied when full
+FRAGMENT_CACHE_SIZE = 4096
+# measured values ("2308.0 [rpm]"), which change every frame and aren't worth caching; enum
+# states ("2 (Running)") and labels are cached
+PLAIN_NUMBER_RE = re.compile(r"-?[\d.]+(?: \[.*\])?")
+
+# style of each byte value in Bytes/Transport Data fields, as an index into BYTE_STYLES
+BYTE_STYLES = ("zero_bytes", "disabled_bytes", "ascii_bytes", "normal_bytes")
+BYTE_STYLE_TABLE = bytes(
+    0 if b == 0x00 else 1 if b == 0xFF else 2 if 32 <= b <= 126 else 3
+    for b in range(256)
+)
+BYTE_RUN_RE = re.compile(rb"\x00+|\x01+|\x02+|\x03+")
+
 
 class HighPerformanceRenderer:
     BOUNCE_BUFFER_WIDTH = 25
@@ -130,6 +144,13 @@ class HighPerformanceRenderer:
             self.ansi_esc["default"] = ""
             self.ansi_esc["reset"] = ""
 
+        # WARNING: PERFORMANCE OPTIMIZATION
+        # Field names and enum/status/label strings (PGN, SA, "Off", ...) come from a small
+        # vocabulary, so their encoded, colorized fragments are cached. Numeric values change
+        # every frame and are not cached.
+        self._key_fragments = {}
+        self._value_fragments = {}
+
     @staticmethod
     def load_theme(theme_name_or_path):
         """Loads a theme dictionary from a name or file path.
@@ -209,6 +230,7 @@ class HighPerformanceRenderer:
             filtered_desc,
             indent=4 if indent else None,
             separators=(",", ":") if not indent else None,
+            default=str,
         )
         if can_line:
             if indent:
@@ -227,41 +249,71 @@ class HighPerformanceRenderer:
         return json_str
 
     def _format_bytes_value(self, value, highlight):
-        res_parts = ['"']
-        clean_value = value[2:] if value.lower().startswith("0x") else value
+        if isinstance(value, (bytes, bytearray)):
+            data = value
+            hex_value = value.hex().upper()
+        else:
+            hex_value = value[2:] if value.lower().startswith("0x") else value
+            try:
+                data = bytes.fromhex(hex_value)
+            except ValueError:
+                data = None
+            if data is not None and len(hex_value) != 2 * len(data):
+                # fromhex skips whitespace, which would misalign the runs below
+                data = None
+
         esc = self.ansi_esc
-        h_style = esc.get("highlight", "") if highlight else ""
         reset = esc["default"]
-
-        last_style = None
-        batch = []
-        for i in range(0, len(clean_value), 2):
-            byte = clean_value[i : i + 2]
-            if byte == "00":
-                style = "zero_bytes"
-            elif byte == "FF" or byte == "ff":
-                style = "disabled_bytes"
-            else:
-                byte_int = int(byte, 16)
-                style = "ascii_bytes" if 32 <= byte_int <= 126 else "normal_bytes"
-
-            if style == last_style:
-                batch.append(byte)
-            else:
-                if batch:
-                    effective_style = h_style if highlight else esc[last_style]
-                    res_parts.append(f'{effective_style}{"".join(batch)}')
-                batch = [byte]
-                last_style = style
-        if batch:
-            effective_style = h_style if highlight else esc[last_style]
-            res_parts.append(f'{effective_style}{"".join(batch)}')
-        res_parts.append(f'{reset}"')
-        return "".join(res_parts)
+        if highlight:
+            return f'"{esc.get("highlight", "")}{hex_value}{reset}"'
+        if data is None:
+            return f'"{esc["normal_bytes"]}{hex_value}{reset}"'
+
+        # WARNING: PERFORMANCE OPTIMIZATION
+        # Classify every byte at once with a 256-entry table, then colorize whole runs of the
+        # same class; both passes run in C, the Python loop is per run rather than per byte.
+        classes = data.translate(BYTE_STYLE_TABLE)
+        styles = [esc[style] for style in BYTE_STYLES]
+        runs = "".join(
+            [
+                styles[classes[start]] + hex_value[2 * start : 2 * end]
+                for start, end in map(re.Match.span, BYTE_RUN_RE.finditer(classes))
+            ]
+        )
+        return f'"{runs}{reset}"'
+
+    def _key_fragment(self, key):
+        """Returns the cached `(colorized "key":, is_bytes_field)` pair for `key`."""
+        fragment = self._key_fragments.get(key)
+        if fragment is None:
+            if len(self._key_fragments) >= FRAGMENT_CACHE_SIZE:
+                self._key_fragments.clear()
+            esc = self.ansi_esc
+            is_bytes = (
+                key in ("Bytes", "Transport Data")
+                or "Manufacturer Specific Information" in key
+                or "Manufacturer Defined Usage" in key
+            )
+            fragment = (f'{esc["keys"]}"{key}"{esc["default"]}:', is_bytes)
+            self._key_fragments[key] = fragment
+        return fragment
+
+    def _value_fragment(self, value):
+        """Returns the colorized JSON of `value`, cached unless it is a measured value."""
+        if type(value) is not str or PLAIN_NUMBER_RE.fullmatch(value):
+            return self._format_other_value(value, False)
+        fragment = self._value_fragments.get(value)
+        if fragment is None:
+            fragment = self._format_other_value(value, False)
+            if len(self._value_fragments) >= FRAGMENT_CACHE_SIZE:
+                self._value_fragments.clear()
+            self._value_fragments[value] = fragment
+        return fragment
 
     def _format_other_value(self, value, highlight):
         res_parts = []
-        val_json = json.dumps(value)
+        # typed values (describe.SPNValue) are formatted only here, at render time
+        val_json = json.dumps(value, default=str)
         esc = self.ansi_esc
         h_style = esc.get("highlight", "") if highlight else ""
         reset = esc["default"]
@@ -301,7 +353,16 @@ class HighPerformanceRenderer:
         """
         # Filter internal metadata
         filtered_desc = {k: v for k, v in description.items() if not k.startswith("_")}
+        return self.render_fields(filtered_desc, indent, can_line, highlight)
+
+    def render_fields(
+        self, filtered_desc, indent=False, can_line=None, highlight=False
+    ):
+        """Renders a description whose internal `_` metadata has already been filtered out.
 
+        See `render`; callers that already hold the filtered fields (e.g. output sinks) skip
+        filtering them again.
+        """
         if not self.color_system:
             return self._render_json_output(filtered_desc, indent, can_line)
 
@@ -332,25 +393,31 @@ class HighPerformanceRenderer:
         reset = esc["default"]
         h_style = esc.get("highlight", "") if highlight else ""
 
+        key_fragments = self._key_fragments
+        key_fragment = self._key_fragment
+        value_fragments = self._value_fragments
+        value_fragment = self._value_fragment
+        separator = "," + indent_str if indent else ","
+        colon_space = " " if indent else ""
+
         for key, value in filtered_desc.items():
             if not first:
-                res_parts.append(",")
-                if indent:
-                    res_parts.append(indent_str)
+                res_parts.append(separator)
 
-            style_key = h_style if highlight else esc["keys"]
-            res_parts.append(f'{style_key}"{key}"{reset}:')
-            if indent:
-                res_parts.append(" ")
+            fragment = key_fragments.get(key) or key_fragment(key)
+            if highlight:
+                res_parts.append(f'{h_style}"{key}"{reset}:')
+            else:
+                res_parts.append(fragment[0])
+            res_parts.append(colon_space)
 
-            if (
-                key in ("Bytes", "Transport Data")
-                or "Manufacturer Specific Information" in key
-                or "Manufacturer Defined Usage" in key
-            ):
+            if fragment[1]:
                 res_parts.append(self._format_bytes_value(value, highlight))
-            else:
+            elif highlight:
                 res_parts.append(self._format_other_value(value, highlight))
+            else:
+                cached = value_fragments.get(value) if type(value) is str else None
+                res_parts.append(cached or value_fragment(value))
 
             first = False
 
@@ -0,0 +1,112 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+
+from array import array
+
+__all__ = [
+    "NameIndex",
+]
+
+GRAM = 3
+
+# match ranks, best first
+EXACT, PREFIX, WORD, SUBSTRING = range(4)
+
+
+class NameIndex:
+    """Case-insensitive substring index over the names of database records.
+
+    Every name is split into its overlapping 3-character grams, and each gram maps to the
+    names containing it. A query only checks the names listed under its rarest gram instead
+    of scanning every name, so lookups against tens of thousands of SPN names take
+    microseconds. Queries shorter than a gram scan the (pre-lowercased) names.
+
+    A record can be indexed under several names (e.g. a PGN's label and its name); it
+    matches if any of them does.
+    """
+
+    __slots__ = ("_keys", "_texts", "_grams")
+
+    def __init__(self, entries=()):
+        """
+        Args:
+            entries (iterable): (key, name) pairs; empty names are skipped.
+        """
+        self._keys = []
+        self._texts = []
+        grams = {}
+        for key, name in entries:
+            if not name:
+                continue
+            text = name.lower()
+            doc = len(self._texts)
+            self._keys.append(key)
+            self._texts.append(text)
+            for gram in {text[i : i + GRAM] for i in range(len(text) - GRAM + 1)}:
+                postings = grams.get(gram)
+                if postings is None:
+                    grams[gram] = postings = []
+                postings.append(doc)
+        # ascending document ids, 4 bytes each
+        self._grams = {gram: array("i", docs) for gram, docs in grams.items()}
+
+    def __len__(self):
+        return len(self._texts)
+
+    def _candidates(self, query):
+        if len(query) < GRAM:
+            return range(len(self._texts))
+        rarest = None
+        for i in range(len(query) - GRAM + 1):
+            postings = self._grams.get(query[i : i + GRAM])
+            if postings is None:
+                return ()
+            if rarest is None or len(postings) < len(rarest):
+                rarest = postings
+        return rarest
+
+    def search(self, query, prefix=False, ranked=False):
+        """Finds the keys of the records with a name containing `query`.
+
+        Args:
+            query (str): Text to look for, case-insensitive.
+            prefix (bool): Only match names with a word starting with `query`.
+            ranked (bool): Order the keys by how well they match: an exact name first, then
+                names starting with the query, then names with a word starting with it, then
+                any other match; ties go to the shorter name, then to the smaller key.
+
+        Returns:
+            list: The matching keys, sorted by key unless `ranked`.
+        """
+        query = query.lower()
+        texts, keys = self._texts, self._keys
+        docs = [doc for doc in self._candidates(query) if query in texts[doc]]
+        if not (prefix or ranked):
+            return sorted({keys[doc] for doc in docs})
+        best = {}
+        for doc in docs:
+            text = texts[doc]
+            start = text.find(query)
+            if text == query:
+                rank = EXACT
+            elif start == 0:
+                rank = PREFIX
+            else:
+                # look for a later occurrence starting a word
+                rank = SUBSTRING
+                while start > 0:
+                    if not text[start - 1].isalnum():
+                        rank = WORD
+                        break
+                    start = text.find(query, start + 1)
+            if prefix and rank == SUBSTRING:
+                continue
+            key = keys[doc]
+            score = (rank, len(text))
+            if key not in best or score < best[key]:
+                best[key] = score
+        if ranked:
+            return sorted(best, key=lambda k: (best[k], k))
+        return sorted(best)
@@ -0,0 +1,311 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+
+import heapq
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "merge_by_timestamp",
+    "ReorderBuffer",
+    "BoundedQueue",
+    "BusReceiver",
+    "BackgroundWriter",
+    "DROP_POLICIES",
+]
+
+DROP_POLICIES = ("drop-oldest", "drop-newest", "block")
+DEFAULT_QUEUE_SIZE = 10000
+
+
+def _frame_timestamp(frame):
+    return frame[0]
+
+
+def merge_by_timestamp(*sources):
+    """Lazily merges several streams of parsed frames into one timestamp-ordered stream.
+
+    Each source must already be in (approximately) ascending timestamp order, as candump
+    captures are. Only one frame per source is held in memory at a time.
+
+    Args:
+        *sources: Iterables of parsed frames, tuples whose first element is the timestamp.
+
+    Returns:
+        iterator: The interleaved frames in timestamp order.
+    """
+    return heapq.merge(*sources, key=_frame_timestamp)
+
+
+class ReorderBuffer:
+    """Bounded re-sequencing stage for frames with small timestamp inversions.
+
+    USB adapters and merged multi-adapter captures often deliver frames slightly out of order,
+    which confuses transport reassembly and dt calculations. Frames are held in a heap and
+    released in timestamp order once they fall out of the window. The window is given in
+    milliseconds of capture time, in frames, or both (whichever releases first); memory is
+    bounded by the window.
+
+    Frames that arrive after a newer frame has already been released cannot be fixed; they
+    are passed through immediately and counted as late.
+    """
+
+    def __init__(self, window_ms=None, window_frames=None):
+        if window_ms is None and window_frames is None:
+            raise ValueError("Error: a reorder window in ms or frames is required")
+        if window_ms is not None and window_ms < 0:
+            raise ValueError("Error: reorder window must not be negative")
+        if window_frames is not None and window_frames < 1:
+            raise ValueError("Error: reorder window must be at least one frame")
+        self.window_s = window_ms / 1000.0 if window_ms is not None else None
+        self.window_frames = window_frames
+
+        self.reordered = 0  # frames that arrived older than the newest frame seen
+        self.late = 0  # frames that arrived older than the last frame released
+        self.max_depth = 0
+
+        self._heap = []
+        self._seq = 0
+        self._newest = None
+        self._last_released = None
+
+    def push(self, frame):
+        """Adds a frame and returns the list of frames that are now ready, oldest first."""
+        timestamp = frame[0]
+        if self._newest is None or timestamp >= self._newest:
+            self._newest = timestamp
+        else:
+            self.reordered += 1
+            if self._last_released is not None and timestamp < self._last_released:
+                self.late += 1
+                return [frame]
+
+        heapq.heappush(self._heap, (timestamp, self._seq, frame))
+        self._seq += 1
+        if len(self._heap) > self.max_depth:
+            self.max_depth = len(self._heap)
+
+        ready = []
+        heap = self._heap
+        while heap and (
+            (self.window_frames is not None and len(heap) > self.window_frames)
+            or (
+                self.window_s is not None and heap[0][0] <= self._newest - self.window_s
+            )
+        ):
+            ready.append(self._pop())
+        return ready
+
+    def flush(self):
+        """Releases every buffered frame in timestamp order."""
+        ready = []
+        while self._heap:
+            ready.append(self._pop())
+        return ready
+
+    def _pop(self):
+        timestamp, _, frame = heapq.heappop(self._heap)
+        self._last_released = timestamp
+        return frame
+
+    def reorder(self, frames):
+        """Generator that re-sequences an iterable of frames through the buffer."""
+        for frame in frames:
+            yield from self.push(frame)
+        yield from self.flush()
+
+    def __len__(self):
+        return len(self._heap)
+
+
+class BoundedQueue:
+    """A bounded FIFO between two pipeline threads with a configurable overflow policy.
+
+    Policies:
+        drop-oldest: discard the oldest queued item to make room (keeps output current).
+        drop-newest: discard the item being added.
+        block: wait for room; back-pressure propagates to the producer.
+    """
+
+    def __init__(self, maxsize=DEFAULT_QUEUE_SIZE, drop_policy="drop-oldest"):
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(
+                f"Error: unknown drop policy '{drop_policy}' "
+                f"(expected one of {', '.join(DROP_POLICIES)})"
+            )
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.drop_policy = drop_policy
+        self.dropped = 0
+        self.max_depth = 0
+
+    def put(self, item):
+        q = self.queue
+        if self.drop_policy == "block":
+            q.put(item)
+        else:
+            try:
+                q.put_nowait(item)
+            except queue.Full:
+                self.dropped += 1
+                if self.drop_policy == "drop-newest":
+                    return
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    pass
+                try:
+                    q.put_nowait(item)
+                except queue.Full:
+                    # the consumer can't have refilled it; another producer did
+                    self.dropped += 1
+                    return
+        depth = q.qsize()
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    def get(self, timeout=None):
+        """Returns the next item, raising queue.Empty after `timeout` seconds."""
+        return self.queue.get(timeout=timeout)
+
+    @property
+    def depth(self):
+        return self.queue.qsize()
+
+
+class BusReceiver:
+    """Receives frames from a python-can bus on a dedicated thread.
+
+    Draining the bus independently of decoding and output keeps the socket receive buffer
+    empty when the terminal (or anything else downstream) is slow. Frames are handed over
+    through a BoundedQueue; use recv() like can.BusABC.recv, or iterate the receiver.
+    """
+
+    def __init__(
+        self,
+        bus,
+        maxsize=DEFAULT_QUEUE_SIZE,
+        drop_policy="drop-oldest",
+        poll_interval=0.1,
+    ):
+        self.bus = bus
+        self.queue = BoundedQueue(maxsize, drop_policy)
+        self.poll_interval = poll_interval
+        self.received = 0
+        # monotonic time at which the frame most recently returned by recv() was received
+        self.last_received_at = None
+        self.error = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._run, name="pretty_j1939-receiver", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        try:
+            while not self._stop.is_set():
+                msg = self.bus.recv(timeout=self.poll_interval)
+                if msg is not None:
+                    self.received += 1
+                    self.queue.put((time.monotonic(), msg))
+        except Exception as e:
+            logger.debug(f"Receive thread stopped on error: {e}")
+            self.error = e
+            self._stop.set()
+
+    def recv(self, timeout=None):
+        """Returns the next received frame, or None if none arrived within `timeout`."""
+        try:
+            self.last_received_at, msg = self.queue.get(timeout=timeout)
+        except queue.Empty:
+            if self.error is not None:
+                raise self.error
+            return None
+        return msg
+
+    def __iter__(self):
+        while True:
+            msg = self.recv(timeout=self.poll_interval)
+            if msg is not None:
+                yield msg
+            elif self._stop.is_set() and self.queue.depth == 0:
+                return
+
+
+class BackgroundWriter:
+    """Runs output on a dedicated thread so a slow sink doesn't stall decoding.
+
+    Items are queued as (received_at, args) and passed to `write(*args)` in order. When
+    received_at (a time.monotonic() stamp) is given, the end-to-end latency from reception
+    to output is accumulated.
+    """
+
+    _CLOSE = object()
+
+    def __init__(self, write, maxsize=DEFAULT_QUEUE_SIZE, drop_policy="block"):
+        self.write = write
+        self.queue = BoundedQueue(maxsize, drop_policy)
+        self.written = 0
+        self.latency_count = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.error = None
+        self._thread = threading.Thread(
+            target=self._run, name="pretty_j1939-writer", daemon=True
+        )
+        self._thread.start()
+
+    def put(self, *args, received_at=None):
+        if self.error is not None:
+            raise self.error
+        self.queue.put((received_at, args))
+
+    def close(self):
+        """Writes out everything queued so far and stops the thread."""
+        self.queue.queue.put(self._CLOSE)
+        self._thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def _run(self):
+        get = self.queue.get
+        while True:
+            item = get()
+            if item is self._CLOSE:
+                return
+            received_at, args = item
+            if self.error is not None:
+                continue
+            try:
+                self.write(*args)
+            except Exception as e:
+                self.error = e
+                continue
+            self.written += 1
+            if received_at is not None:
+                latency = time.monotonic() - received_at
+                self.latency_count += 1
+                self.latency_total += latency
+                if latency > self.latency_max:
+                    self.latency_max = latency
+
+    @property
+    def latency_avg(self):
+        if not self.latency_count:
+            return 0.0
+        return self.latency_total / self.latency_count
@@ -22,8 +22,10 @@ except ImportError:
 if TYPE_CHECKING:
     import can
 
-from .describe import get_describer, J1939Filter
+from .describe import get_describer, DatabaseReloader, J1939Filter
+from .plugins import load_plugins
 from .render import HighPerformanceRenderer, NUM_IN_PARENS_RE
+from .stream import BusReceiver
 
 logger = logging.getLogger("pretty_j1939.viewer")
 
@@ -97,6 +99,7 @@ class UIState:
         self.active_logging_ids: Set[int] = set()
         self.log_file_handle = None
         self.log_filename: str = ""
+        self.status: str = ""
 
 
 # --- Main Viewer Class ---
@@ -110,12 +113,16 @@ class J1939Viewer:
         describer,
         theme_name: Optional[str] = None,
         j1939_filter: Optional[J1939Filter] = None,
+        watch_da_json: bool = False,
     ):
         self.stdscr = stdscr
         self.bus = bus
         self.describer = describer
         self.j1939_filter = j1939_filter
         self.ui = UIState()
+        self.reloader = None
+        if watch_da_json:
+            self.reloader = DatabaseReloader(describer, report=self._set_status)
 
         # Theme and Colors
         renderer = HighPerformanceRenderer(theme_dict=theme_name, color_system=None)
@@ -129,6 +136,9 @@ class J1939Viewer:
 
         self.run()
 
+    def _set_status(self, message: str):
+        self.ui.status = message
+
     def _safe_addstr(self, *args, win=None):
         """Wrapper for addstr that handles exceptions."""
         if not args:
@@ -218,6 +228,8 @@ class J1939Viewer:
             )
         elif self.ui.selection_cursor is not None:
             text += f" [SELECT: {len(self.ui.marked_ids)} marked]"
+        if self.ui.status:
+            text += f" | {self.ui.status}"
 
         self._safe_addstr(0, 0, text[: self.screen_w], curses.A_BOLD)
 
@@ -800,7 +812,7 @@ class J1939Viewer:
 
     def _process_message(self, msg: can.Message):
         """Decodes message and updates internal state."""
-        new_desc = self.describer(msg.data, msg.arbitration_id)
+        new_desc = self.describer(msg.data, msg.arbitration_id, interface=msg.channel)
         if not new_desc:
             return
 
@@ -860,22 +872,36 @@ class J1939Viewer:
     def run(self):
         """Main application loop."""
         self._draw_header()
-        while True:
-            if not self.ui.paused:
-                msg = self.bus.recv(timeout=REFRESH_RATE_MS)
-                if msg:
-                    self._process_message(msg)
-            else:
-                time.sleep(REFRESH_RATE_MS)
+        # Drain the bus on its own thread so drawing (or pausing) doesn't overflow the
+        # socket receive buffer; while paused the oldest frames are dropped instead.
+        receiver = BusReceiver(self.bus, drop_policy="drop-oldest").start()
+        if self.reloader is not None:
+            self.reloader.start()
+        try:
+            while True:
+                # a database rebuilt by --watch-da-json is swapped in between frames
+                if self.reloader is not None and self.reloader.pending is not None:
+                    self.reloader.apply()
+                    self._redraw_all()
+                if not self.ui.paused:
+                    msg = receiver.recv(timeout=REFRESH_RATE_MS)
+                    if msg:
+                        self._process_message(msg)
+                else:
+                    time.sleep(REFRESH_RATE_MS)
 
-            if not self._handle_input():
-                break
+                if not self._handle_input():
+                    break
 
-            if curses.is_term_resized(self.screen_h, self.screen_w):
-                self.screen_h, self.screen_w = self.stdscr.getmaxyx()
-                if hasattr(curses, "resizeterm"):
-                    curses.resizeterm(self.screen_h, self.screen_w)
-                self._redraw_all()
+                if curses.is_term_resized(self.screen_h, self.screen_w):
+                    self.screen_h, self.screen_w = self.stdscr.getmaxyx()
+                    if hasattr(curses, "resizeterm"):
+                        curses.resizeterm(self.screen_h, self.screen_w)
+                    self._redraw_all()
+        finally:
+            receiver.stop()
+            if self.reloader is not None:
+                self.reloader.stop()
 
         self._stop_logging()
         self.bus.shutdown()
@@ -921,6 +947,7 @@ def main():
                     }
                 )
 
+    load_plugins(getattr(args, "decoders", None))
     describer = get_describer(
         da_json=args.da_json,
         describe_pgns=args.pgn,
@@ -932,6 +959,7 @@ def main():
         include_na=args.include_na,
         include_raw_data=args.include_raw_data,
         enable_isotp=args.enable_isotp,
+        db_cache=getattr(args, "db_cache", True),
     )
 
     pgn_list = _parse_list_args(args.filter_pgn)
@@ -963,6 +991,7 @@ def main():
             describer,
             theme_name=args.theme,
             j1939_filter=j1939_filter,
+            watch_da_json=getattr(args, "watch_da_json", False),
         )
     except (can.CanError, ValueError, RuntimeError) as e:
         print(f"Error: {e}", file=sys.stderr)
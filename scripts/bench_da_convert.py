@@ -0,0 +1,121 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+"""Benchmark of Digital Annex .xlsx to J1939db conversion.
+
+Usage: python scripts/bench_da_convert.py [digital_annex.xlsx ...] [--rows N]
+
+Without arguments, a synthetic Digital Annex whose "SPNs & PGNs" sheet has 40000 rows is
+converted. Reports the conversion time and the peak memory of the converter.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import openpyxl
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from pretty_j1939.create_j1939db_json import J1939daConverter  # noqa: E402
+
+HEADER = [
+    "PGN",
+    "Parameter Group Label",
+    "Acronym",
+    "PGN Data Length",
+    "Transmission Rate",
+    "SPN Position in PGN",
+    "SPN",
+    "SPN Name",
+    "SPN Description",
+    "SPN Length",
+    "Resolution",
+    "Offset",
+    "Data Range",
+    "Operational Range",
+    "Units",
+]
+
+
+def make_synthetic_da(path, rows, seed=0):
+    rng = random.Random(seed)
+    book = openpyxl.Workbook(write_only=True)
+    sheet = book.create_sheet("SPNs & PGNs")
+    sheet.append(["SAE J1939 Digital Annex (synthetic)"])
+    sheet.append(HEADER)
+    spns_per_pgn = 8
+    for r in range(rows):
+        pgn = 0xF000 + r // spns_per_pgn
+        position = r % spns_per_pgn
+        bitmapped = rng.random() < 0.3
+        sheet.append(
+            [
+                pgn,
+                f"Synthetic Parameter Group {pgn}",
+                f"SYN{pgn}",
+                "8 bytes",
+                "100 ms",
+                f"{position + 1}" if not bitmapped else f"{position + 1}.1",
+                10000 + r,
+                f"Synthetic Parameter {r}",
+                (
+                    "Status of the synthetic parameter.\r\n00 = Off\r\n01 = On\r\n"
+                    "10 = Error\r\n11 = Not available"
+                    if bitmapped
+                    else f"Synthetic measured value {r}_x000D_ with some description."
+                ),
+                "2 bits" if bitmapped else "1 byte",
+                "4 states/2 bit" if bitmapped else "0.5 km/h per bit",
+                "0" if bitmapped else "-10 km/h",
+                "0 to 3" if bitmapped else "-10 to 117.5 km/h",
+                "",
+                "bit" if bitmapped else "km/h",
+            ]
+        )
+    addresses = book.create_sheet("Global Source Addresses (B2)")
+    addresses.append(["Source Address ID", "Name"])
+    for sa in range(254):
+        addresses.append([sa, f"Controller #{sa}"])
+    book.save(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("workbooks", nargs="*")
+    parser.add_argument("--rows", type=int, default=40000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workbooks = args.workbooks
+        if not workbooks:
+            workbooks = [os.path.join(tmp_dir, "synthetic.xlsx")]
+            make_synthetic_da(workbooks[0], args.rows)
+        size_mb = sum(os.path.getsize(workbook) for workbook in workbooks) / 1e6
+
+        output = os.path.join(tmp_dir, "out.json")
+        start = time.perf_counter()
+        converter = J1939daConverter(workbooks)
+        converter.convert(output)
+        converter.close()
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        converter = J1939daConverter(workbooks)
+        converter.convert(output)
+        converter.close()
+        peak_mb = tracemalloc.get_traced_memory()[1] / 1e6
+        tracemalloc.stop()
+        print(
+            f"{size_mb:.1f} MB workbook converted in {elapsed:.2f} s, "
+            f"peak {peak_mb:.0f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
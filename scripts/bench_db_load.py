@@ -0,0 +1,164 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+"""Benchmark of J1939db loading: parsing the JSON versus the lazily loaded compiled cache.
+
+Usage: python scripts/bench_db_load.py [J1939db.json ...] [--repeat N]
+
+Without arguments, the bundled database and a synthetic database the size of a full
+Digital Annex (about 10k PGNs and 40k SPNs) are measured: get_describer() time, the
+memory a describer retains after decoding a few frames, and the memory of the PGN and SPN
+records as JSON dicts and as slotted records.
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from pretty_j1939.describe import compile_j1939db, get_describer  # noqa: E402
+
+SAMPLE_FRAMES = [
+    "0CF00400#0041FF20481400F0",  # EEC1
+    "18FEF100#F7C0180000000000",  # CCVS
+    "18FEEE00#7F80FFFFFFFFFFFF",  # ET1
+    "18FECA00#0000FFFF00000000",  # DM1
+]
+BUNDLED_DB = os.path.join(
+    os.path.dirname(__file__), "..", "pretty_j1939", "J1939db.json"
+)
+
+
+def make_synthetic_db(path, pgns=10000, spns=40000, seed=0):
+    rng = random.Random(seed)
+    spn_db = {}
+    for spn in range(1, spns + 1):
+        length = rng.choice((1, 2, 4, 8, 16, 32))
+        spn_db[str(spn)] = {
+            "Name": f"Synthetic Parameter {spn} Of Some Engine Subsystem",
+            "Units": rng.choice(("rpm", "kPa", "deg C", "%", "bit", "km/h")),
+            "SPNLength": length,
+            "Resolution": rng.choice((1, 0.5, 0.125, 0.03125)),
+            "Offset": rng.choice((0, -40, -125, -273)),
+            "OperationalLow": 0,
+            "OperationalHigh": 2**length - 1,
+            "DataRange": "0 to 250.996 %",
+            "OperationalRange": "",
+        }
+    pgn_db = {}
+    spn_list = list(range(1, spns + 1))
+    for pgn in range(pgns):
+        members = rng.sample(spn_list, 4)
+        pgn_db[str(pgn * 8)] = {
+            "Label": f"SYN{pgn}",
+            "Name": f"Synthetic Parameter Group {pgn}",
+            "PGNLength": "8",
+            "Rate": "100 ms",
+            "SPNs": members,
+            "SPNStartBits": [[0], [16], [32], [48]],
+        }
+    bit_db = {
+        str(spn): {str(v): f"State {v}" for v in range(4)}
+        for spn in range(1, spns + 1, 8)
+    }
+    sa_db = {str(sa): f"Controller {sa}" for sa in range(256)}
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "J1939PGNdb": pgn_db,
+                "J1939SPNdb": spn_db,
+                "J1939BitDecodings": bit_db,
+                "J1939SATabledb": sa_db,
+            },
+            f,
+        )
+
+
+def load(path, repeat, **kwargs):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        describer = get_describer(da_json=path, **kwargs)
+    elapsed_ms = (time.perf_counter() - start) / repeat * 1e3
+
+    # memory retained by a describer after decoding a few common PGNs
+    gc.collect()
+    tracemalloc.start()
+    describer = get_describer(da_json=path, **kwargs)
+    for frame in SAMPLE_FRAMES:
+        can_id, data = frame.split("#", 1)
+        describer(bytes.fromhex(data), int(can_id, 16))
+    retained_mb = tracemalloc.get_traced_memory()[0] / 1e6
+    tracemalloc.stop()
+    return elapsed_ms, retained_mb
+
+
+def records_memory(path):
+    """Memory held by the PGN and SPN tables, as JSON dicts and as PGNSpec/SPNSpec."""
+    with open(path) as f:
+        raw = f.read()
+    sizes = []
+    for build in (
+        lambda j1939db: {
+            name: {int(k): v for k, v in j1939db.get(key, {}).items()}
+            for name, key in (("pgn", "J1939PGNdb"), ("spn", "J1939SPNdb"))
+        },
+        lambda j1939db: {
+            name: compile_j1939db(j1939db)[name]
+            for name in ("pgn_objects", "spn_objects")
+        },
+    ):
+        gc.collect()
+        tracemalloc.start()
+        tables = build(json.loads(raw))  # noqa: F841
+        gc.collect()
+        sizes.append(tracemalloc.get_traced_memory()[0] / 1e6)
+        tracemalloc.stop()
+        del tables
+    return sizes
+
+
+def bench(label, path, repeat, cache_dir):
+    size_mb = os.path.getsize(path) / 1e6
+    get_describer(da_json=path, db_cache_dir=cache_dir)  # build the cache
+    json_ms, json_mb = load(path, repeat, db_cache=False)
+    cached_ms, cached_mb = load(path, repeat, db_cache_dir=cache_dir)
+    print(
+        f"{label:20s} {size_mb:6.2f} MB JSON | "
+        f"parse {json_ms:8.2f} ms {json_mb:7.2f} MB | "
+        f"cache {cached_ms:8.2f} ms {cached_mb:7.2f} MB"
+    )
+    dict_mb, spec_mb = records_memory(path)
+    print(
+        f"{'':20s} PGN/SPN records: dicts {dict_mb:7.2f} MB, "
+        f"slotted {spec_mb:7.2f} MB ({1 - spec_mb / dict_mb:4.0%} less)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("databases", nargs="*")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_dir = os.path.join(tmp_dir, "cache")
+        if args.databases:
+            databases = [(os.path.basename(p), p) for p in args.databases]
+        else:
+            synthetic = os.path.join(tmp_dir, "synthetic.json")
+            make_synthetic_db(synthetic)
+            databases = [("bundled", BUNDLED_DB), ("synthetic full-size", synthetic)]
+        for label, path in databases:
+            bench(label, path, args.repeat, cache_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+"""Benchmark of DBC to J1939db conversion.
+
+Usage: python scripts/bench_dbc_import.py [file.dbc ...] [--messages N] [--signals N]
+
+Without arguments, a synthetic DBC of 5000 messages with 10 signals each (about 6 MB) is
+converted. Reports the conversion time and the peak memory of the converter.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from pretty_j1939.create_j1939db_from_dbc import DbcConverter  # noqa: E402
+
+
+def message_id(m):
+    # unique PDU2 PGNs, on both data pages, from SA 3
+    pgn = ((m // 4096) << 16) | (0xF000 + m % 4096)
+    return 0x80000000 | (6 << 26) | (pgn << 8) | 3
+
+
+def make_synthetic_dbc(path, messages, signals, seed=0):
+    rng = random.Random(seed)
+    with open(path, "w") as f:
+        f.write('VERSION ""\n\nBS_:\n\nBU_: ECU Tester\n\n')
+        for m in range(messages):
+            f.write(f"BO_ {message_id(m)} MSG_{m}: 8 ECU\n")
+            for s in range(signals):
+                start, length = (s * 6) % 58, rng.choice((1, 2, 4, 6))
+                f.write(
+                    f' SG_ Signal_{m}_{s} : {start}|{length}@1+ (0.5,-10) [0|100] "rpm"'
+                    f" Tester\n"
+                )
+            f.write("\n")
+        for m in range(messages):
+            f.write(f'CM_ BO_ {message_id(m)} "Synthetic message {m}";\n')
+            f.write(f'VAL_ {message_id(m)} Signal_{m}_0 0 "Off" 1 "On" ;\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("dbcs", nargs="*")
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--signals", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        dbcs = args.dbcs
+        if not dbcs:
+            dbcs = [os.path.join(tmp_dir, "synthetic.dbc")]
+            make_synthetic_dbc(dbcs[0], args.messages, args.signals)
+        size_mb = sum(os.path.getsize(dbc) for dbc in dbcs) / 1e6
+
+        output = os.path.join(tmp_dir, "out.json")
+        start = time.perf_counter()
+        DbcConverter(dbcs).convert(output)
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        DbcConverter(dbcs).convert(output)
+        peak_mb = tracemalloc.get_traced_memory()[1] / 1e6
+        tracemalloc.stop()
+        print(
+            f"{size_mb:.1f} MB DBC converted in {elapsed:.2f} s, peak {peak_mb:.0f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
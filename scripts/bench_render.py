@@ -0,0 +1,116 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+"""Micro-benchmark of HighPerformanceRenderer: per-frame render cost of decoded frames.
+
+Usage: python scripts/bench_render.py [candump.log] [--repeat N]
+
+Without a log, a fixed mix of common PGNs is rendered.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from pretty_j1939.describe import get_describer  # noqa: E402
+from pretty_j1939.render import HighPerformanceRenderer  # noqa: E402
+
+SAMPLE_FRAMES = [
+    "0CF00400#0041FF20481400F0",  # EEC1
+    "18FEF100#F7C0180000000000",  # CCVS
+    "18FEE000#FFFFFFFF42F40C00",  # VD
+    "18FEEE00#7F80FFFFFFFFFFFF",  # ET1
+    "18FEEF00#FFFFFF5CFFFFFFFF",  # EFL/P1
+    "18FECA00#0000FFFF00000000",  # DM1
+    "0CF00300#D10000FFFFFFFFFF",  # EEC2
+    "18FEF200#0000000000000000",  # LFE
+]
+
+
+def load_descriptions(path=None):
+    describer = get_describer(include_transport_rawdata=True)
+    if path is None:
+        frames = SAMPLE_FRAMES
+    else:
+        with open(path) as f:
+            frames = [p for line in f for p in line.split() if "#" in p[1:]]
+    descriptions = []
+    for frame in frames:
+        can_id, data = frame.split("#", 1)
+        description = describer(bytes.fromhex(data), int(can_id, 16))
+        if description:
+            descriptions.append(description)
+    return descriptions
+
+
+def bench(renderer, descriptions, repeat, **kwargs):
+    render = renderer.render
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for description in descriptions:
+            render(description, **kwargs)
+    elapsed = time.perf_counter() - start
+    return elapsed / (repeat * len(descriptions)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("log", nargs="?")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    descriptions = load_descriptions(args.log)
+    if not descriptions:
+        sys.exit(f"no frames decoded from {args.log or 'the samples'}")
+
+    renderer = HighPerformanceRenderer(color_system="truecolor")
+    print(f"{len(descriptions)} frames x {args.repeat}")
+    for label, kwargs in (
+        ("color", {}),
+        ("color, indent", {"indent": True}),
+        ("color, highlight", {"highlight": True}),
+    ):
+        print(
+            f"{label:20s} {bench(renderer, descriptions, args.repeat, **kwargs):8.2f} us/frame"
+        )
+
+    # a status PGN whose fields are almost all bit-encoded states, as rendered per frame
+    description = {
+        "PGN": "CCVS1(65265)",
+        "SA": "Engine #1(  0)",
+        "DA": "All(255)",
+        "Two Speed Axle Switch": "0 (Low speed range)",
+        "Parking Brake Switch": "1 (Parking brake set)",
+        "Cruise Control Pause Switch": "3 (Not available)",
+        "Park Brake Release Inhibit Request": "0 (Off)",
+        "Wheel-Based Vehicle Speed": "24.0 [km/h]",
+        "Cruise Control Active": "0 (Off)",
+        "Cruise Control Enable Switch": "1 (On)",
+        "Brake Switch": "0 (Pedal released)",
+        "Clutch Switch": "0 (Pedal released)",
+        "Cruise Control States": "0 (Off/Disabled)",
+        "PTO Governor State": "31 (Not available)",
+    }
+    print(
+        f"{'enum-heavy PGN':20s} {bench(renderer, [description], args.repeat * 8):8.2f} us/frame"
+    )
+
+    # a maximum-size (1785 byte) BAM payload, as text and as arbitrary binary data
+    rng = random.Random(0)
+    for label, payload in (
+        ("1785B ASCII payload", (b"SOFTWARE-ID*" * 149)[:1784] + b"\x00"),
+        ("1785B random payload", bytes(rng.randrange(256) for _ in range(1785))),
+    ):
+        description = {"PGN": "SOFT(65242)", "Transport Data": payload.hex().upper()}
+        print(
+            f"{label:20s} {bench(renderer, [description], args.repeat):8.2f} us/frame"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+"""Benchmark of PGN and SPN name search: scanning every record versus the NameIndex.
+
+Usage: python scripts/bench_search.py [J1939db.json] [--repeat N]
+
+Without a database, the synthetic full-size one of bench_db_load.py is used. Reports the
+one-off index build time, then the time of each query with both approaches.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from bench_db_load import make_synthetic_db  # noqa: E402
+from pretty_j1939.describe import get_describer  # noqa: E402
+
+QUERIES = ["eec1", "engine", "parameter 123", "temperature", "xyzzy", "gr"]
+
+
+def scan_pgns(da_describer, query):
+    # the linear search resolve_pgn used before the index
+    query = query.lower()
+    return sorted(
+        pgn
+        for pgn, obj in da_describer.pgn_objects.items()
+        if query in obj.label.lower() or query in obj.name.lower()
+    )
+
+
+def scan_spns(da_describer, query):
+    query = query.lower()
+    return sorted(
+        spn
+        for spn, obj in da_describer.spn_objects.items()
+        if query in obj.name.lower()
+    )
+
+
+def query_us(fn, query, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(query)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("database", nargs="?")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = args.database
+        if path is None:
+            path = os.path.join(tmp_dir, "synthetic.json")
+            make_synthetic_db(path)
+        da = get_describer(da_json=path, db_cache_dir=tmp_dir).da_describer
+
+        for label, scan, resolve in (
+            ("PGN", scan_pgns, da.resolve_pgn),
+            ("SPN", scan_spns, da.resolve_spn),
+        ):
+            start = time.perf_counter()
+            resolve("")  # builds the index
+            build_ms = (time.perf_counter() - start) * 1e3
+            for query in QUERIES:
+                assert resolve(query) == scan(da, query), query
+            print(f"{label}: index built in {build_ms:.1f} ms")
+            for query in QUERIES:
+                scan_us = query_us(lambda q: scan(da, q), query, args.repeat)
+                index_us = query_us(resolve, query, args.repeat)
+                print(
+                    f"  {query!r:16s} {len(resolve(query)):6d} matches | "
+                    f"scan {scan_us:9.1f} us | index {index_us:9.1f} us"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+"""Benchmark of database startup and memory in decoding worker processes.
+
+Usage: python scripts/bench_workers.py [J1939db.json] [--workers N]
+
+Each worker creates a describer and decodes a few frames, then reports its startup time and
+its proportional set size (PSS: shared pages are split between the processes sharing them,
+Linux only). Without a database, the synthetic full-size one of bench_db_load.py is used.
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from bench_db_load import SAMPLE_FRAMES, make_synthetic_db  # noqa: E402
+from pretty_j1939.describe import get_describer, preload_j1939db  # noqa: E402
+
+
+def pss_mb():
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return float("nan")
+
+
+def worker(path, kwargs, start_event, results):
+    start_event.wait()
+    start = time.perf_counter()
+    describer = get_describer(da_json=path, **kwargs)
+    startup_ms = (time.perf_counter() - start) * 1e3
+    for frame in SAMPLE_FRAMES:
+        can_id, data = frame.split("#", 1)
+        describer(bytes.fromhex(data), int(can_id, 16))
+    results.put((startup_ms, pss_mb()))
+    start_event.wait()  # stay alive until every worker has measured its PSS
+
+
+def run(label, path, workers, preload=False, **kwargs):
+    # without a preload, spawn the workers so they don't inherit this process' tables
+    context = multiprocessing.get_context("fork" if preload else "spawn")
+    if preload:
+        preload_j1939db(path, **kwargs)
+    start_event, results = context.Event(), context.Queue()
+    processes = [
+        context.Process(target=worker, args=(path, kwargs, start_event, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    start_event.set()
+    measured = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    startup_ms = sum(m[0] for m in measured) / workers
+    total_pss = sum(m[1] for m in measured)
+    print(
+        f"{label:28s} startup {startup_ms:8.2f} ms/worker  "
+        f"PSS {total_pss:8.1f} MB total, {total_pss / workers:6.1f} MB/worker"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("database", nargs="?")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = args.database
+        if path is None:
+            path = os.path.join(tmp_dir, "synthetic.json")
+            make_synthetic_db(path)
+        cache_dir = os.path.join(tmp_dir, "cache")
+        get_describer(da_json=path, db_cache_dir=cache_dir)  # build the cache
+
+        print(f"{args.workers} workers")
+        run("parse JSON, spawned", path, args.workers, db_cache=False)
+        run("cache, spawned", path, args.workers, db_cache_dir=cache_dir)
+        run(
+            "preloaded cache, forked",
+            path,
+            args.workers,
+            preload=True,
+            db_cache_dir=cache_dir,
+        )
+
+
+if __name__ == "__main__":
+    main()
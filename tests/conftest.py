@@ -0,0 +1,12 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_db_cache(tmp_path_factory, monkeypatch):
+    """Keeps compiled database caches of the test databases out of the user's cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.getbasetemp() / "cache"))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path_factory.getbasetemp() / "cache"))
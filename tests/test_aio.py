@@ -0,0 +1,126 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import can
+import pytest
+
+from pretty_j1939.aio import describe_frames, describe_bus
+from pretty_j1939.describe import get_describer
+
+EEC1_DATA = b"\x00\x41\xff\x20\x48\x14\x00\xf0"
+
+
+async def _frames(count):
+    for _ in range(count):
+        yield EEC1_DATA, 0x0CF00400
+        await asyncio.sleep(0)
+
+
+def test_describe_frames_tuples():
+    async def run():
+        return [d async for d in describe_frames(_frames(5), batch_size=2)]
+
+    descriptions = asyncio.run(run())
+    assert len(descriptions) == 5
+    assert all(d["PGN"] == "EEC1(61444)" for d in descriptions)
+
+
+def test_describe_frames_executor():
+    async def run():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return [d async for d in describe_frames(_frames(3), executor=executor)]
+
+    assert len(asyncio.run(run())) == 3
+
+
+def test_describe_frames_backpressure():
+    """A consumer that stops early must not let the source run ahead unbounded."""
+    produced = []
+
+    async def source():
+        for i in range(1000):
+            produced.append(i)
+            yield EEC1_DATA, 0x0CF00400
+
+    async def run():
+        async for _ in describe_frames(source(), batch_size=1, max_pending=4):
+            break
+
+    asyncio.run(run())
+    assert len(produced) < 20
+
+
+def test_describe_frames_source_error():
+    async def source():
+        yield EEC1_DATA, 0x0CF00400
+        raise OSError("adapter unplugged")
+
+    async def run():
+        return [d async for d in describe_frames(source())]
+
+    with pytest.raises(OSError):
+        asyncio.run(run())
+
+
+def test_describe_bus_virtual():
+    async def run():
+        with can.Bus(interface="virtual", channel="test_aio") as rx_bus, can.Bus(
+            interface="virtual", channel="test_aio"
+        ) as tx_bus:
+            descriptions = describe_bus(rx_bus, get_describer())
+            tx_bus.send(can.Message(arbitration_id=0x0CF00400, data=EEC1_DATA))
+            description = await asyncio.wait_for(descriptions.__anext__(), 5)
+            await descriptions.aclose()
+            return description
+
+    description = asyncio.run(run())
+    assert description["PGN"] == "EEC1(61444)"
+
+
+def test_describe_bus_stalled_consumer_is_bounded():
+    """Frames received while the consumer stalls are dropped, not buffered without limit."""
+
+    async def run():
+        with can.Bus(interface="virtual", channel="test_aio_stall") as rx_bus, can.Bus(
+            interface="virtual", channel="test_aio_stall"
+        ) as tx_bus:
+            descriptions = describe_bus(
+                rx_bus, get_describer(), max_buffered=8, batch_size=1, max_pending=1
+            )
+            tx_bus.send(can.Message(arbitration_id=0x0CF00400, data=EEC1_DATA))
+            await asyncio.wait_for(descriptions.__anext__(), 5)
+
+            # the consumer stalls while the bus keeps delivering frames
+            for sa in range(1, 101):
+                tx_bus.send(can.Message(arbitration_id=0x0CF00400 | sa, data=EEC1_DATA))
+            await asyncio.sleep(0.5)
+
+            received = []
+            try:
+                while True:
+                    description = await asyncio.wait_for(descriptions.__anext__(), 0.5)
+                    received.append(description["_sa"])
+            except asyncio.TimeoutError:
+                pass
+            await descriptions.aclose()
+            return received
+
+    received = asyncio.run(run())
+    # the bus buffer, the read-ahead queue and the frame being pumped
+    assert 0 < len(received) <= 8 + 1 + 1
+    assert received[-1] == 100
+    assert received == sorted(received)
+
+
+def test_describe_bus_rejects_block_policy():
+    async def run():
+        with can.Bus(interface="virtual", channel="test_aio_block") as bus:
+            async for _ in describe_bus(bus, drop_policy="block"):
+                pass
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())
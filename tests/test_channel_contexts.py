@@ -0,0 +1,65 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+from pretty_j1939.describe import get_describer
+
+
+def _name_payload(function_id, identity):
+    name_val = (function_id << 40) | (630 << 21) | identity
+    return name_val.to_bytes(8, byteorder="little")
+
+
+def test_transport_sessions_are_per_channel():
+    """Interleaved BAMs from the same SA on two buses must not corrupt each other."""
+    describer = get_describer()
+
+    # Both buses announce a 14-byte EEC1 BAM from SA 0
+    describer(b"\x20\x0e\x00\x02\xff\x04\xf0\x00", 0x18ECFF00, interface="can0")
+    describer(b"\x20\x0e\x00\x02\xff\x04\xf0\x00", 0x18ECFF00, interface="can1")
+
+    describer(b"\x01\x01\x02\x03\x04\x05\x06\x07", 0x18EBFF00, interface="can0")
+    describer(b"\x01\x11\x12\x13\x14\x15\x16\x17", 0x18EBFF00, interface="can1")
+
+    res0 = describer(b"\x02\x08\x09\x0a\x0b\x0c\x0d\x0e", 0x18EBFF00, interface="can0")
+    res1 = describer(b"\x02\x18\x19\x1a\x1b\x1c\x1d\x1e", 0x18EBFF00, interface="can1")
+
+    # each message is reassembled from its own bus's packets only:
+    # can0 01..0e -> speed 0x0504, torque 0x03; can1 11..1e -> speed 0x1514, torque 0x13
+    assert res0["_pgn"] == 61444
+    assert res0["Engine Speed"] == "160.5 [rpm]"
+    assert res0["Actual Engine - Percent Torque"] == "-122.0 [%]"
+    assert res1["_pgn"] == 61444
+    assert res1["Engine Speed"] == "674.5 [rpm]"
+    assert res1["Actual Engine - Percent Torque"] == "-106.0 [%]"
+    assert set(describer.contexts) == {"can0", "can1"}
+
+
+def test_name_tracking_is_per_channel():
+    describer = get_describer()
+
+    describer(_name_payload(0, 1), 0x18EEFF80, interface="can0")
+    describer(_name_payload(0, 2), 0x18EEFF80, interface="can1")
+
+    describer(b"\x00\x41\xff\x20\x48\x14\x00\xf0", 0x0CF00480, interface="can0")
+    assert "ID:1" in describer.da_describer.get_formatted_address_and_name(0x80)[1]
+
+    describer(b"\x00\x41\xff\x20\x48\x14\x00\xf0", 0x0CF00480, interface="can1")
+    assert "ID:2" in describer.da_describer.get_formatted_address_and_name(0x80)[1]
+
+
+def test_single_channel_summary_unchanged():
+    describer = get_describer()
+    describer(b"\x00\x41\xff\x20\x48\x14\x00\xf0", 0x0CF00400, interface="can0")
+
+    assert (0, 255, "Engine #1", None) in describer.get_summary()
+
+
+def test_multi_channel_summary_labels_channels():
+    describer = get_describer()
+    describer(b"\x00\x41\xff\x20\x48\x14\x00\xf0", 0x0CF00400, interface="can0")
+    describer(b"\x00\x41\xff\x20\x48\x14\x00\xf0", 0x0CF00400, interface="can1")
+
+    summary = describer.get_summary()
+    assert (0, 255, "Engine #1 [can0]", None) in summary
+    assert (0, 255, "Engine #1 [can1]", None) in summary
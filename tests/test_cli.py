@@ -496,6 +496,33 @@ def test_cli_custom_da_json_wellknown(tmp_path):
     assert "Custom PGN" in stdout or "CST" in stdout
 
 
+def test_cli_layered_da_json(tmp_path):
+    """Verify that repeated --da-json files are layered, later files taking precedence."""
+    import json
+
+    overlay = {
+        "J1939SATabledb": {"123": "Custom Controller"},
+        "J1939PGNdb": {"61444": {"Label": "CST", "Name": "Custom PGN", "SPNs": []}},
+    }
+    overlay_path = tmp_path / "overlay.json"
+    overlay_path.write_text(json.dumps(overlay))
+    db_path = os.path.join("pretty_j1939", "J1939db.json")
+    candump_line = (
+        " (1615397400.1) can0 0CF0047B#2A00000000000000\n"
+        " (1615397400.2) can0 18FEEE00#7F80FFFFFFFFFFFF\n"
+    )
+
+    stdout, stderr, code = run_cli(
+        ["-", "--da-json", db_path, "--da-json", str(overlay_path)]
+        + ["--no-summary", "--json", "--no-db-cache"],
+        stdin_content=candump_line,
+    )
+    assert code == 0
+    assert '"SA":"Custom Controller(123)"' in stdout
+    assert '"PGN":"CST(61444)"' in stdout
+    assert '"PGN":"ET1(65262)"' in stdout
+
+
 def test_cli_interleaved_tp_sessions():
     """Verify CLI reassembly when J1939-TP and ISO-TP sessions are interleaved."""
     # 1. J1939-TP (BAM) - PGN 65226 (DM1), 10 bytes
@@ -802,3 +829,229 @@ def test_process_messages_malformed(capsys, caplog):
         "Skipping malformed message due to decoding error" in log_text
         or "Skipping candump line due to decoding error" in log_text
     )
+
+
+def test_cli_merge_multiple_logs(tmp_path):
+    """Verify several logs are interleaved in timestamp order with their interfaces."""
+    can0_log = tmp_path / "can0.log"
+    can1_log = tmp_path / "can1.log"
+    can0_log.write_text(
+        "(1.000000) can0 0CF00400#0041FF20481400F0\n"
+        "(3.000000) can0 0CF00400#0041FF20481400F0\n"
+    )
+    can1_log.write_text(
+        "(2.000000) can1 18FEF100#FFFFFFFFFFFFFFFF\n"
+        "(4.000000) can1 18FEF100#FFFFFFFFFFFFFFFF\n"
+    )
+    db_path = os.path.join("pretty_j1939", "J1939db.json")
+
+    stdout, stderr, code = run_cli(
+        [
+            str(can0_log),
+            str(can1_log),
+            "--da-json",
+            db_path,
+            "--candata",
+            "--color",
+            "never",
+            "--no-summary",
+        ]
+    )
+
+    assert code == 0
+    lines = stdout.splitlines()
+    assert [line.split()[1] for line in lines] == ["can0", "can1", "can0", "can1"]
+    assert "EEC1(61444)" in lines[0]
+    assert "(65265)" in lines[1]
+
+
+def test_cli_write_file_matches_console(tmp_path):
+    """Verify --write emits the same rendering as the console, reformatted as candump."""
+    out_path = tmp_path / "out.txt"
+    stdin_data = "(1.000) can0 0CF00400#0041FF20481400F0\n"
+    db_path = os.path.join("pretty_j1939", "J1939db.json")
+
+    stdout, stderr, code = run_cli(
+        [
+            "-",
+            "--da-json",
+            db_path,
+            "--candata=candump",
+            "--color",
+            "never",
+            "--no-summary",
+            "--write",
+            str(out_path),
+        ],
+        stdin_content=stdin_data,
+    )
+
+    assert code == 0
+    assert stdout.startswith("(         1.000000) can0 0CF00400#0041FF20481400F0")
+    assert out_path.read_text() == stdout
+
+
+def test_cli_ndjson_output(tmp_path):
+    """Verify --output ndjson writes one parseable record per frame."""
+    import json
+
+    stdin_data = (
+        "(1.000) can0 0CF00400#0041FF20481400F0\n"
+        "(1.001) can1 18FEF100#FFFFFFFFFFFFFFFF\n"
+    )
+    db_path = os.path.join("pretty_j1939", "J1939db.json")
+
+    stdout, stderr, code = run_cli(
+        ["-", "--da-json", db_path, "--output", "ndjson", "--summary"],
+        stdin_content=stdin_data,
+    )
+
+    assert code == 0
+    records = [json.loads(line) for line in stdout.splitlines()]
+    assert len(records) == 2
+    assert records[0]["timestamp"] == 1.0
+    assert records[0]["interface"] == "can0"
+    assert records[0]["id"] == 0x0CF00400
+    assert records[0]["data"] == "0041FF20481400F0"
+    assert records[0]["fields"]["PGN"] == "EEC1(61444)"
+    assert records[0]["fields"]["_pgn"] == 61444
+    assert records[1]["interface"] == "can1"
+    # the summary goes to stderr so stdout stays NDJSON
+    assert "Engine #1" in stderr
+
+
+def test_cli_reorder_window():
+    """Verify small timestamp inversions are re-sequenced before decoding."""
+    stdin_data = (
+        "(1.000) can0 0CF00400#0041FF20481400F0\n"
+        "(1.003) can0 18FEF100#FFFFFFFFFFFFFFFF\n"
+        "(1.002) can0 18FEEE00#FFFFFFFFFFFFFFFF\n"
+    )
+    db_path = os.path.join("pretty_j1939", "J1939db.json")
+
+    stdout, stderr, code = run_cli(
+        ["-", "--da-json", db_path, "--candata", "--reorder-window", "5"],
+        stdin_content=stdin_data,
+    )
+
+    assert code == 0
+    timestamps = [line.split()[0] for line in stdout.splitlines()]
+    assert timestamps == ["(1.000)", "(1.002)", "(1.003)"]
+    assert "Reorder buffer: 1 frames reordered" in stderr
+
+
+def test_cli_reorder_window_merged_logs(tmp_path):
+    """Verify frames merged from several logs go through the reorder stage, not dropped."""
+    can0_log = tmp_path / "can0.log"
+    can1_log = tmp_path / "can1.log"
+    can0_log.write_text(
+        "(1.000) can0 0CF00400#0041FF20481400F0\n"
+        "(1.004) can0 0CF00400#0041FF20481400F0\n"
+        "(1.003) can0 18FEEE00#FFFFFFFFFFFFFFFF\n"
+    )
+    can1_log.write_text(
+        "(1.001) can1 18FEF100#FFFFFFFFFFFFFFFF\n"
+        "(1.005) can1 18FEF100#FFFFFFFFFFFFFFFF\n"
+    )
+    db_path = os.path.join("pretty_j1939", "J1939db.json")
+
+    for window in (["--reorder-window", "5"], ["--reorder-frames", "4"]):
+        stdout, stderr, code = run_cli(
+            [str(can0_log), str(can1_log), "--da-json", db_path, "--candata"]
+            + ["--color", "never", "--no-summary"]
+            + window
+        )
+
+        assert code == 0
+        lines = stdout.splitlines()
+        assert [line.split()[0] for line in lines] == [
+            "(1.000)",
+            "(1.001)",
+            "(1.003)",
+            "(1.004)",
+            "(1.005)",
+        ], window
+        assert [line.split()[1] for line in lines] == [
+            "can0",
+            "can1",
+            "can0",
+            "can0",
+            "can1",
+        ]
+
+
+def test_live_interface_pipeline(capsys):
+    """Verify the threaded receive/decode/write pipeline on a virtual bus."""
+    import threading
+    import time
+    import can
+
+    runner = get_test_runner()
+    runner.args.interface = "virtual"
+    runner.args.channel = "test_live_pipeline"
+    runner.args.bitrate = None
+    runner.args.queue_size = 16
+    runner.args.drop_policy = "block"
+
+    with can.Bus(interface="virtual", channel="test_live_pipeline") as tx_bus:
+        thread = threading.Thread(target=runner._run_from_can_interface)
+        thread.start()
+        while runner.receiver is None:
+            time.sleep(0.01)
+        tx_bus.send(
+            can.Message(
+                arbitration_id=0x0CF00400, data=b"\x00\x41\xff\x20\x48\x14\x00\xf0"
+            )
+        )
+        while runner.message_count < 1:
+            time.sleep(0.01)
+        runner.receiver.stop()
+        thread.join(timeout=5)
+
+    captured = capsys.readouterr()
+    assert "EEC1(61444)" in captured.out
+    assert "Pipeline: 1 frames received, 0 dropped at receive" in captured.err
+
+
+def test_live_interface_slow_output_drops_nothing(capsys):
+    """A slow output must block the pipeline, not drop decoded lines, whatever the policy."""
+    import threading
+    import time
+    import can
+
+    runner = get_test_runner()
+    runner.args.interface = "virtual"
+    runner.args.channel = "test_live_slow_output"
+    runner.args.bitrate = None
+    runner.args.queue_size = 2
+    runner.args.drop_policy = "drop-oldest"
+    written = []
+
+    def slow_write_output(lines):
+        time.sleep(0.01)
+        written.extend(line for _, line in lines if line)
+
+    runner._write_output = slow_write_output
+
+    with can.Bus(interface="virtual", channel="test_live_slow_output") as tx_bus:
+        thread = threading.Thread(target=runner._run_from_can_interface)
+        thread.start()
+        while runner.receiver is None:
+            time.sleep(0.01)
+        for _ in range(30):
+            tx_bus.send(
+                can.Message(
+                    arbitration_id=0x0CF00400,
+                    data=b"\x00\x41\xff\x20\x48\x14\x00\xf0",
+                )
+            )
+            time.sleep(0.002)
+        while runner.receiver.received < 30:
+            time.sleep(0.01)
+        time.sleep(0.2)
+        runner.receiver.stop()
+        thread.join(timeout=5)
+
+    capsys.readouterr()
+    assert runner.message_count > 2
+    assert len(written) == runner.message_count
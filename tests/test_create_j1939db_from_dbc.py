@@ -0,0 +1,106 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+import json
+import os
+
+from pretty_j1939.create_j1939db_from_dbc import FIRST_DBC_SPN, DbcConverter
+from pretty_j1939.describe import get_describer, merge_j1939db
+
+TEST_DBC = os.path.join(os.path.dirname(__file__), "test_oem.dbc")
+BUNDLED_DB = os.path.join("pretty_j1939", "J1939db.json")
+
+OEM_STATUS_ID = 0x0CFFF403  # PGN 65524 from SA 3
+OEM_STATUS_DATA = b"\x64\x40\x1f\x02\x01\x2c\xff\x05"
+
+
+def convert(tmp_path, **kwargs):
+    output = tmp_path / "oem.json"
+    converter = DbcConverter([TEST_DBC])
+    converter.convert(str(output), **kwargs)
+    with open(output) as f:
+        return converter, json.load(f)
+
+
+def test_messages_and_signals_converted(tmp_path):
+    _, j1939db = convert(tmp_path)
+    status = j1939db["J1939PGNdb"]["65524"]
+    assert status["Label"] == "OEM_STATUS"
+    assert status["Name"] == "Proprietary status of the OEM controller"
+    assert status["Rate"] == "100 ms"
+    assert status["PGNLength"] == "8"
+    n = FIRST_DBC_SPN
+    assert status["SPNs"] == [n, 520000, n + 1, n + 2, n + 3]
+    assert status["SPNStartBits"] == [[0], [8], [24], [40, 32], [56]]
+
+    spns = j1939db["J1939SPNdb"]
+    assert spns["520000"]["Name"] == "PumpSpeed"
+    assert spns["520000"]["Resolution"] == 0.125
+    assert spns["520000"]["Units"] == "rpm"
+    assert spns[str(n + 2)]["Offset"] == -100
+    # no range given, so the full range of the field
+    assert spns[str(n + 2)]["OperationalHigh"] == 32667.5
+    assert spns[str(n + 1)]["Units"] == "bit"
+    assert spns[str(n + 3)]["Units"] == "count"
+    assert j1939db["J1939BitDecodings"] == {
+        str(n + 1): {"0": "Off", "1": "Standby", "2": "Running", "3": "Not available"}
+    }
+
+
+def test_unsupported_definitions_skipped_with_warnings(tmp_path, capsys):
+    converter, j1939db = convert(tmp_path)
+    mux = j1939db["J1939PGNdb"]["65279"]
+    assert [j1939db["J1939SPNdb"][str(spn)]["Name"] for spn in mux["SPNs"]] == [
+        "Selector"
+    ]
+    assert converter.warnings == {
+        "multiplexed signals skipped": 1,
+        "standard-ID messages skipped": 1,
+        "big-endian signals with an unsupported layout skipped": 1,
+        "signed signals skipped": 1,
+    }
+    assert "Warning: 1 multiplexed signals skipped" in capsys.readouterr().err
+
+
+def test_statements_spanning_lines_are_joined():
+    lines = ['CM_ BO_ 1 "first;', 'second";', "BO_ 2 X: 8 N", 'VAL_ 2 S 0 "a"', ";"]
+    assert list(DbcConverter.statements(lines)) == [
+        'CM_ BO_ 1 "first;\nsecond";',
+        "BO_ 2 X: 8 N",
+        'VAL_ 2 S 0 "a"\n;',
+    ]
+
+
+def test_converted_database_decodes_frames(tmp_path):
+    convert(tmp_path, base_json=BUNDLED_DB)
+    describer = get_describer(da_json=str(tmp_path / "oem.json"), db_cache=False)
+
+    res = describer(OEM_STATUS_DATA, OEM_STATUS_ID)
+    # the DBC name is shown rather than the generic PropB acronym of the range
+    assert res["PGN"] == "OEM_STATUS(65524)"
+    assert res["OilLevel"] == "40.0 [%]"
+    assert res["PumpSpeed"] == "1000.0 [rpm]"
+    assert res["Mode"] == "2 (Running)"
+    assert res["Pressure"] == "50.0 [kPa]"
+    assert res["Counter"] == "5 [count]"
+    # the base database is still there
+    assert "Engine Speed" in describer(b"\x00\x41\xff\x20\x48\x14\x00\xf0", 0x0CF00400)
+
+
+def test_merge_later_databases_take_precedence():
+    base = {
+        "J1939PGNdb": {"1": {"Label": "A"}, "2": {"Label": "B"}},
+        "J1939SATabledb": {"0": "Engine #1"},
+        "SATableMetadata": {"source": "base"},
+    }
+    overlay = {
+        "J1939PGNdb": {"2": {"Label": "B2"}},
+        "J1939SATabledb": {"3": "Transmission"},
+        "SATableMetadata": {"source": "overlay"},
+    }
+    merged = merge_j1939db(base, overlay)
+    assert merged["J1939PGNdb"] == {"1": {"Label": "A"}, "2": {"Label": "B2"}}
+    assert merged["J1939SATabledb"] == {"0": "Engine #1", "3": "Transmission"}
+    assert merged["SATableMetadata"] == {"source": "overlay"}
+    assert base["J1939PGNdb"]["2"] == {"Label": "B"}
@@ -3,6 +3,8 @@
 # See the file "LICENSE" for the full license governing this code.
 #
 
+import json
+import os
 import unittest
 from collections import OrderedDict
 from pretty_j1939.create_j1939db_json import J1939daConverter, SheetWrapper
@@ -71,6 +73,24 @@ class TestJ1939daConverter(unittest.TestCase):
         self.assertEqual(da_parsers.get_spn_offset("0"), 0.0)
         self.assertEqual(da_parsers.get_spn_offset("not defined"), 0)
 
+    def test_asteval_eval_numeric_fast_path_matches_asteval(self):
+        import asteval
+
+        for expr in ["5", "-10", "0.125", "1.", ".5", "00", "1/128", "(1)/(8)"]:
+            expected = asteval.Interpreter()(expr)
+            result = da_parsers.asteval_eval(expr)
+            self.assertEqual(result, expected, expr)
+            self.assertIs(type(result), type(expected), expr)
+        # anything else is still evaluated by asteval
+        self.assertEqual(da_parsers.asteval_eval("1-5"), -4)
+        self.assertEqual(da_parsers.asteval_eval("2/4/2"), 0.25)
+        self.assertIsNone(da_parsers.asteval_eval(""))
+
+    def test_asteval_eval_errors_are_not_cached(self):
+        for _ in range(2):
+            with self.assertRaises(Exception):
+                da_parsers.asteval_eval("4/0")
+
     def test_get_operational_hilo(self):
         self.assertEqual(
             da_parsers.get_operational_hilo("0 to 250.5", "km", 16), (0.0, 250.5)
@@ -717,10 +737,14 @@ class TestProcessSpnsAndPgnsTab(unittest.TestCase):
             "SP_DESCRIPTION",
         ]
 
-        class MockSheetLocal:
+        class MockSheetLocal(SheetWrapper):
             def __init__(self, rows):
+                super().__init__(None)
                 self.rows = [header] + rows
-                self.nrows = len(self.rows)
+
+            @property
+            def nrows(self):
+                return len(self.rows)
 
             def row_values(self, row_num):
                 return self.rows[row_num]
@@ -884,5 +908,111 @@ class TestProcessSpnsAndPgnsTab(unittest.TestCase):
         self.assertEqual(pgndb["65226"]["SPNs"], [])
 
 
+class TestXlsxConversion(unittest.TestCase):
+    HEADER = [
+        "PGN",
+        "Parameter Group Label",
+        "Acronym",
+        "PGN Data Length",
+        "Transmission Rate",
+        "SPN Position in PGN",
+        "SPN",
+        "SPN Name",
+        "SPN Description",
+        "SPN Length",
+        "Resolution",
+        "Offset",
+        "Data Range",
+        "Operational Range",
+        "Units",
+    ]
+
+    def setUp(self):
+        import tempfile
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def _write_workbook(self, rows):
+        import openpyxl
+
+        path = os.path.join(self.tmp_dir.name, "da.xlsx")
+        book = openpyxl.Workbook()
+        sheet = book.active
+        sheet.title = "SPNs & PGNs"
+        sheet.append(["SAE J1939 Digital Annex"])
+        sheet.append(self.HEADER)
+        for row in rows:
+            sheet.append(row)
+        addresses = book.create_sheet("Global Source Addresses (B2)")
+        addresses.append(["Source Address ID", "Name"])
+        addresses.append([0, "Engine #1"])
+        book.save(path)
+        return path
+
+    def _convert(self, path):
+        output = os.path.join(self.tmp_dir.name, "out.json")
+        converter = J1939daConverter([path])
+        try:
+            converter.convert(output)
+        finally:
+            converter.close()
+        with open(output) as f:
+            return json.load(f)
+
+    def test_xlsx_converted_from_read_only_workbook(self):
+        path = self._write_workbook(
+            [
+                [
+                    61444,
+                    "Electronic Engine Controller 1",
+                    "EEC1",
+                    "8 bytes",
+                    "engine speed dependent",
+                    "4-5",
+                    190,
+                    "Engine Speed",
+                    "Actual engine speed._x000D_",
+                    "2 bytes",
+                    "0.125 rpm/bit",
+                    "0",
+                    "0 to 8,031.875 rpm",
+                    "",
+                    "rpm",
+                ]
+            ]
+        )
+        book = da_parsers.secure_open_workbook(path)
+        self.assertTrue(book.read_only)
+        book.close()
+
+        j1939db = self._convert(path)
+        self.assertEqual(j1939db["J1939PGNdb"]["61444"]["Label"], "EEC1")
+        self.assertEqual(j1939db["J1939PGNdb"]["61444"]["SPNs"], [190])
+        self.assertEqual(j1939db["J1939SPNdb"]["190"]["Resolution"], 0.125)
+        self.assertEqual(j1939db["J1939SPNdb"]["190"]["SPNLength"], 16)
+        self.assertEqual(j1939db["J1939SATabledb"], {"0": "Engine #1"})
+
+    def test_short_rows_are_padded(self):
+        from pretty_j1939.create_j1939db_json import XlsxSheetWrapper
+
+        # a row with only the PGN columns, as rows without an SPN often are
+        path = self._write_workbook([[65226, "Active DTCs", "DM1", "Variable"]])
+        book = da_parsers.secure_open_workbook(path)
+        self.addCleanup(book.close)
+        sheet = XlsxSheetWrapper(book["SPNs & PGNs"])
+
+        rows = list(sheet.iter_rows(1))
+        self.assertEqual(len(rows[1]), len(self.HEADER))
+        self.assertEqual(rows[1][:4], [65226, "Active DTCs", "DM1", "Variable"])
+        self.assertEqual(sheet.row_values(2), rows[1])
+        self.assertEqual(sheet.nrows, 3)
+        with self.assertRaises(IndexError):
+            sheet.row_values(3)
+
+        j1939db = self._convert(path)
+        self.assertEqual(j1939db["J1939PGNdb"]["65226"]["SPNs"], [])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,177 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+import json
+import os
+
+import pytest
+
+from pretty_j1939.describe import DatabaseReloader, get_describer
+
+EEC1_ID = 0x0CF00400
+EEC1_DATA = b"\x00\x41\xff\x20\x48\x14\x00\xf0"
+ET1_ID = 0x18FEEE00
+ET1_DATA = b"\x7f\x80\xff\xff\xff\xff\xff\xff"
+BUNDLED_DB = os.path.join("pretty_j1939", "J1939db.json")
+
+
+def _subset(pgns):
+    with open(BUNDLED_DB) as f:
+        full = json.load(f)
+    pgn_db = {str(pgn): full["J1939PGNdb"][str(pgn)] for pgn in pgns}
+    spns = {str(spn) for pgn in pgn_db.values() for spn in pgn["SPNs"]}
+    return {
+        "J1939PGNdb": pgn_db,
+        "J1939SPNdb": {k: v for k, v in full["J1939SPNdb"].items() if k in spns},
+        "J1939SATabledb": {"0": "Engine #1"},
+    }
+
+
+def _write(path, j1939db, mtime_ns):
+    with open(path, "w") as f:
+        json.dump(j1939db, f)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def watched(tmp_path):
+    db_path = tmp_path / "db.json"
+    _write(db_path, _subset([61444]), 1_000_000_000)
+    describer = get_describer(
+        da_json=str(db_path), db_cache_dir=str(tmp_path / "cache")
+    )
+    return db_path, describer, DatabaseReloader(describer)
+
+
+def test_changed_database_is_swapped_in_after_settling(watched):
+    db_path, describer, reloader = watched
+    assert "Engine Coolant Temperature" not in str(describer(ET1_DATA, ET1_ID))
+
+    _write(db_path, _subset([61444, 65262]), 2_000_000_000)
+    assert not reloader.poll()  # changed, but not settled yet
+    assert reloader.poll()
+    assert reloader.apply()
+    assert not reloader.apply()
+
+    assert reloader.reloads == 1
+    assert "Engine Coolant Temperature" in describer(ET1_DATA, ET1_ID)
+    assert "Engine Speed" in describer(EEC1_DATA, EEC1_ID)
+
+
+def test_unchanged_file_is_not_reloaded(watched):
+    _, _, reloader = watched
+    assert not reloader.poll()
+    assert not reloader.poll()
+    assert reloader.pending is None
+
+
+def test_reload_keeps_name_tracking_and_unchanged_caches(watched):
+    db_path, describer, reloader = watched
+    describer(EEC1_DATA, EEC1_ID)
+    old = describer.da_describer
+    plan = old.get_decode_plan(61444)
+    name_tracker = old.name_tracker
+    cached = {key for key in old._spn_cache if key[0] == 61444}
+    assert cached
+
+    _write(db_path, _subset([61444, 65262]), 2_000_000_000)
+    reloader.poll()
+    reloader.poll()
+    reloader.apply()
+
+    new = describer.da_describer
+    assert new is not old
+    assert new.name_tracker is name_tracker
+    assert name_tracker.manufacturer_db is new.manufacturer_db
+    assert cached <= set(new._spn_cache)
+    assert new.get_decode_plan(61444) is plan
+
+
+def test_failed_reload_keeps_old_database(watched):
+    db_path, describer, _ = watched
+    messages = []
+    reloader = DatabaseReloader(describer, report=messages.append)
+    old = describer.da_describer
+
+    with open(db_path, "w") as f:
+        f.write("{not json")
+    reloader.poll()
+    assert not reloader.poll()
+
+    assert reloader.pending is None
+    assert describer.da_describer is old
+    assert messages and messages[0].startswith("Error: reloading")
+    assert "Engine Speed" in describer(EEC1_DATA, EEC1_ID)
+
+
+def test_in_memory_database_cannot_be_reloaded():
+    describer = get_describer(da_json=BUNDLED_DB, db_cache=False)
+    describer.da_describer.da_json = "in-memory"
+    with pytest.raises(ValueError):
+        describer.da_describer.reload()
+
+
+def test_layered_database_reloaded_when_overlay_changes(tmp_path):
+    base, overlay = tmp_path / "base.json", tmp_path / "oem.json"
+    _write(base, _subset([61444]), 1_000_000_000)
+    _write(overlay, {"J1939SATabledb": {"249": "Service Tool"}}, 1_000_000_000)
+    describer = get_describer(
+        da_json=[str(base), str(overlay)], db_cache_dir=str(tmp_path / "cache")
+    )
+    messages = []
+    reloader = DatabaseReloader(describer, report=messages.append)
+
+    _write(overlay, _subset([65262]), 2_000_000_000)
+    assert not reloader.poll()
+    assert reloader.poll() and reloader.apply()
+    assert messages == [f"Reloaded J1939 database from {base} + {overlay}"]
+    assert describer.da_describer.da_json == (str(base), str(overlay))
+    assert "Engine Coolant Temperature" in describer(ET1_DATA, ET1_ID)
+    assert "Engine Speed" in describer(EEC1_DATA, EEC1_ID)
+
+
+def test_failed_reload_is_retried(watched, monkeypatch):
+    db_path, describer, _ = watched
+    messages = []
+    reloader = DatabaseReloader(describer, report=messages.append)
+    reload = type(describer.da_describer).reload
+    failures = []
+
+    def flaky_reload(da_describer):
+        if len(failures) < 2:
+            failures.append(True)
+            raise RuntimeError("busy")
+        return reload(da_describer)
+
+    monkeypatch.setattr(type(describer.da_describer), "reload", flaky_reload)
+    _write(db_path, _subset([61444, 65262]), 2_000_000_000)
+    assert not reloader.poll()
+    assert not reloader.poll()
+    assert not reloader.poll()
+    assert reloader.poll() and reloader.apply()
+
+    assert len(messages) == 2
+    assert messages[0] == f"Error: reloading {db_path} failed: busy"
+    assert messages[1].startswith("Reloaded J1939 database")
+    assert "Engine Coolant Temperature" in describer(ET1_DATA, ET1_ID)
+
+
+def test_caches_inherited_while_decoding_continues(watched):
+    db_path, describer, reloader = watched
+    old = describer.da_describer
+    describer(EEC1_DATA, EEC1_ID)
+    old.get_decode_plan(61444)
+
+    class Decoding(dict):
+        # simulates the decoding thread adding cache entries while the reload runs
+        def get(self, key, default=None):
+            old._spn_cache[len(old._spn_cache), 0] = None
+            old._decode_plans[len(old._decode_plans) + 100000] = None
+            return super().get(key, default)
+
+    old.pgn_objects = Decoding(old.pgn_objects)
+    _write(db_path, _subset([61444, 65262]), 2_000_000_000)
+    reloader.poll()
+    assert reloader.poll() and reloader.apply()
+    assert describer.da_describer.get_decode_plan(61444) is old._decode_plans[61444]
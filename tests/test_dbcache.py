@@ -0,0 +1,273 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+import json
+import os
+import pickle
+
+import pytest
+
+from pretty_j1939.dbcache import LazyRecordTable, get_cache_path, load_compiled_json
+from pretty_j1939.describe import (
+    compile_j1939db,
+    get_describer,
+    load_j1939db,
+    merge_j1939db,
+    preload_j1939db,
+)
+
+EEC1_ID = 0x0CF00400
+EEC1_DATA = b"\x00\x41\xff\x20\x48\x14\x00\xf0"
+BUNDLED_DB = os.path.join("pretty_j1939", "J1939db.json")
+
+
+class CountingCompiler:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, j1939db):
+        self.calls += 1
+        return compile_j1939db(j1939db)
+
+
+def _write_db(path, address_name="Engine #1"):
+    with open(path, "w") as f:
+        json.dump({"J1939SATabledb": {"0": address_name}}, f)
+
+
+def test_cache_is_created_and_reused(tmp_path):
+    db_path = tmp_path / "db.json"
+    _write_db(db_path)
+    compiler = CountingCompiler()
+
+    first = load_compiled_json(str(db_path), compiler, cache_dir=str(tmp_path))
+    assert os.path.exists(get_cache_path(str(db_path), str(tmp_path)))
+    second = load_compiled_json(str(db_path), compiler, cache_dir=str(tmp_path))
+
+    assert compiler.calls == 1
+    assert first == second
+    assert second["address_names"] == {0: "Engine #1"}
+
+
+def test_cache_is_rebuilt_when_json_changes(tmp_path):
+    db_path = tmp_path / "db.json"
+    _write_db(db_path)
+    compiler = CountingCompiler()
+    load_compiled_json(str(db_path), compiler, cache_dir=str(tmp_path))
+
+    _write_db(db_path, "Engine #2 (renamed)")
+    os.utime(db_path, ns=(0, 0))
+    tables = load_compiled_json(str(db_path), compiler, cache_dir=str(tmp_path))
+
+    assert compiler.calls == 2
+    assert tables["address_names"] == {0: "Engine #2 (renamed)"}
+
+
+def test_touched_json_reuses_cache_by_hash(tmp_path):
+    db_path = tmp_path / "db.json"
+    _write_db(db_path)
+    compiler = CountingCompiler()
+    load_compiled_json(str(db_path), compiler, cache_dir=str(tmp_path))
+
+    os.utime(db_path, ns=(0, 0))
+    load_compiled_json(str(db_path), compiler, cache_dir=str(tmp_path))
+    load_compiled_json(str(db_path), compiler, cache_dir=str(tmp_path))
+
+    assert compiler.calls == 1
+
+
+def test_corrupt_cache_is_ignored(tmp_path):
+    db_path = tmp_path / "db.json"
+    _write_db(db_path)
+    with open(get_cache_path(str(db_path), str(tmp_path)), "wb") as f:
+        f.write(b"not a pickle")
+
+    tables = load_compiled_json(str(db_path), compile_j1939db, cache_dir=str(tmp_path))
+    assert tables["address_names"] == {0: "Engine #1"}
+
+
+def test_unwritable_cache_dir_still_loads(tmp_path):
+    db_path = tmp_path / "db.json"
+    _write_db(db_path)
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_text("")
+
+    tables = load_compiled_json(
+        str(db_path), compile_j1939db, cache_dir=str(not_a_dir / "cache")
+    )
+    assert tables["address_names"] == {0: "Engine #1"}
+
+
+def test_describer_output_same_with_and_without_cache(tmp_path):
+    cached = get_describer(da_json=BUNDLED_DB, db_cache_dir=str(tmp_path))
+    from_cache = get_describer(da_json=BUNDLED_DB, db_cache_dir=str(tmp_path))
+    uncached = get_describer(da_json=BUNDLED_DB, db_cache=False)
+
+    expected = uncached(EEC1_DATA, EEC1_ID)
+    assert cached(EEC1_DATA, EEC1_ID) == expected
+    assert from_cache(EEC1_DATA, EEC1_ID) == expected
+    assert from_cache.da_describer.da_json == BUNDLED_DB
+
+
+def test_lazy_tables_decode_records_on_first_use(tmp_path):
+    lazy_tables = ("pgn_objects", "spn_objects", "bit_encodings")
+    eager = load_compiled_json(BUNDLED_DB, compile_j1939db, use_cache=False)
+    load_compiled_json(
+        BUNDLED_DB, compile_j1939db, cache_dir=str(tmp_path), lazy_tables=lazy_tables
+    )
+    tables = load_compiled_json(
+        BUNDLED_DB, compile_j1939db, cache_dir=str(tmp_path), lazy_tables=lazy_tables
+    )
+
+    spns = tables["spn_objects"]
+    assert isinstance(spns, LazyRecordTable)
+    assert not spns._records
+    assert spns[190] == eager["spn_objects"][190]
+    assert list(spns._records) == [190]
+
+    assert spns.get(999999) is None
+    assert 999999 not in spns
+    assert spns.get("190") is None
+    with pytest.raises(KeyError):
+        spns[999999]
+
+    assert len(spns) == len(eager["spn_objects"])
+    for name in lazy_tables:
+        assert dict(tables[name]) == eager[name]
+    assert tables["address_names"] == eager["address_names"]
+
+
+def test_lazy_cache_not_reused_for_eager_load(tmp_path):
+    load_compiled_json(
+        BUNDLED_DB,
+        compile_j1939db,
+        cache_dir=str(tmp_path),
+        lazy_tables=("spn_objects",),
+    )
+    tables = load_compiled_json(BUNDLED_DB, compile_j1939db, cache_dir=str(tmp_path))
+    assert type(tables["spn_objects"]) is dict
+
+
+def test_describers_share_loaded_tables(tmp_path):
+    first = get_describer(da_json=BUNDLED_DB, db_cache_dir=str(tmp_path))
+    second = get_describer(da_json=BUNDLED_DB, db_cache_dir=str(tmp_path))
+    assert first.da_describer.spn_objects is second.da_describer.spn_objects
+
+
+def test_shared_tables_reloaded_when_json_changes(tmp_path):
+    db_path = tmp_path / "db.json"
+    _write_db(db_path)
+    first = load_j1939db(str(db_path), db_cache_dir=str(tmp_path))
+    assert load_j1939db(str(db_path), db_cache_dir=str(tmp_path)) is first
+
+    _write_db(db_path, "Engine #2 (renamed)")
+    second = load_j1939db(str(db_path), db_cache_dir=str(tmp_path))
+    assert second is not first
+    assert second["address_names"] == {0: "Engine #2 (renamed)"}
+
+
+def test_preload_shares_tables_with_later_describers(tmp_path, monkeypatch):
+    frozen = []
+    monkeypatch.setattr("gc.freeze", lambda: frozen.append(True))
+
+    tables = preload_j1939db(BUNDLED_DB, db_cache_dir=str(tmp_path))
+    describer = get_describer(da_json=BUNDLED_DB, db_cache_dir=str(tmp_path))
+
+    assert frozen == [True]
+    assert describer.da_describer.pgn_objects is tables["pgn_objects"]
+
+
+def test_lazy_table_pickles_as_cache_reference(tmp_path):
+    tables = preload_j1939db(BUNDLED_DB, db_cache_dir=str(tmp_path), freeze=False)
+    spns = tables["spn_objects"]
+    spns.get(190)
+
+    data = pickle.dumps(spns)
+    assert len(data) < len(pickle.dumps(dict(spns)))
+    attached = pickle.loads(data)
+    assert isinstance(attached, LazyRecordTable)
+    assert not attached._records
+    assert dict(attached) == dict(spns)
+
+
+def test_lazy_table_refuses_changed_cache(tmp_path):
+    db_path = tmp_path / "db.json"
+    _write_db(db_path)
+    tables = load_j1939db(str(db_path), db_cache_dir=str(tmp_path))
+    data = pickle.dumps(tables["spn_objects"])
+
+    _write_db(db_path, "Engine #2 (renamed)")
+    load_j1939db(str(db_path), db_cache_dir=str(tmp_path))
+    with pytest.raises(RuntimeError):
+        pickle.loads(data)
+
+
+def _write_overlay(path, pgn_label, address_name):
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "J1939PGNdb": {"61444": {"Label": pgn_label, "Name": "Overlay EEC1"}},
+                "J1939SATabledb": {"249": address_name},
+            },
+            f,
+        )
+
+
+def test_layered_databases_later_files_take_precedence(tmp_path):
+    overlay = tmp_path / "oem.json"
+    _write_overlay(overlay, "OEM1", "Service Tool")
+    describer = get_describer(
+        da_json=[BUNDLED_DB, str(overlay)], db_cache_dir=str(tmp_path)
+    )
+    da_describer = describer.da_describer
+
+    assert da_describer.da_json == (BUNDLED_DB, str(overlay))
+    assert da_describer.get_pgn_acronym(61444) == "OEM1"
+    # SA tables are unioned, other PGNs come from the base
+    assert da_describer.address_names[249] == "Service Tool"
+    assert da_describer.address_names[0] == "Engine #1"
+    assert da_describer.get_pgn_acronym(65262) == "ET1"
+
+    single = get_describer(da_json=[BUNDLED_DB], db_cache_dir=str(tmp_path))
+    assert single.da_describer.da_json == BUNDLED_DB
+
+
+def test_layered_cache_rebuilt_when_any_layer_changes(tmp_path):
+    base, overlay = tmp_path / "base.json", tmp_path / "oem.json"
+    _write_db(base)
+    _write_overlay(overlay, "OEM1", "Service Tool")
+    layers = [str(base), str(overlay)]
+    compiler = CountingCompiler()
+
+    def compile_layers(j1939dbs):
+        return compiler(merge_j1939db(*j1939dbs))
+
+    load_compiled_json(layers, compile_layers, cache_dir=str(tmp_path))
+    cache_path = get_cache_path(layers, str(tmp_path))
+    assert os.path.basename(cache_path).startswith("base+1-")
+    assert cache_path != get_cache_path(str(base), str(tmp_path))
+    assert cache_path != get_cache_path(layers[::-1], str(tmp_path))
+    tables = load_compiled_json(layers, compile_layers, cache_dir=str(tmp_path))
+    assert compiler.calls == 1
+    assert tables["address_names"] == {0: "Engine #1", 249: "Service Tool"}
+
+    _write_overlay(overlay, "OEM1", "Diagnostic Tool")
+    os.utime(overlay, ns=(0, 0))
+    tables = load_compiled_json(layers, compile_layers, cache_dir=str(tmp_path))
+    assert compiler.calls == 2
+    assert tables["address_names"][249] == "Diagnostic Tool"
+
+
+def test_layered_tables_shared_and_reloaded(tmp_path):
+    base, overlay = tmp_path / "base.json", tmp_path / "oem.json"
+    _write_db(base)
+    _write_overlay(overlay, "OEM1", "Service Tool")
+    layers = (str(base), str(overlay))
+    first = load_j1939db(layers, db_cache_dir=str(tmp_path))
+    assert load_j1939db(list(layers), db_cache_dir=str(tmp_path)) is first
+
+    _write_db(base, "Engine #2 (renamed)")
+    second = load_j1939db(layers, db_cache_dir=str(tmp_path))
+    assert second is not first
+    assert second["address_names"] == {0: "Engine #2 (renamed)", 249: "Service Tool"}
@@ -1409,3 +1409,175 @@ def test_describe_message_data_resolution():
     res = describer(msg_data, 0x18FF0000)
     assert "Format SPN" in res
     assert "10.0 [V]" in res["Format SPN"]
+
+
+def get_test_unprintable_db():
+    return {
+        "J1939PGNdb": {
+            "65259": {
+                "Label": "CI\x01",
+                "Name": "Component Identification",
+                "SPNs": [586],
+                "SPNStartBits": [0],
+            }
+        },
+        "J1939SPNdb": {
+            "586": {
+                "Name": "Make\x02",
+                "Units": "ASCII",
+                "SPNLength": 40,
+                "Resolution": 1,
+                "Offset": 0,
+                "OperationalLow": 0,
+                "OperationalHigh": 0,
+            }
+        },
+        "J1939SATabledb": {"0": "Eng\x03ine"},
+        "J1939BitDecodings": {},
+    }
+
+
+def test_database_strings_sanitized_at_load():
+    db = get_test_unprintable_db()
+    describer = get_describer(da_json=db)
+
+    res = describer(b"ABCDE\xff\xff\xff", 0x18FEEB00)
+    assert res["PGN"] == "CI.(65259)"
+    assert res["SA"] == "Eng.ine(  0)"
+    assert res["Make."] == "ABCDE"
+    # the caller's dictionary is left alone
+    assert db["J1939SPNdb"]["586"]["Name"] == "Make\x02"
+
+
+def test_ascii_payload_sanitized_at_decode():
+    describer = get_describer(da_json=get_test_unprintable_db())
+
+    res = describer(b"AB\x01C\x1bDEF", 0x18FEEB00)
+    assert res["Make."] == "AB.C."
+
+
+def test_description_built_in_display_order():
+    describer = get_describer()
+
+    res = describer(b"\x00\x41\xff\x20\x48\x14\x00\xf0", 0x0CF00400)
+    assert list(res)[:4] == ["PGN", "SA", "DA", "Priority"]
+    assert list(res)[4:7] == ["_pgn", "_sa", "_da"]
+
+
+def test_database_records_are_slotted_specs():
+    import pickle
+    from pretty_j1939.describe import PGNSpec, SPNSpec
+
+    db = get_test_describe_mock_db()
+    db["J1939SPNdb"]["10003"]["License"] = "CC0"
+    describer = get_describer(da_json=db)
+    spn = describer.da_describer.spn_objects[10003]
+    pgn = describer.da_describer.pgn_objects[65280]
+
+    assert isinstance(spn, SPNSpec) and isinstance(pgn, PGNSpec)
+    assert not hasattr(spn, "__dict__")
+    assert spn.offset == spn["Offset"] == -10.0
+    assert spn.scale == 0.5
+    assert spn.get("Delimiter") is None
+    assert "Delimiter" not in spn
+    assert spn["License"] == "CC0"
+    assert spn.to_dict() == db["J1939SPNdb"]["10003"]
+    assert pickle.loads(pickle.dumps(spn)) == spn
+
+    assert pgn.spns == (10001, 10002, 10003)
+    assert pgn.start_bits == ((5,), (12,), (24,))
+    assert pgn["Label"] == "MOCK"
+
+
+def test_variable_length_fields_with_unknown_start_bits():
+    def ascii_spn(name):
+        return {
+            "Name": name,
+            "Units": "ASCII",
+            "SPNLength": 'Variable - up to 200 bytes followed by an "*" delimiter',
+            "Resolution": 1,
+            "Offset": 0,
+            "OperationalLow": 0,
+            "OperationalHigh": 0,
+            "Delimiter": "0x2A",
+        }
+
+    db = {
+        "J1939PGNdb": {
+            "65259": {
+                "Label": "CI",
+                "Name": "Component Identification",
+                "SPNs": [586, 587, 588],
+                "SPNStartBits": [[-1], [-1], [-1]],
+            }
+        },
+        "J1939SPNdb": {
+            "586": ascii_spn("Make"),
+            "587": ascii_spn("Model"),
+            "588": ascii_spn("Serial Number"),
+        },
+    }
+    describer = get_describer(da_json=db)
+    res = describer.da_describer.describe_message_data(
+        65259, bitstring.Bits(bytes=b"MAKE*MODEL*SERIAL*")
+    )
+    assert res["Make"] == "MAKE"
+    assert res["Model"] == "MODEL"
+    assert res["Serial Number"] == "SERIAL"
+
+
+def test_pgn_classes_from_dispatch_table():
+    from pretty_j1939.describe import (
+        PGN_CLASS_DATA,
+        PGN_CLASS_SPECIAL,
+        PGN_CLASS_TRANSPORT,
+        get_pgn_class,
+    )
+
+    assert get_pgn_class(60416) == PGN_CLASS_TRANSPORT  # TP.CM
+    assert get_pgn_class(60160) == PGN_CLASS_TRANSPORT  # TP.DT
+    assert get_pgn_class(59904) == PGN_CLASS_SPECIAL  # Request
+    assert get_pgn_class(65227) == PGN_CLASS_SPECIAL  # DM2
+    assert get_pgn_class(61444) == PGN_CLASS_DATA
+    assert get_pgn_class(65300) == PGN_CLASS_DATA  # PropB has an acronym only
+
+
+def test_registered_pgn_handler_describes_frames():
+    from pretty_j1939.describe import register_pgn_handler, unregister_pgn_handler
+
+    def describe_counter(da_describer, message_data_bitstring, description, sa):
+        description["Counter"] = message_data_bitstring.bytes[0]
+        return True
+
+    register_pgn_handler(65300, describe_counter, acronym="CNT")
+    try:
+        with pytest.raises(ValueError):
+            register_pgn_handler(65300, describe_counter)
+        describer = get_describer()
+        res = describer(b"\x2a\xff\xff\xff\xff\xff\xff\xff", 0x18FF1400)
+        assert res["PGN"] == "CNT(65300)"
+        assert res["Counter"] == 42
+        assert "Bytes" not in res
+        assert describer.da_describer.get_decode_plan(65300) is None
+    finally:
+        unregister_pgn_handler(65300)
+    assert get_describer().da_describer.get_pgn_acronym(65300) == "PropB"
+
+
+def test_registered_pf_handler_covers_every_pgn_of_the_pf(monkeypatch):
+    from pretty_j1939 import describe
+
+    monkeypatch.setattr(describe, "_PF_DISPATCH", list(describe._PF_DISPATCH))
+    monkeypatch.setattr(describe, "_resolved_pgns", {})
+    seen = []
+
+    def describe_prop_b2(da_describer, message_data_bitstring, description, sa):
+        seen.append(sa)
+        return False  # decode the SPNs too
+
+    describe.register_pf_handler(0xFF, describe_prop_b2, replace=True, data_page=1)
+    describer = get_describer()
+    res = describer(b"\x01\x02", 0x19FF1203)
+    assert seen == [3]
+    assert res["PGN"] == "???(130834/0x1FF12)"
+    assert res["Bytes"] == "0102"
@@ -0,0 +1,78 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+import random
+
+import pytest
+
+from pretty_j1939.describe import LazyDescription, get_describer
+from pretty_j1939.render import HighPerformanceRenderer
+
+EEC1_ID = 0x0CF00400
+EEC1_DATA = b"\x00\x41\xff\x20\x48\x14\x00\xf0"
+
+
+def test_lazy_header_without_decoding(monkeypatch):
+    describer = get_describer(lazy=True)
+    description = describer(EEC1_DATA, EEC1_ID)
+    assert isinstance(description, LazyDescription)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("SPNs decoded")
+
+    monkeypatch.setattr(describer.da_describer, "describe_message_data", fail)
+    assert description["_pgn"] == 61444
+    assert description.get("_sa") == 0
+    assert description["PGN"] == "EEC1(61444)"
+    assert bool(description)
+    assert description.get("Not a key") is None
+
+
+def test_lazy_single_spn_decodes_only_that_spn():
+    describer = get_describer(lazy=True)
+    description = describer(EEC1_DATA, EEC1_ID)
+
+    assert description["Engine Speed"] == "2308.0 [rpm]"
+    assert description._full is None
+    # N/A SPNs aren't included, just like in an eager description
+    assert "Actual Engine - Percent Torque" not in description
+    with pytest.raises(KeyError):
+        description["Actual Engine - Percent Torque"]
+
+
+def test_lazy_matches_eager_description():
+    random.seed(0)
+    for options in ({}, {"include_na": True}, {"include_raw_data": True}):
+        eager = get_describer(**options)
+        lazy = get_describer(lazy=True, **options)
+        for can_id in (0x0CF00400, 0x18FEF100, 0x18FEE000, 0x18FEEE00, 0x18FECA00):
+            data = bytes(random.randrange(256) for _ in range(8))
+            expected = eager(data, can_id)
+            description = lazy(data, can_id)
+            assert list(description.items()) == list(expected.items())
+            assert description == expected
+            assert len(description) == len(expected)
+
+
+def test_lazy_description_renders_and_mutates_like_ordereddict():
+    description = get_describer(lazy=True)(EEC1_DATA, EEC1_ID)
+    expected = get_describer()(EEC1_DATA, EEC1_ID)
+
+    renderer = HighPerformanceRenderer(color_system=None)
+    assert renderer.render(description) == renderer.render(expected)
+
+    description["Extra"] = "1"
+    description.move_to_end("Extra", last=False)
+    assert next(iter(description)) == "Extra"
+    del description["Extra"]
+    assert list(description) == list(expected)
+    assert description.copy() == expected
+
+
+def test_lazy_transport_and_special_pgns_are_eager():
+    describer = get_describer(lazy=True)
+    # DM1 is a special PGN without independent SPNs
+    assert not isinstance(
+        describer(b"\x00\xff\x00\x00\x00\x00\xff\xff", 0x18FECA00), LazyDescription
+    )
@@ -0,0 +1,167 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+import io
+import json
+import time
+
+from bitstring import Bits
+
+from pretty_j1939.output import (
+    BufferedLineWriter,
+    NdjsonSink,
+    OutputFrame,
+    PlainSink,
+)
+
+
+class CountingBytesIO(io.BytesIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return super().write(data)
+
+
+def test_lines_are_batched_until_size_threshold():
+    sink = CountingBytesIO()
+    writer = BufferedLineWriter(
+        sink, line_buffered=False, flush_interval_ms=0, flush_size_kb=1
+    )
+
+    for i in range(10):
+        writer.write_line(f"line {i}")
+    assert sink.writes == 0
+
+    writer.write_line("x" * 1024)
+    assert sink.writes == 1
+    assert sink.getvalue().startswith(b"line 0\nline 1\n")
+
+    writer.close()
+    assert sink.getvalue().endswith(b"x\n")
+
+
+def test_line_buffered_writes_every_line():
+    sink = CountingBytesIO()
+    writer = BufferedLineWriter(sink, line_buffered=True)
+
+    writer.write_line("a")
+    writer.write_line("b")
+    assert sink.writes == 2
+    assert sink.getvalue() == b"a\nb\n"
+
+
+def test_pending_lines_are_flushed_after_interval():
+    sink = CountingBytesIO()
+    writer = BufferedLineWriter(
+        sink, line_buffered=False, flush_interval_ms=20, flush_size_kb=64
+    )
+    try:
+        writer.write_line("slow")
+        deadline = time.monotonic() + 2
+        while not sink.getvalue() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert sink.getvalue() == b"slow\n"
+    finally:
+        writer.close()
+
+
+def test_text_stream_uses_binary_buffer():
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="utf-8")
+    stream.write("before\n")
+
+    writer = BufferedLineWriter(stream, line_buffered=False, flush_interval_ms=0)
+    writer.write_line("after °C")
+    writer.close()
+
+    assert raw.getvalue() == "before\nafter °C\n".encode("utf-8")
+
+
+def test_text_stream_without_buffer_is_written_as_text():
+    stream = io.StringIO()
+    writer = BufferedLineWriter(stream, line_buffered=False, flush_interval_ms=0)
+    writer.write_line("plain")
+    assert stream.getvalue() == ""
+
+    writer.flush()
+    assert stream.getvalue() == "plain\n"
+
+
+def test_close_stream():
+    sink = io.BytesIO()
+    writer = BufferedLineWriter(sink, flush_interval_ms=0, close_stream=True)
+    writer.close()
+    assert sink.closed
+
+
+def _frame(**kwargs):
+    return OutputFrame(
+        1.5,
+        "can0",
+        Bits(uint=0x0CF00400, length=32),
+        Bits(bytes=b"\x00\x41\xff\x20\x48\x14\x00\xf0"),
+        "(1.5) can0 0CF00400#0041FF20481400F0 ; comment",
+        {"_pgn": 61444, "PGN": "EEC1(61444)", "SA": "Engine #1(  0)"},
+        **kwargs,
+    )
+
+
+def test_frame_representations_are_built_once():
+    frame = _frame()
+
+    assert frame.fields == {"PGN": "EEC1(61444)", "SA": "Engine #1(  0)"}
+    assert frame.json is frame.json
+    assert frame.candump_prefix.startswith("(         1.500000) can0 0CF00400#")
+    assert frame.candump_prefix.endswith(" ; ")
+    assert frame.raw_prefix.startswith("(1.5) can0 0CF00400#0041FF20481400F0 ")
+
+    line = frame.plain(frame.candump_prefix)
+    assert line == frame.candump_prefix + frame.json
+    assert frame.plain(frame.candump_prefix) is line
+
+
+def test_indented_frame_aligns_continuation_lines():
+    frame = _frame(indent=True)
+    lines = frame.plain(frame.candump_prefix).splitlines()
+
+    assert lines[0] == frame.candump_prefix + "{"
+    assert all(line.startswith(" " * 80 + " ; ") for line in lines[1:])
+
+
+def test_sinks_emit_from_one_frame():
+
+    plain_out, ndjson_out = io.StringIO(), io.StringIO()
+    sinks = [
+        PlainSink(BufferedLineWriter(plain_out, line_buffered=True), "candump"),
+        NdjsonSink(BufferedLineWriter(ndjson_out, line_buffered=True)),
+    ]
+    frame = _frame()
+    for sink in sinks:
+        sink.emit(frame)
+
+    assert plain_out.getvalue() == frame.candump_prefix + frame.json + "\n"
+    record = json.loads(ndjson_out.getvalue())
+    assert record == {
+        "timestamp": 1.5,
+        "interface": "can0",
+        "id": 0x0CF00400,
+        "data": "0041FF20481400F0",
+        "fields": frame.description,
+    }
+
+
+def test_ndjson_stdlib_fallback(monkeypatch):
+    import pretty_j1939.output as output_module
+
+    monkeypatch.setattr(output_module, "orjson", None)
+    line = output_module.dumps_ndjson({"SA": "Engine #1(  0)", "Temp": "10 °C"})
+    assert line == '{"SA":"Engine #1(  0)","Temp":"10 °C"}'
+
+    stream = io.BytesIO()
+    writer = BufferedLineWriter(stream, line_buffered=True)
+    writer.write_line(line.encode("utf-8"))
+    assert stream.getvalue() == line.encode("utf-8") + b"\n"
@@ -0,0 +1,161 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+import json
+
+import pytest
+
+from pretty_j1939 import plugins
+from pretty_j1939.describe import PGN_CLASS_DATA, get_describer, get_pgn_class
+
+PROPB_ID = 0x18FF1403  # PGN 65300 from SA 3
+PROPB_DATA = b"\x2a\x01\xff\xff\xff\xff\xff\xff"
+
+
+def compile_counter(da_describer, pgn, sa):
+    def decode(message_data_bitstring, description):
+        description["Counter"] = message_data_bitstring.bytes[0]
+        return True
+
+    return decode
+
+
+@pytest.fixture(autouse=True)
+def no_plugins():
+    yield
+    plugins.clear_decoders()
+
+
+def test_decoder_describes_proprietary_pgn():
+    plugins.register_decoder(65300, compile_counter, acronym="CNT")
+    res = get_describer()(PROPB_DATA, PROPB_ID)
+    assert res["PGN"] == "CNT(65300)"
+    assert res["Counter"] == 42
+    assert "Bytes" not in res
+
+
+def test_decoder_output_is_made_printable():
+    def compile_text(da_describer, pgn, sa):
+        def decode(message_data_bitstring, description):
+            text = message_data_bitstring.bytes.decode("latin-1")
+            description[f"Tag {text[:2]}"] = text
+            return True
+
+        return decode
+
+    plugins.register_decoder(65300, compile_text)
+    res = get_describer()(b"\x1b[2J\x00ok\n\x07", PROPB_ID)
+    assert res["Tag .["] == ".[2J.ok.."
+    assert list(res)[0] == "PGN"
+    assert all(
+        key.isprintable() and str(value).isprintable() for key, value in res.items()
+    )
+
+
+def test_decoder_is_compiled_once_per_describer_and_sa():
+    compiled = []
+
+    def compile_decoder(da_describer, pgn, sa):
+        compiled.append((pgn, sa))
+        return compile_counter(da_describer, pgn, sa)
+
+    plugins.register_decoder(65300, compile_decoder)
+    describer = get_describer()
+    for _ in range(3):
+        describer(PROPB_DATA, PROPB_ID)
+    describer(PROPB_DATA, PROPB_ID + 1)
+    assert compiled == [(65300, 3), (65300, 4)]
+
+
+def test_sa_specific_decoder_takes_precedence():
+    def compile_flag(da_describer, pgn, sa):
+        def decode(message_data_bitstring, description):
+            description["Flag"] = message_data_bitstring.bytes[1]
+            return True
+
+        return decode
+
+    plugins.register_decoder(65300, compile_counter)
+    plugins.register_decoder(65300, compile_flag, sa=3)
+    describer = get_describer()
+    assert describer(PROPB_DATA, PROPB_ID)["Flag"] == 1
+    assert describer(PROPB_DATA, PROPB_ID + 1)["Counter"] == 42
+
+    with pytest.raises(ValueError):
+        plugins.register_decoder(65300, compile_counter, sa=3)
+
+
+def test_sa_without_decoder_is_decoded_as_usual():
+    plugins.register_decoder(65300, compile_counter, sa=7)
+    res = get_describer()(PROPB_DATA, PROPB_ID)
+    assert res["PGN"] == "PropB(65300)"
+    assert res["Bytes"] == "2A01FFFFFFFFFFFF"
+
+
+def test_builtin_handlers_cannot_be_replaced():
+    with pytest.raises(ValueError):
+        plugins.register_decoder(65226, compile_counter)  # DM1
+
+
+def test_clear_decoders_restores_previous_entries():
+    plugins.register_decoder(61184, compile_counter, acronym="MINE")
+    assert get_describer().da_describer.get_pgn_acronym(61184) == "MINE"
+    plugins.clear_decoders()
+    assert get_describer().da_describer.get_pgn_acronym(61184) == "PropA"
+    assert get_pgn_class(61184) == PGN_CLASS_DATA
+
+
+def test_decoders_config_file(tmp_path):
+    config = tmp_path / "decoders.json"
+    config.write_text(
+        json.dumps(
+            {
+                "decoders": [
+                    {
+                        "pgn": 65300,
+                        "sa": 3,
+                        "acronym": "CNT",
+                        "decoder": "tests.test_plugins:compile_counter",
+                    }
+                ]
+            }
+        )
+    )
+    plugins.load_plugins(str(config), entry_points=False)
+    assert get_describer()(PROPB_DATA, PROPB_ID)["Counter"] == 42
+
+    config.write_text(json.dumps({"decoders": [{"pgn": 65301, "decoder": "no.such"}]}))
+    with pytest.raises(ValueError):
+        plugins.load_decoders_config(str(config))
+
+
+def test_entry_points_are_loaded_once(monkeypatch, capsys):
+    class EntryPoint:
+        def __init__(self, name, plugin):
+            self.name = name
+            self.plugin = plugin
+
+        def load(self):
+            return self.plugin
+
+    def broken(register):
+        raise RuntimeError("boom")
+
+    calls = []
+
+    def plugin(register):
+        calls.append(register)
+        register(65300, compile_counter)
+
+    monkeypatch.setattr(plugins, "_loaded_entry_points", set())
+    monkeypatch.setattr(
+        plugins,
+        "_entry_points",
+        lambda: [EntryPoint("counter", plugin), EntryPoint("broken", broken)],
+    )
+    assert plugins.load_entry_points() == ["counter"]
+    assert plugins.load_entry_points() == []
+    assert calls == [plugins.register_decoder]
+    assert "decoder plugin broken failed to load" in capsys.readouterr().err
+    assert get_describer()(PROPB_DATA, PROPB_ID)["Counter"] == 42
@@ -57,3 +57,69 @@ def test_render_highlight():
     description = {"PGN": "EEC1(61444)"}
     output = renderer.render(description, highlight=True)
     assert renderer.ansi_esc.get("highlight", "") in output
+
+
+def test_render_fragment_cache_matches_uncached_output():
+    renderer = HighPerformanceRenderer(color_system="truecolor")
+    description = {
+        "PGN": "DM1(65226)",
+        "SA": "Engine #1(  0)",
+        "Red Stop Lamp Status": "Off",
+        "Engine Speed": "2308.0 [rpm]",
+        "Bytes": "0041FF20",
+    }
+    first = renderer.render(description)
+    assert renderer.render(description) == first
+    assert "Off" in renderer._value_fragments
+    assert "2308.0 [rpm]" not in renderer._value_fragments
+
+    esc = renderer.ansi_esc
+    assert renderer.render({"Red Stop Lamp Status": "Off"}) == (
+        f'{{{esc["keys"]}"Red Stop Lamp Status"{esc["default"]}:'
+        f'{esc["strings"]}"Off"{esc["default"]}}}'
+    )
+
+
+def test_render_enum_value_is_cached_once():
+    renderer = HighPerformanceRenderer(color_system="truecolor")
+    description = {"Mode": "2 (Running)", "Pressure": "-50.0 [kPa]"}
+    first = renderer.render(description)
+    assert renderer.render(description) == first
+    assert renderer._value_fragments == {
+        "2 (Running)": renderer._format_other_value("2 (Running)", False)
+    }
+
+
+def test_render_fragment_cache_is_bounded(monkeypatch):
+    import pretty_j1939.render as render_module
+
+    monkeypatch.setattr(render_module, "FRAGMENT_CACHE_SIZE", 4)
+    renderer = HighPerformanceRenderer(color_system="truecolor")
+    for i in range(20):
+        renderer.render({f"Key {i}": f"Value {i}"})
+    assert len(renderer._key_fragments) <= 4
+    assert len(renderer._value_fragments) <= 4
+
+
+def test_render_bytes_styles_runs():
+    renderer = HighPerformanceRenderer(color_system="truecolor")
+    esc = renderer.ansi_esc
+    output = renderer._format_bytes_value("0000FF4142ff07", False)
+    assert output == (
+        f'"{esc["zero_bytes"]}0000{esc["disabled_bytes"]}FF{esc["ascii_bytes"]}4142'
+        f'{esc["disabled_bytes"]}ff{esc["normal_bytes"]}07{esc["default"]}"'
+    )
+
+
+def test_render_bytes_from_payload():
+    renderer = HighPerformanceRenderer(color_system="truecolor")
+    payload = bytes(range(256)) * 7
+    assert renderer._format_bytes_value(payload, False) == (
+        renderer._format_bytes_value("0x" + payload.hex().upper(), False)
+    )
+
+
+def test_render_bytes_invalid_hex_is_not_split():
+    renderer = HighPerformanceRenderer(color_system="truecolor")
+    output = renderer._format_bytes_value("00 FF", False)
+    assert "00 FF" in output
@@ -0,0 +1,82 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+import os
+
+from pretty_j1939.dbcache import LazyRecordTable
+from pretty_j1939.describe import get_describer
+from pretty_j1939.search import NameIndex
+
+BUNDLED_DB = os.path.join("pretty_j1939", "J1939db.json")
+
+NAMES = [
+    (1, "Engine Speed"),
+    (2, "Engine Speed At Idle, Point 1"),
+    (3, "Actual Engine - Percent Torque"),
+    (4, "Fuel Rate"),
+    (5, "Reengineered Value"),
+    (6, ""),
+]
+
+
+def scan(entries, query):
+    return sorted({k for k, name in entries if name and query.lower() in name.lower()})
+
+
+def test_index_matches_linear_scan():
+    index = NameIndex(NAMES)
+    for query in ["engine", "ENGINE SPEED", "speed at", "e", "en", "", "rate", "xyz"]:
+        assert index.search(query) == scan(NAMES, query), query
+
+
+def test_index_matches_linear_scan_on_bundled_database():
+    da = get_describer(da_json=BUNDLED_DB, db_cache=False).da_describer
+    for query in ["eec1", "Engine", "temperature", "dm", "#1", "zzzz"]:
+        expected = scan(((spn, o.name) for spn, o in da.spn_objects.items()), query)
+        assert da.resolve_spn(query) == expected, query
+        expected = scan(
+            [(pgn, o.label) for pgn, o in da.pgn_objects.items()]
+            + [(pgn, o.name) for pgn, o in da.pgn_objects.items()],
+            query,
+        )
+        assert set(expected) <= set(da.resolve_pgn(query)), query
+
+
+def test_ranked_search_puts_best_matches_first():
+    index = NameIndex(NAMES)
+    assert index.search("engine speed", ranked=True) == [1, 2]
+    # exact, prefix, word start, then any substring
+    assert index.search("engine", ranked=True) == [1, 2, 3, 5]
+    assert index.search("fuel rate", ranked=True) == [4]
+
+
+def test_prefix_search_only_matches_word_starts():
+    index = NameIndex(NAMES)
+    assert index.search("engine", prefix=True) == [1, 2, 3]
+    assert index.search("ngine", prefix=True) == []
+    assert index.search("percent", prefix=True) == [3]
+
+
+def test_record_with_several_names_matches_once():
+    index = NameIndex([(7, "EEC1"), (7, "Electronic Engine Controller 1")])
+    assert index.search("e") == [7]
+    assert index.search("eec1", ranked=True) == [7]
+
+
+def test_describer_resolves_names_through_index():
+    da = get_describer(da_json=BUNDLED_DB, db_cache=False).da_describer
+    assert da.resolve_pgn("eec1", ranked=True)[0] == 61444
+    assert da.resolve_pgn("dm1") == [65226]
+    assert 190 in da.resolve_spn("engine speed")
+    assert da.resolve_address("engine #1", ranked=True)[0] == 0
+    assert 255 in da.resolve_address("glob")
+
+
+def test_index_built_from_lazy_tables_keeps_records_unloaded(tmp_path):
+    da = get_describer(da_json=BUNDLED_DB, db_cache_dir=str(tmp_path)).da_describer
+    assert isinstance(da.spn_objects, LazyRecordTable)
+    loaded = len(da.spn_objects._records)
+
+    assert 190 in da.resolve_spn("engine speed")
+    assert len(da.spn_objects._records) == loaded
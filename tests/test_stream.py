@@ -0,0 +1,113 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+import pytest
+from pretty_j1939.stream import merge_by_timestamp, ReorderBuffer
+
+
+def _frames(*timestamps):
+    return [(ts, "can0", None, None, str(ts)) for ts in timestamps]
+
+
+def test_merge_by_timestamp():
+    merged = merge_by_timestamp(iter(_frames(1.0, 3.0, 5.0)), iter(_frames(2.0, 4.0)))
+    assert [f[0] for f in merged] == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+def test_reorder_buffer_frame_window():
+    buf = ReorderBuffer(window_frames=2)
+    out = list(buf.reorder(_frames(1.0, 3.0, 2.0, 4.0, 6.0, 5.0)))
+    assert [f[0] for f in out] == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    assert buf.reordered == 2
+    assert buf.late == 0
+    assert buf.max_depth == 3
+    assert len(buf) == 0
+
+
+def test_reorder_buffer_time_window():
+    buf = ReorderBuffer(window_ms=10)
+    out = list(buf.reorder(_frames(0.000, 0.005, 0.002, 0.020, 0.025, 0.001)))
+    # 0.001 arrives after 0.002 and 0.005 have been released: it is passed through as late
+    assert [f[0] for f in out] == [0.000, 0.002, 0.005, 0.001, 0.020, 0.025]
+    assert buf.reordered == 2
+    assert buf.late == 1
+
+
+def test_reorder_buffer_is_bounded():
+    buf = ReorderBuffer(window_frames=4)
+    for frame in _frames(*range(100)):
+        buf.push(frame)
+        assert len(buf) <= 4
+
+
+def test_reorder_buffer_requires_window():
+    with pytest.raises(ValueError):
+        ReorderBuffer()
+
+
+def test_bounded_queue_drop_oldest():
+    from pretty_j1939.stream import BoundedQueue
+
+    q = BoundedQueue(maxsize=2, drop_policy="drop-oldest")
+    for i in range(4):
+        q.put(i)
+    assert q.dropped == 2
+    assert q.max_depth == 2
+    assert [q.get(timeout=0), q.get(timeout=0)] == [2, 3]
+
+
+def test_bounded_queue_drop_newest():
+    from pretty_j1939.stream import BoundedQueue
+
+    q = BoundedQueue(maxsize=2, drop_policy="drop-newest")
+    for i in range(4):
+        q.put(i)
+    assert q.dropped == 2
+    assert [q.get(timeout=0), q.get(timeout=0)] == [0, 1]
+
+
+def test_bounded_queue_rejects_unknown_policy():
+    from pretty_j1939.stream import BoundedQueue
+
+    with pytest.raises(ValueError):
+        BoundedQueue(drop_policy="sometimes")
+
+
+def test_bus_receiver_virtual_bus():
+    import can
+    from pretty_j1939.stream import BusReceiver
+
+    with can.Bus(interface="virtual", channel="test_receiver") as rx_bus, can.Bus(
+        interface="virtual", channel="test_receiver"
+    ) as tx_bus:
+        receiver = BusReceiver(rx_bus, poll_interval=0.01).start()
+        try:
+            for i in range(3):
+                tx_bus.send(
+                    can.Message(arbitration_id=0x0CF00400 + i, data=b"\x00" * 8)
+                )
+            received = [receiver.recv(timeout=1.0) for _ in range(3)]
+        finally:
+            receiver.stop()
+
+    assert [m.arbitration_id for m in received] == [0x0CF00400, 0x0CF00401, 0x0CF00402]
+    assert receiver.received == 3
+    assert receiver.last_received_at is not None
+    assert list(receiver) == []
+
+
+def test_background_writer_latency():
+    import time
+    from pretty_j1939.stream import BackgroundWriter
+
+    out = []
+    writer = BackgroundWriter(lambda a, b: out.append((a, b)))
+    writer.put("one", None, received_at=time.monotonic())
+    writer.put("two", "file")
+    writer.close()
+
+    assert out == [("one", None), ("two", "file")]
+    assert writer.written == 2
+    assert writer.latency_count == 1
+    assert writer.latency_max >= 0.0
@@ -0,0 +1,97 @@
+#
+# Copyright (c) 2026 National Motor Freight Traffic Association Inc. All Rights Reserved.
+# See the file "LICENSE" for the full license governing this code.
+#
+from pretty_j1939.describe import SPNValue, get_describer
+from pretty_j1939.render import HighPerformanceRenderer
+
+EEC1_ID = 0x0CF00400
+EEC1_DATA = b"\x00\x41\xff\x20\x48\x14\x00\xf0"
+
+
+def test_typed_values_keep_numbers():
+    describer = get_describer(typed_values=True)
+    description = describer(EEC1_DATA, EEC1_ID)
+
+    speed = description["Engine Speed"]
+    assert isinstance(speed, SPNValue)
+    assert speed.value == 2308.0
+    assert speed.units == "rpm"
+    assert speed.raw == 0x4820
+    assert speed.indicator is None
+    assert str(speed) == "2308.0 [rpm]"
+    assert speed == "2308.0 [rpm]"
+
+
+def test_typed_values_render_like_strings():
+    typed = get_describer(typed_values=True)(EEC1_DATA, EEC1_ID)
+    untyped = get_describer()(EEC1_DATA, EEC1_ID)
+
+    assert typed == untyped
+    for color_system in (None, "truecolor"):
+        renderer = HighPerformanceRenderer(color_system=color_system)
+        assert renderer.render(typed) == renderer.render(untyped)
+
+
+def _bit_db():
+    return {
+        "J1939PGNdb": {
+            "65265": {
+                "Label": "TST",
+                "Name": "Test PGN",
+                "SPNs": [1, 2],
+                "SPNStartBits": [0, 8],
+            }
+        },
+        "J1939SPNdb": {
+            "1": {
+                "Name": "Switch",
+                "Units": "bit",
+                "SPNLength": 2,
+                "Resolution": 1,
+                "Offset": 0,
+                "OperationalLow": 0,
+                "OperationalHigh": 3,
+            },
+            "2": {
+                "Name": "Pressure",
+                "Units": "kPa",
+                "SPNLength": 8,
+                "Resolution": 4,
+                "Offset": 0,
+                "OperationalLow": 0,
+                "OperationalHigh": 1000,
+            },
+        },
+        "J1939BitDecodings": {"1": {"1": "On "}},
+        "J1939SATabledb": {},
+    }
+
+
+def test_typed_indicator_and_enum_values():
+    describer = get_describer(da_json=_bit_db(), typed_values=True, include_na=True)
+
+    description = describer(b"\x01\xff" + b"\xff" * 6, 0x18FEF100)
+    switch = description["Switch"]
+    assert (switch.value, switch.raw, switch.label) == (1, 1, "On")
+    assert str(switch) == "1 (On)"
+    pressure = description["Pressure"]
+    assert (pressure.value, pressure.raw, pressure.indicator) == (None, 0xFF, "N/A")
+    assert str(pressure) == "N/A"
+
+    description = describer(b"\x02\xfe" + b"\xff" * 6, 0x18FEF100)
+    assert description["Switch"].indicator == "Error"
+    assert description["Pressure"].indicator == "Error"
+
+
+def test_typed_values_to_dict():
+    value = SPNValue(12.5, "kPa", 25)
+    assert value.to_dict() == {
+        "value": 12.5,
+        "units": "kPa",
+        "raw": 25,
+        "indicator": None,
+        "label": None,
+    }
+    assert value == SPNValue(12.5, "kPa", 25)
+    assert value != SPNValue(12.5, "kPa", 26)